@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import zstandard
+
+
+class OpenAPIArchive:
+    """오픈API 원본 응답 아카이브
+
+    요청 파라미터로 키를 만들어 원본 응답 바이트를 zstd로 압축해 로컬 디스크에 저장한다.
+    재처리, 벤치마크, 테스트에서 네트워크 없이 동일한 페이지를 다시 읽을 수 있다.
+    """
+
+    # 인증키는 키 계산에서 제외 (키가 바뀌어도 같은 페이지로 취급)
+    excluded_params = ("serviceKey",)
+    suffix = ".json.zst"
+
+    def __init__(self, directory: str | Path, level: int = 10):
+        self.directory = Path(directory)
+        self.level = level
+
+    def make_key(self, params: dict[str, str]) -> str:
+        """요청 파라미터로 아카이브 키 생성
+
+        Args:
+            params: 오픈API 요청 파라미터
+
+        Returns:
+            파라미터 기반 sha256 키
+        """
+        payload = {
+            key: str(value)
+            for key, value in params.items()
+            if key not in self.excluded_params
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def path_for(self, params: dict[str, str]) -> Path:
+        """요청 파라미터에 해당하는 아카이브 파일 경로"""
+        key = self.make_key(params)
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def save(self, params: dict[str, str], raw: bytes) -> Path:
+        """원본 응답을 압축해 저장
+
+        Args:
+            params: 오픈API 요청 파라미터
+            raw: 원본 응답 바이트
+
+        Returns:
+            저장된 파일 경로
+        """
+        path = self.path_for(params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        compressed = zstandard.ZstdCompressor(level=self.level).compress(raw)
+
+        # 다른 워커가 읽는 도중 깨진 파일을 보지 않도록 임시 파일에 쓰고 교체
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(compressed)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, params: dict[str, str]) -> bytes | None:
+        """저장된 원본 응답 조회
+
+        Args:
+            params: 오픈API 요청 파라미터
+
+        Returns:
+            원본 응답 바이트 또는 None (아카이브에 없는 경우)
+        """
+        path = self.path_for(params)
+        if not path.exists():
+            return None
+        return zstandard.ZstdDecompressor().decompress(path.read_bytes())
+
+    def exists(self, params: dict[str, str]) -> bool:
+        """아카이브에 저장된 페이지인지 확인"""
+        return self.path_for(params).exists()
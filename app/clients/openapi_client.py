@@ -1,20 +1,36 @@
+import logging
+import time
+
 import httpx
+import zstandard
+from pydantic import ValidationError
 from starlette.status import HTTP_200_OK
 from fastapi import HTTPException
 
+from app.clients.openapi_archive import OpenAPIArchive
 from app.responses.openapi_response import OpenAPIResultDTO
 from app.core.settings import settings
+from app.core.metrics import OPENAPI_REQUEST_DURATION, OPENAPI_REQUEST_ERRORS
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
 
 
 class OpenAPIClient:
     endpoint = "https://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdScsbidInfo"
 
+    # LIVE: 네트워크만 사용, RECORD: 네트워크 응답을 아카이브에 저장, REPLAY: 아카이브만 사용
+    mode = settings.OPENAPI_CLIENT_MODE
+    archive = OpenAPIArchive(settings.OPENAPI_ARCHIVE_DIR)
+
     @classmethod
     async def get_data(
         cls, pageNo: str, numOfRows: str, opengBgnDt: str, opengEndDt: str
     ) -> OpenAPIResultDTO | None:
         """오픈API 낙찰 정보 조회
 
+        REPLAY 모드에서는 네트워크 없이 아카이브에 저장된 원본 응답을 사용한다.
+
         Args:
             serviceKey (str): 공공데이터포털에서 받은 인증키
             pageNo (str): 페이지번호
@@ -36,14 +52,70 @@ class OpenAPIClient:
             "opengBgnDt": opengBgnDt,
             "opengEndDt": opengEndDt,
         }
+
+        with span(
+            "OpenAPIClient.get_data",
+            kind="client",
+            page=pageNo,
+            rows=numOfRows,
+            mode=cls.mode,
+        ) as fetch_span:
+            result = await cls._fetch(params)
+            fetch_span.set_attribute("found", result is not None)
+        return result
+
+    @classmethod
+    async def _fetch(cls, params: dict[str, str]) -> OpenAPIResultDTO | None:
+        """아카이브 또는 네트워크에서 페이지 조회 (모드에 따라)"""
+        if cls.mode == "REPLAY":
+            # 깨진 아카이브 파일은 없는 페이지와 같이 취급
+            try:
+                raw = cls.archive.load(params)
+                if raw is None:
+                    return None
+                return OpenAPIResultDTO.model_validate_json(raw)
+            except (OSError, zstandard.ZstdError, ValidationError) as e:
+                logger.warning("오픈API 아카이브 읽기 실패: %s", e)
+                return None
+
+        started = time.perf_counter()
+        outcome = "error"
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.get(cls.endpoint, params=params)
+                with span(
+                    "GET apis.data.go.kr", kind="client", **{"http.url": cls.endpoint}
+                ) as http_span:
+                    response = await client.get(cls.endpoint, params=params)
+                    http_span.set_attribute("http.status_code", response.status_code)
+                    http_span.set_attribute("http.response_size", len(response.content))
 
                 if response.status_code == HTTP_200_OK:
-                    return OpenAPIResultDTO.model_validate(response.json())
+                    try:
+                        result = OpenAPIResultDTO.model_validate_json(response.content)
+                    except ValidationError:
+                        OPENAPI_REQUEST_ERRORS.labels("invalid_response").inc()
+                        raise
+
+                    # 검증을 통과한 원본 페이지만 아카이브에 저장
+                    # 저장 실패는 조회 결과에 영향을 주지 않음
+                    if cls.mode == "RECORD":
+                        try:
+                            cls.archive.save(params, response.content)
+                        except OSError as e:
+                            logger.warning("오픈API 아카이브 저장 실패: %s", e)
+
+                    outcome = "ok"
+                    return result
                 else:
                     # print(f"Error: Received status code {response.status_code}")
+                    OPENAPI_REQUEST_ERRORS.labels(f"http_{response.status_code}").inc()
                     return None
+        except httpx.HTTPError as e:
+            OPENAPI_REQUEST_ERRORS.labels(type(e).__name__).inc()
+            raise
         except HTTPException:
             return None
+        finally:
+            OPENAPI_REQUEST_DURATION.labels(outcome).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,79 @@
+from app.db.mongo_db import MongoCollection
+from app.core.metrics import instrument_collection
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+
+@instrument_collection
+class AdmissionLeaseCollection:
+    """무거운 API 실행 슬롯 임대 컬렉션
+
+    슬롯마다 문서 하나({풀 이름}:{번호})를 두고, 만료되지 않은 문서가 있으면 사용 중으로 본다.
+    워커가 반납하지 못하고 죽어도 expires_at이 지나면 다른 워커가 가져간다.
+    """
+
+    _collection = MongoCollection("admission_lease")
+
+    @classmethod
+    async def create_indexes(cls):
+        """인덱스 생성 (만료된 임대 기록 정리용 TTL index)"""
+        await cls._collection.create_index("expires_at", expireAfterSeconds=0)
+
+    @classmethod
+    async def try_acquire(
+        cls, pool: str, slots: int, holder: str, lease_seconds: float
+    ) -> str | None:
+        """비어 있거나 만료된 슬롯 하나 임대
+
+        Args:
+            pool: 풀 이름
+            slots: 풀의 전체 슬롯 개수
+            holder: 임대자 식별자
+            lease_seconds: 임대 기간 (초)
+
+        Returns:
+            임대한 슬롯 ID (빈 슬롯이 없으면 None)
+        """
+        now = datetime.now(timezone.utc)
+        for slot in range(slots):
+            lease_id = f"{pool}:{slot}"
+            try:
+                # 사용 중인 슬롯이면 조건이 맞지 않아 upsert가 같은 _id로 insert하다 실패
+                await cls._collection.update_one(
+                    {"_id": lease_id, "expires_at": {"$lt": now}},
+                    {
+                        "$set": {
+                            "holder": holder,
+                            "expires_at": now + timedelta(seconds=lease_seconds),
+                        }
+                    },
+                    upsert=True,
+                )
+                return lease_id
+            except DuplicateKeyError:
+                continue
+        return None
+
+    @classmethod
+    async def renew(cls, lease_id: str, holder: str, lease_seconds: float) -> bool:
+        """임대 기간 연장
+
+        Returns:
+            아직 임대 중이라 연장했으면 True
+        """
+        result = await cls._collection.update_one(
+            {"_id": lease_id, "holder": holder},
+            {
+                "$set": {
+                    "expires_at": datetime.now(timezone.utc)
+                    + timedelta(seconds=lease_seconds)
+                }
+            },
+        )
+        return result.matched_count == 1
+
+    @classmethod
+    async def release(cls, lease_id: str, holder: str):
+        """슬롯 반납"""
+        await cls._collection.delete_one({"_id": lease_id, "holder": holder})
@@ -1,17 +1,92 @@
-from app.db.mongo_db import db
+from app.db.mongo_db import MongoCollection, analytics_reads
+from app.core.metrics import instrument_collection
 from typing import Any
+import asyncio
 import dataclasses
+import hashlib
+import json
 
 from app.documents.bid_document import BidDocument
+from app.documents.bid_mutation import BidMutation, BidMutationResult
+from app.collections.bid_stats_collection import BidStatsCollection
 
 
+@instrument_collection
 class BidCollection:
-    _collection = db["bid"]
+    """입찰 문서 컬렉션
+
+    목록 / 개수 / 시계열 / 분포 조회는 분석용 읽기 설정(analytics_reads)으로 세컨더리에서 읽고,
+    단건 / 일괄 조회와 쓰기 전 확인, 통계 재계산은 방금 쓴 내용을 봐야 하므로 프라이머리에서 읽는다.
+    """
+
+    _collection = MongoCollection("bid")
+
+    # $in 조회 시 한 쿼리에 넣을 최대 키 개수
+    _in_chunk_size = 1000
+
+    # 전체 교체 적재 시 한 번의 insert_many로 보낼 최대 문서 개수 / 동시에 보낼 청크 개수
+    _load_chunk_size = 10000
+    _load_concurrency = 4
 
     @classmethod
-    async def create_indexes(cls):
-        """인덱스 생성 (공고번호 unique index)"""
-        await cls._collection.create_index("announcement_number", unique=False)
+    async def create_indexes(cls, collection=None):
+        """인덱스 생성 (공고번호 unique index)
+
+        Args:
+            collection: 대상 컬렉션 (없으면 bid 컬렉션, 전체 교체 시 스테이징 컬렉션)
+        """
+        from pymongo.errors import OperationFailure
+
+        collection = cls._collection if collection is None else collection
+        try:
+            await collection.create_index("announcement_number", unique=True)
+        except OperationFailure as e:
+            # 85: IndexOptionsConflict, 86: IndexKeySpecsConflict
+            if e.code not in (85, 86):
+                raise
+            await cls._replace_with_unique_index(collection)
+        # 입찰일 범위 조회 / 시계열 정렬용
+        await collection.create_index("bid_date")
+
+    @classmethod
+    async def _replace_with_unique_index(cls, collection):
+        """이전 버전의 non-unique 공고번호 인덱스를 unique 인덱스로 교체
+
+        중복 공고번호가 있으면 기존 인덱스를 지우지 않고 중단한다.
+        여러 프로세스가 동시에 교체해도 되도록 이미 지워진 인덱스는 무시한다.
+
+        Raises:
+            RuntimeError: 중복 공고번호가 있는 경우
+        """
+        from pymongo.errors import OperationFailure
+
+        duplicates = await collection.aggregate(
+            [
+                {"$group": {"_id": "$announcement_number", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+                {"$limit": 5},
+            ]
+        ).to_list(length=None)
+        if duplicates:
+            numbers = ", ".join(str(duplicate["_id"]) for duplicate in duplicates)
+            raise RuntimeError(
+                "공고번호가 중복된 문서가 있어 unique 인덱스로 바꿀 수 없습니다 "
+                f"(예: {numbers}). 중복 문서를 정리한 뒤 다시 실행하세요."
+            )
+
+        try:
+            await collection.drop_index("announcement_number_1")
+        except OperationFailure as e:
+            # 27: IndexNotFound (다른 프로세스가 먼저 지움)
+            if e.code != 27:
+                raise
+        try:
+            await collection.create_index("announcement_number", unique=True)
+        except OperationFailure as e:
+            # 확인한 뒤에 중복 문서가 들어온 경우 조회용 인덱스는 되돌려 둠
+            if e.code == 11000:
+                await collection.create_index("announcement_number")
+            raise
 
     @classmethod
     def _parse(cls, document: dict[str, Any]) -> BidDocument:
@@ -39,55 +114,87 @@ class BidCollection:
         )
 
     @classmethod
-    async def insert_bid(cls, bid_document: BidDocument) -> BidDocument | None:
-        """입찰 문서 삽입"""
-        result = await cls._collection.insert_one(dataclasses.asdict(bid_document))
-
-        return result.inserted_id if result else None
+    def _content_hash(cls, bid_document: BidDocument) -> str:
+        """_id를 제외한 입찰 문서 내용의 해시 (재업로드 시 변경 여부 판단용)"""
+        content = dataclasses.asdict(bid_document)
+        content.pop("_id", None)
+        serialized = json.dumps(
+            content, sort_keys=True, ensure_ascii=False, default=str
+        ).encode()
+        return hashlib.sha256(serialized).hexdigest()
 
     @classmethod
-    async def check_duplicate_by_announcement_number(
-        cls, announcement_number: str
-    ) -> bool:
-        """공고번호로 중복 체크
+    def _to_mongo(cls, bid_document: BidDocument) -> dict[str, Any]:
+        """저장용 dict 변환 (내용 해시 포함)"""
+        document = dataclasses.asdict(bid_document)
+        document["content_hash"] = cls._content_hash(bid_document)
+        return document
 
-        Args:
-            announcement_number: 공고번호
+    @classmethod
+    async def insert_bid(cls, bid_document: BidDocument) -> BidDocument | None:
+        """입찰 문서 삽입
 
-        Returns:
-            중복이면 True, 아니면 False
+        공고번호 중복은 unique index가 DuplicateKeyError로 알린다.
         """
-        count = await cls._collection.count_documents(
-            {"announcement_number": announcement_number}
-        )
-        return count > 0
+        result = await cls._collection.insert_one(cls._to_mongo(bid_document))
+        if result:
+            await BidStatsCollection.apply_changes(added=[bid_document])
+
+        return result.inserted_id if result else None
 
     @classmethod
     async def bulk_insert_bids(
         cls, bid_documents: list[BidDocument]
-    ) -> tuple[int, int, list[str]]:
+    ) -> tuple[int, int, list[str], int]:
         """입찰 문서 일괄 삽입/업데이트 (upsert)
 
+        저장된 내용 해시와 같은 행은 쓰지 않고, 새 행과 바뀐 행만 bulk_write로 보낸다.
+        통계 롤업 차감분은 bulk_write 직전에 조회한 기존 문서 기준이다.
+        같은 공고번호를 담은 업로드가 동시에 실행되면 롤업이 어긋날 수 있으므로
+        이 경우 /bid/stats/rebuild로 재계산한다.
+
         Args:
             bid_documents: 삽입/업데이트할 입찰 문서 리스트
 
         Returns:
-            (삽입된 개수, 업데이트된 개수, 업데이트된 공고번호 리스트)
+            (삽입된 개수, 업데이트된 개수, 업데이트된 공고번호 리스트, 변경 없는 개수)
         """
         if not bid_documents:
-            return 0, 0, []
+            return 0, 0, [], 0
 
         from pymongo import UpdateOne
 
-        # bulk_write를 위한 operations 생성
+        # 같은 공고번호가 여러 번 있으면 마지막 행 기준
+        unique_documents = list(
+            {bid_doc.announcement_number: bid_doc for bid_doc in bid_documents}.values()
+        )
+        announcement_numbers = [doc.announcement_number for doc in unique_documents]
+
+        # 기존 문서 일괄 조회 (내용 해시 비교, 통계 롤업 차감 및 업데이트 여부 판단용)
+        existing_raw = await cls._find_raw_in(
+            "announcement_number", announcement_numbers
+        )
+        existing_by_number = {doc["announcement_number"]: doc for doc in existing_raw}
+
+        # bulk_write를 위한 operations 생성 (새 행과 바뀐 행만)
         operations = []
-        announcement_numbers = []
+        changed_documents = []
+        removed_documents = []
+        updated_list = []
 
-        for bid_doc in bid_documents:
-            doc_dict = dataclasses.asdict(bid_doc)
+        for bid_doc in unique_documents:
+            doc_dict = cls._to_mongo(bid_doc)
             # _id 필드 제거 (upsert 시 MongoDB가 자동 생성하거나 기존 것 유지)
             doc_dict.pop("_id", None)
 
+            existing = existing_by_number.get(bid_doc.announcement_number)
+            if existing is not None:
+                if existing.get("content_hash") == doc_dict["content_hash"]:
+                    continue
+                removed_documents.append(cls._parse(existing))
+                updated_list.append(bid_doc.announcement_number)
+
+            changed_documents.append(bid_doc)
             operations.append(
                 UpdateOne(
                     {"announcement_number": bid_doc.announcement_number},
@@ -95,48 +202,274 @@ class BidCollection:
                     upsert=True,
                 )
             )
-            announcement_numbers.append(bid_doc.announcement_number)
+
+        unchanged_count = len(unique_documents) - len(operations)
 
         # bulk_write 실행
         if not operations:
-            return 0, 0, []
+            return 0, 0, [], unchanged_count
 
         result = await cls._collection.bulk_write(operations)
 
-        # upserted된 공고번호 수집
-        upserted_announcement_numbers = set()
-        if result.upserted_ids:
-            for upserted_id in result.upserted_ids.values():
-                doc = await cls._collection.find_one({"_id": upserted_id})
-                if doc:
-                    upserted_announcement_numbers.add(doc["announcement_number"])
-
-        # 업데이트된 공고번호 = 전체 - upserted된 것
-        # matched_count는 기존에 존재하던 문서 개수 (수정 여부와 무관)
-        updated_list = [
-            num
-            for num in announcement_numbers
-            if num not in upserted_announcement_numbers
-        ]
+        # 통계 롤업 증분 반영 (기존 값 차감 후 새 값 반영)
+        await BidStatsCollection.apply_changes(
+            added=changed_documents, removed=removed_documents
+        )
 
         inserted_count = result.upserted_count if result.upserted_count else 0
-        # matched_count - upserted_count = 실제로 업데이트 시도한 문서 개수
+        # matched_count는 내용이 바뀌어 다시 쓴 기존 문서 개수
         updated_count = result.matched_count if result.matched_count else 0
 
-        return inserted_count, updated_count, updated_list
+        return inserted_count, updated_count, updated_list, unchanged_count
+
+    @classmethod
+    async def replace_all_bids(cls, bid_documents: list[BidDocument]) -> int:
+        """전체 입찰 문서 교체 (스테이징 컬렉션 적재 후 원자적 rename)
+
+        스테이징 컬렉션에 insert_many로 적재하고, 적재가 끝난 뒤 인덱스를 만들고 건수를 확인한 다음
+        renameCollection(dropTarget)으로 bid 컬렉션을 바꾼다. 조회 중인 요청은 교체 전 또는 교체 후
+        데이터만 본다. 적재 중 들어온 다른 쓰기는 교체와 함께 사라지고, 통계 롤업은 호출자가 재계산한다.
+
+        Args:
+            bid_documents: 새 입찰 문서 리스트 (같은 공고번호는 마지막 행 기준)
+
+        Returns:
+            교체 후 입찰 문서 개수
+        """
+        from bson import ObjectId
+
+        unique_documents = list(
+            {bid_doc.announcement_number: bid_doc for bid_doc in bid_documents}.values()
+        )
+        staging = cls._collection.database[
+            f"{cls._collection.name}_staging_{ObjectId()}"
+        ]
+        semaphore = asyncio.Semaphore(cls._load_concurrency)
+
+        async def load(chunk: list[BidDocument]):
+            async with semaphore:
+                await staging.insert_many(
+                    [cls._to_mongo(bid_doc) for bid_doc in chunk], ordered=False
+                )
+
+        try:
+            await asyncio.gather(
+                *(
+                    load(unique_documents[i : i + cls._load_chunk_size])
+                    for i in range(0, len(unique_documents), cls._load_chunk_size)
+                )
+            )
+            # 적재 후 인덱스 생성 (적재 중 인덱스 유지 비용 제거)
+            await cls.create_indexes(staging)
+
+            loaded_count = await staging.count_documents({})
+            if loaded_count != len(unique_documents):
+                raise RuntimeError(
+                    f"스테이징 적재 건수가 맞지 않습니다 ({loaded_count}/{len(unique_documents)})"
+                )
+
+            await staging.rename(cls._collection.name, dropTarget=True)
+        except BaseException:
+            await staging.drop()
+            raise
+
+        return loaded_count
+
+    @classmethod
+    async def bulk_mutate_bids(
+        cls, mutations: list[BidMutation]
+    ) -> list[BidMutationResult]:
+        """생성/수정/삭제 작업을 하나의 unordered bulk_write로 처리
+
+        수정/삭제 대상과 생성 공고번호 중복은 배치당 한 번씩 $in으로 미리 조회한다.
+        같은 문서를 두 번 다루는 작업은 호출자가 다른 배치로 나눠야 한다.
+
+        Args:
+            mutations: 작업 리스트
+
+        Returns:
+            작업 순서와 같은 순서의 처리 결과 리스트
+        """
+        from bson import ObjectId
+        from pymongo import InsertOne, UpdateOne, DeleteOne
+        from pymongo.errors import BulkWriteError
+
+        not_found = "입찰 문서를 찾을 수 없습니다"
+        errors: dict[int, str] = {}
+
+        target_ids = [
+            m.bid_id
+            for m in mutations
+            if m.op != "create" and ObjectId.is_valid(m.bid_id)
+        ]
+        create_numbers = [
+            m.document.announcement_number for m in mutations if m.op == "create"
+        ]
+        existing_by_id, duplicated = await asyncio.gather(
+            cls.find_bids_by_ids(target_ids),
+            cls.find_bids_by_announcement_numbers(create_numbers),
+        )
+        before_images = {str(doc._id): doc for doc in existing_by_id}
+        taken_numbers = {doc.announcement_number for doc in duplicated}
+
+        operations = []
+        operation_indexes = []
+        for index, mutation in enumerate(mutations):
+            if mutation.op == "create":
+                number = mutation.document.announcement_number
+                if number in taken_numbers:
+                    errors[index] = f"이미 존재하는 공고번호입니다: {number}"
+                    continue
+                taken_numbers.add(number)
+                operations.append(InsertOne(cls._to_mongo(mutation.document)))
+            elif mutation.bid_id not in before_images:
+                errors[index] = not_found
+                continue
+            elif mutation.op == "update":
+                if not mutation.fields:
+                    continue
+                # 부분 수정은 해시를 지워 다음 업로드 때 다시 쓰이도록 함
+                operations.append(
+                    UpdateOne(
+                        {"_id": ObjectId(mutation.bid_id)},
+                        {"$set": mutation.fields, "$unset": {"content_hash": ""}},
+                    )
+                )
+            else:
+                operations.append(DeleteOne({"_id": ObjectId(mutation.bid_id)}))
+            operation_indexes.append(index)
+
+        if operations:
+            try:
+                await cls._collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    errors[operation_indexes[write_error["index"]]] = write_error[
+                        "errmsg"
+                    ]
+
+        # 성공한 작업만 통계 롤업에 반영
+        added, removed = [], []
+        results = []
+        for index, mutation in enumerate(mutations):
+            if index in errors:
+                results.append(
+                    BidMutationResult(bid_id=mutation.bid_id, error=errors[index])
+                )
+                continue
+
+            if mutation.op == "create":
+                added.append(mutation.document)
+                results.append(BidMutationResult(bid_id=str(mutation.document._id)))
+                continue
+
+            before = before_images[mutation.bid_id]
+            removed.append(before)
+            if mutation.op == "update":
+                added.append(dataclasses.replace(before, **(mutation.fields or {})))
+            results.append(BidMutationResult(bid_id=mutation.bid_id))
+
+        await BidStatsCollection.apply_changes(added=added, removed=removed)
+        return results
+
+    @classmethod
+    async def _find_raw_in(cls, field: str, values: list[Any]) -> list[dict[str, Any]]:
+        """$in 조건 일괄 조회 (청크 단위 쿼리를 동시에 실행)
+
+        Args:
+            field: 조회 필드명
+            values: 조회할 값 리스트
+
+        Returns:
+            존재하는 원본 문서 리스트
+        """
+        if not values:
+            return []
+
+        chunks = [
+            values[i : i + cls._in_chunk_size]
+            for i in range(0, len(values), cls._in_chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                cls._collection.find({field: {"$in": chunk}}).to_list(length=None)
+                for chunk in chunks
+            )
+        )
+        return [doc for documents in results for doc in documents]
+
+    @classmethod
+    async def _find_in(cls, field: str, values: list[Any]) -> list[BidDocument]:
+        """$in 조건 일괄 조회 후 입찰 문서로 변환"""
+        return [cls._parse(doc) for doc in await cls._find_raw_in(field, values)]
+
+    @classmethod
+    async def find_bids_by_announcement_numbers(
+        cls, announcement_numbers: list[str]
+    ) -> list[BidDocument]:
+        """공고번호 목록으로 입찰 문서 일괄 조회
+
+        Args:
+            announcement_numbers: 공고번호 리스트
+
+        Returns:
+            존재하는 입찰 문서 리스트
+        """
+        return await cls._find_in("announcement_number", announcement_numbers)
 
     @classmethod
-    async def find_all_bids(cls, skip: int = 0, limit: int = 50) -> list[BidDocument]:
+    async def find_bids_by_ids(cls, bid_ids: list[str]) -> list[BidDocument]:
+        """ID 목록으로 입찰 문서 일괄 조회
+
+        Args:
+            bid_ids: 입찰 문서 ID 리스트 (ObjectId 형식이 아닌 값은 무시)
+
+        Returns:
+            존재하는 입찰 문서 리스트
+        """
+        from bson import ObjectId
+
+        object_ids = [
+            ObjectId(bid_id) for bid_id in bid_ids if ObjectId.is_valid(bid_id)
+        ]
+        return await cls._find_in("_id", object_ids)
+
+    @classmethod
+    async def iter_all_bids(cls, batch_size: int = 1000):
+        """모든 입찰 문서를 배치 단위로 순회 (통계 재계산용)
+
+        Args:
+            batch_size: 배치 크기
+
+        Yields:
+            입찰 문서 리스트
+        """
+        batch = []
+        async for document in cls._collection.find().batch_size(batch_size):
+            batch.append(cls._parse(document))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @classmethod
+    async def find_all_bids(
+        cls, skip: int = 0, limit: int = 50, query: dict[str, Any] | None = None
+    ) -> list[BidDocument]:
         """모든 입찰 문서 조회 (페이지네이션)
 
         Args:
             skip: 건너뛸 문서 개수
             limit: 조회할 문서 개수
+            query: 조회 조건
 
         Returns:
             입찰 문서 리스트
         """
-        cursor = cls._collection.find().skip(skip).limit(limit)
+        cursor = (
+            analytics_reads(cls._collection).find(query or {}).skip(skip).limit(limit)
+        )
         documents = await cursor.to_list(length=limit)
         return [cls._parse(doc) for doc in documents]
 
@@ -176,30 +509,41 @@ class BidCollection:
         return cls._parse(document) if document else None
 
     @classmethod
-    async def update_bid(cls, bid_id: str, bid_document: BidDocument) -> bool:
-        """입찰 문서 업데이트
+    async def update_bid(cls, bid_id: str, fields: dict[str, Any]) -> bool:
+        """입찰 문서 부분 업데이트 (전달된 필드만 $set)
+
+        공고번호를 다른 문서와 겹치게 바꾸면 DuplicateKeyError가 발생한다.
 
         Args:
             bid_id: 입찰 문서 ID
-            bid_document: 업데이트할 입찰 문서
+            fields: 업데이트할 필드
 
         Returns:
-            성공 여부
+            대상 문서가 있으면 True, 없으면 False
         """
         from bson import ObjectId
+        from pymongo import ReturnDocument
 
-        try:
-            # _id 제외한 필드만 업데이트
-            update_data = dataclasses.asdict(bid_document)
-            update_data.pop("_id", None)
+        if not ObjectId.is_valid(bid_id):
+            return False
 
-            result = await cls._collection.update_one(
-                {"_id": ObjectId(bid_id)}, {"$set": update_data}
-            )
-            return result.modified_count > 0
-        except Exception:
+        # 수정 전 문서를 받아 통계 롤업에서 차감
+        before = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(bid_id)},
+            # 부분 수정은 해시를 지워 다음 업로드 때 다시 쓰이도록 함
+            {"$set": fields, "$unset": {"content_hash": ""}},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if not before:
             return False
 
+        before_document = cls._parse(before)
+        await BidStatsCollection.apply_changes(
+            added=[dataclasses.replace(before_document, **fields)],
+            removed=[before_document],
+        )
+        return True
+
     @classmethod
     async def delete_bid(cls, bid_id: str) -> bool:
         """입찰 문서 삭제
@@ -208,21 +552,133 @@ class BidCollection:
             bid_id: 입찰 문서 ID
 
         Returns:
-            성공 여부
+            삭제된 문서가 있으면 True, 없으면 False
         """
         from bson import ObjectId
 
-        try:
-            result = await cls._collection.delete_one({"_id": ObjectId(bid_id)})
-            return result.deleted_count > 0
-        except Exception:
+        if not ObjectId.is_valid(bid_id):
             return False
 
+        deleted = await cls._collection.find_one_and_delete({"_id": ObjectId(bid_id)})
+        if not deleted:
+            return False
+
+        await BidStatsCollection.apply_changes(removed=[cls._parse(deleted)])
+        return True
+
     @classmethod
-    async def count_all_bids(cls) -> int:
+    async def count_all_bids(cls, query: dict[str, Any] | None = None) -> int:
         """전체 입찰 문서 개수 조회
 
+        Args:
+            query: 조회 조건
+
         Returns:
             전체 입찰 문서 개수
         """
-        return await cls._collection.count_documents({})
+        return await analytics_reads(cls._collection).count_documents(query or {})
+
+    @classmethod
+    async def find_series(
+        cls, field: str, query: dict[str, Any] | None = None
+    ) -> tuple[list, list]:
+        """입찰일 순 시계열 조회 (필요한 필드만 프로젝션)
+
+        Args:
+            field: 값 필드명
+            query: 조회 조건
+
+        Returns:
+            (입찰일 리스트, 값 리스트)
+        """
+        cursor = (
+            analytics_reads(cls._collection)
+            .find(query or {}, {"_id": 0, "bid_date": 1, field: 1})
+            .sort("bid_date", 1)
+            .batch_size(10000)
+        )
+
+        dates, values = [], []
+        async for document in cursor:
+            dates.append(document["bid_date"])
+            values.append(document[field])
+        return dates, values
+
+    @classmethod
+    async def find_value_range(
+        cls, field: str, query: dict[str, Any] | None = None
+    ) -> tuple[float, float] | None:
+        """필드 값의 최소/최대 조회
+
+        Args:
+            field: 숫자 필드명
+            query: 조회 조건
+
+        Returns:
+            (최소값, 최대값) 또는 None (데이터 없음)
+        """
+        pipeline = [
+            {"$match": query or {}},
+            {
+                "$group": {
+                    "_id": None,
+                    "min": {"$min": f"${field}"},
+                    "max": {"$max": f"${field}"},
+                }
+            },
+        ]
+        documents = (
+            await analytics_reads(cls._collection).aggregate(pipeline).to_list(length=1)
+        )
+        if not documents or documents[0]["min"] is None:
+            return None
+        return documents[0]["min"], documents[0]["max"]
+
+    @classmethod
+    async def aggregate_histogram(
+        cls,
+        field: str,
+        lower: float,
+        upper: float,
+        bin_width: float,
+        bin_count: int,
+        query: dict[str, Any] | None = None,
+    ) -> list[int]:
+        """필드 값 분포를 DB에서 구간별 건수로 집계
+
+        Args:
+            field: 숫자 필드명
+            lower: 범위 하한 (포함)
+            upper: 범위 상한 (포함, 마지막 구간에 합산)
+            bin_width: 구간 폭
+            bin_count: 구간 개수
+            query: 조회 조건
+
+        Returns:
+            구간별 건수 리스트
+        """
+        query = {**(query or {}), field: {"$gte": lower, "$lte": upper}}
+
+        # 부동소수점 나눗셈 오차로 경계값이 아래 구간으로 떨어지지 않도록 보정
+        bin_index = {
+            "$floor": {
+                "$add": [
+                    {"$divide": [{"$subtract": [f"${field}", lower]}, bin_width]},
+                    1e-9,
+                ]
+            }
+        }
+        pipeline = [
+            {"$match": query},
+            {
+                "$group": {
+                    "_id": {"$min": [bin_index, bin_count - 1]},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+
+        counts = [0] * bin_count
+        async for document in analytics_reads(cls._collection).aggregate(pipeline):
+            counts[int(document["_id"])] = document["count"]
+        return counts
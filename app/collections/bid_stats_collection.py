@@ -0,0 +1,131 @@
+from app.db.mongo_db import MongoCollection, analytics_reads
+from app.core.metrics import instrument_collection
+from typing import Any
+from collections import defaultdict
+
+from pymongo import ASCENDING, UpdateOne
+
+from app.documents.bid_document import BidDocument, RATIO_FIELDS
+from app.documents.bid_stats_document import BidStatsDocument
+from app.utils.stats_utils import StatsUtils
+
+# 롤업 세그먼트 키 필드
+SEGMENT_FIELDS = ("region", "industry", "ordering_agency", "month")
+
+
+@instrument_collection
+class BidStatsCollection:
+    """입찰 통계 롤업 컬렉션
+
+    (지역, 업종, 발주기관, 입찰월) 세그먼트마다 건수, 비율 합계, 비율 히스토그램을 보관한다.
+    입찰 문서가 쓰일 때마다 증분($inc)으로 갱신되므로 통계 조회는 bid 컬렉션을 스캔하지 않는다.
+    """
+
+    _collection = MongoCollection("bid_stats")
+
+    @classmethod
+    async def create_indexes(cls):
+        """인덱스 생성 (세그먼트 unique index)"""
+        await cls._collection.create_index(
+            [(field, ASCENDING) for field in SEGMENT_FIELDS], unique=True
+        )
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> BidStatsDocument:
+        return BidStatsDocument(
+            _id=document["_id"],
+            region=document["region"],
+            industry=document["industry"],
+            ordering_agency=document["ordering_agency"],
+            month=document["month"],
+            count=document.get("count", 0),
+            sums=document.get("sums", {}),
+            histograms=document.get("histograms", {}),
+        )
+
+    @classmethod
+    def _segment_of(cls, bid_document: BidDocument) -> tuple[str, str, str, str]:
+        """입찰 문서가 속한 세그먼트 키"""
+        return (
+            bid_document.region,
+            bid_document.industry,
+            bid_document.ordering_agency,
+            bid_document.bid_date.strftime("%Y-%m"),
+        )
+
+    @classmethod
+    async def apply_changes(
+        cls,
+        added: list[BidDocument] | None = None,
+        removed: list[BidDocument] | None = None,
+    ) -> int:
+        """입찰 문서 변경분을 롤업에 증분 반영
+
+        Args:
+            added: 새로 반영할 입찰 문서 (삽입 또는 수정 후 문서)
+            removed: 제거할 입찰 문서 (삭제 또는 수정 전 문서)
+
+        Returns:
+            갱신된 세그먼트 개수
+        """
+        increments: dict[tuple, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+        for sign, documents in ((1, added or []), (-1, removed or [])):
+            for bid_doc in documents:
+                inc = increments[cls._segment_of(bid_doc)]
+                inc["count"] += sign
+                for field in RATIO_FIELDS:
+                    value = getattr(bid_doc, field)
+                    # 숫자가 아닌 값은 합계/히스토그램에서 제외
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        continue
+                    inc[f"sums.{field}"] += sign * value
+                    inc[f"histograms.{field}.{StatsUtils.to_bucket(value)}"] += sign
+
+        operations = []
+        for segment, inc in increments.items():
+            # 수정 전후가 같은 세그먼트/버킷이면 상쇄되므로 0인 증분은 제외
+            inc = {
+                key: (int(value) if key == "count" or "histograms." in key else value)
+                for key, value in inc.items()
+                if value != 0
+            }
+            if not inc:
+                continue
+            operations.append(
+                UpdateOne(
+                    dict(zip(SEGMENT_FIELDS, segment)), {"$inc": inc}, upsert=True
+                )
+            )
+
+        if not operations:
+            return 0
+
+        await cls._collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    @classmethod
+    async def find_stats(
+        cls, filters: dict[str, Any] | None = None
+    ) -> list[BidStatsDocument]:
+        """조건에 맞는 세그먼트 롤업 조회
+
+        Args:
+            filters: 세그먼트 필드 조건
+
+        Returns:
+            롤업 문서 리스트
+        """
+        query = {"count": {"$gt": 0}, **(filters or {})}
+        documents = (
+            await analytics_reads(cls._collection).find(query).to_list(length=None)
+        )
+        return [cls._parse(doc) for doc in documents]
+
+    @classmethod
+    async def delete_all(cls) -> int:
+        """모든 롤업 문서 삭제 (재계산용)"""
+        result = await cls._collection.delete_many({})
+        return result.deleted_count
@@ -0,0 +1,139 @@
+from app.db.mongo_db import MongoCollection
+from app.core.metrics import instrument_collection
+from typing import Any
+from datetime import datetime, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.settings import settings
+from app.documents.bid_upload_document import BidUploadDocument
+
+
+@instrument_collection
+class BidUploadCollection:
+    """업로드 파일 처리 기록 컬렉션
+
+    파일 digest마다 처리 상태와 결과를 보관해 같은 파일의 중복 처리를 막는다.
+    처리 중 기록은 처리 권한을 얻은 owner만 갱신 / 완료 / 실패 처리할 수 있다.
+    """
+
+    _collection = MongoCollection("bid_upload")
+
+    @classmethod
+    async def create_indexes(cls):
+        """인덱스 생성 (digest unique index, 기록 만료 TTL index)"""
+        await cls._collection.create_index("digest", unique=True)
+        await cls._collection.create_index(
+            "created_at", expireAfterSeconds=settings.UPLOAD_DIGEST_TTL_SECONDS
+        )
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> BidUploadDocument:
+        return BidUploadDocument(
+            _id=document["_id"],
+            digest=document["digest"],
+            status=document["status"],
+            result=document.get("result"),
+            error=document.get("error"),
+            owner=document.get("owner"),
+            created_at=document["created_at"],
+            updated_at=document["updated_at"],
+        )
+
+    @classmethod
+    async def claim(
+        cls, digest: str, stale_before: datetime, owner: str, take_done: bool = False
+    ) -> bool:
+        """파일 처리 권한 획득
+
+        기록이 없으면 새로 만들고, 실패했거나 stale_before 이전부터 처리 중인 기록은 인수한다.
+
+        Args:
+            digest: 파일 digest
+            stale_before: 이 시각 이전에 갱신된 처리 중 기록은 중단된 것으로 간주
+            owner: 처리자 식별자
+            take_done: 처리가 끝난 기록도 인수 (저장된 결과를 재사용하지 않고 다시 처리)
+
+        Returns:
+            처리 권한을 얻었으면 True
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            await cls._collection.insert_one(
+                {
+                    "digest": digest,
+                    "status": "processing",
+                    "owner": owner,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            return True
+        except DuplicateKeyError:
+            pass
+
+        claimable = [
+            {"status": "failed"},
+            {"status": "processing", "updated_at": {"$lt": stale_before}},
+        ]
+        if take_done:
+            claimable.append({"status": "done"})
+        taken = await cls._collection.find_one_and_update(
+            {"digest": digest, "$or": claimable},
+            {
+                "$set": {
+                    "status": "processing",
+                    "owner": owner,
+                    "updated_at": now,
+                    "error": None,
+                }
+            },
+        )
+        return taken is not None
+
+    @classmethod
+    async def touch(cls, digest: str, owner: str) -> bool:
+        """처리 중 기록의 갱신 시각 연장 (처리하는 동안 주기적으로 호출)
+
+        Returns:
+            아직 처리 권한이 있어 연장했으면 True
+        """
+        result = await cls._collection.update_one(
+            {"digest": digest, "status": "processing", "owner": owner},
+            {"$set": {"updated_at": datetime.now(timezone.utc)}},
+        )
+        return result.matched_count == 1
+
+    @classmethod
+    async def find_by_digest(cls, digest: str) -> BidUploadDocument | None:
+        """digest로 처리 기록 조회"""
+        document = await cls._collection.find_one({"digest": digest})
+        return cls._parse(document) if document else None
+
+    @classmethod
+    async def mark_done(cls, digest: str, owner: str, result: dict[str, Any]):
+        """처리 완료 기록 (처리 권한을 다른 처리자가 가져갔으면 기록하지 않음)"""
+        await cls._collection.update_one(
+            {"digest": digest, "status": "processing", "owner": owner},
+            {
+                "$set": {
+                    "status": "done",
+                    "result": result,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+
+    @classmethod
+    async def mark_failed(cls, digest: str, owner: str, error: str):
+        """처리 실패 기록 (같은 파일을 다시 올리면 재처리, 처리 권한이 없으면 기록하지 않음)"""
+        await cls._collection.update_one(
+            {"digest": digest, "status": "processing", "owner": owner},
+            {
+                "$set": {
+                    "status": "failed",
+                    "error": error,
+                    "updated_at": datetime.now(timezone.utc),
+                }
+            },
+        )
@@ -0,0 +1,56 @@
+from app.db.mongo_db import MongoCollection
+from typing import Any
+import dataclasses
+
+from bson import ObjectId
+
+from app.core.settings import settings
+from app.documents.profile_document import ProfileDocument
+
+
+class ProfileCollection:
+    """요청 프로파일 컬렉션 (워커와 관계없이 내려받을 수 있도록 MongoDB에 보관)"""
+
+    _collection = MongoCollection("profile")
+
+    @classmethod
+    async def create_indexes(cls):
+        """인덱스 생성 (보관 기간 TTL index)"""
+        await cls._collection.create_index(
+            "created_at", expireAfterSeconds=settings.PROFILE_TTL_SECONDS
+        )
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> ProfileDocument:
+        return ProfileDocument(
+            _id=document["_id"],
+            mode=document["mode"],
+            method=document["method"],
+            path=document["path"],
+            status=document["status"],
+            duration_ms=document["duration_ms"],
+            size=document["size"],
+            data=document.get("data"),
+            created_at=document["created_at"],
+        )
+
+    @classmethod
+    async def insert_profile(cls, profile_document: ProfileDocument):
+        """프로파일 저장"""
+        await cls._collection.insert_one(dataclasses.asdict(profile_document))
+
+    @classmethod
+    async def find_recent(cls, limit: int) -> list[ProfileDocument]:
+        """최근 프로파일 목록 (내용 제외, 최신순)"""
+        cursor = (
+            cls._collection.find({}, {"data": 0}).sort("created_at", -1).limit(limit)
+        )
+        return [cls._parse(document) async for document in cursor]
+
+    @classmethod
+    async def find_profile_by_id(cls, profile_id: str) -> ProfileDocument | None:
+        """ID로 프로파일 조회 (내용 포함)"""
+        if not ObjectId.is_valid(profile_id):
+            return None
+        document = await cls._collection.find_one({"_id": ObjectId(profile_id)})
+        return cls._parse(document) if document else None
@@ -0,0 +1,71 @@
+from app.db.mongo_db import MongoCollection
+from typing import Any
+import dataclasses
+
+from pymongo.errors import CollectionInvalid
+
+from app.core.settings import settings
+from app.documents.slow_query_document import SlowQueryDocument
+
+
+class SlowQueryCollection:
+    """느린 MongoDB 명령 기록 컬렉션 (capped, 오래된 기록부터 자동 삭제)
+
+    이 컬렉션의 명령은 다시 느린 명령으로 기록되지 않도록 instrument_collection을 붙이지 않는다.
+    """
+
+    _collection = MongoCollection("slow_query")
+
+    @classmethod
+    async def create_collection(cls):
+        """capped 컬렉션 생성 (이미 있으면 그대로 사용)"""
+        try:
+            await cls._collection.database.create_collection(
+                cls._collection.name,
+                capped=True,
+                size=settings.SLOW_QUERY_LOG_MAX_BYTES,
+            )
+        except CollectionInvalid:
+            pass
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> SlowQueryDocument:
+        return SlowQueryDocument(
+            _id=document["_id"],
+            operation=document["operation"],
+            command_name=document["command_name"],
+            collection=document["collection"],
+            duration_ms=document["duration_ms"],
+            shape=document["shape"],
+            returned=document.get("returned"),
+            docs_examined=document.get("docs_examined"),
+            keys_examined=document.get("keys_examined"),
+            examined_ratio=document.get("examined_ratio"),
+            plan=document.get("plan"),
+            created_at=document["created_at"],
+        )
+
+    @classmethod
+    async def insert_many(cls, documents: list[SlowQueryDocument]):
+        """느린 명령 기록 저장"""
+        if documents:
+            await cls._collection.insert_many(
+                [dataclasses.asdict(document) for document in documents], ordered=False
+            )
+
+    @classmethod
+    async def find_recent(
+        cls, limit: int, operation: str | None = None
+    ) -> list[SlowQueryDocument]:
+        """최근 기록 조회 (최신순)
+
+        Args:
+            limit: 최대 개수
+            operation: 컬렉션 메서드 (없으면 전체)
+
+        Returns:
+            느린 명령 기록 리스트
+        """
+        query = {"operation": operation} if operation else {}
+        cursor = cls._collection.find(query).sort("$natural", -1).limit(limit)
+        return [cls._parse(document) async for document in cursor]
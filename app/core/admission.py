@@ -0,0 +1,213 @@
+"""무거운 API 실행 제한 (워커별 / 전체 워커 합계)"""
+
+import asyncio
+import logging
+import math
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from app.collections.admission_lease_collection import AdmissionLeaseCollection
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 전체 슬롯이 빌 때까지 다시 확인하는 간격 (초)
+ADMISSION_POLL_INTERVAL_SECONDS = 0.2
+
+
+class AdmissionLimiter:
+    """무거운 API 실행 제한
+
+    워커 안에서는 세마포어로, 워커 사이에서는 MongoDB 슬롯 임대로 동시 실행 개수를 제한한다.
+    빈 자리가 없으면 최대 max_wait_seconds 동안 기다리고, 그래도 없으면 503,
+    대기열이 max_queue만큼 차 있으면 기다리지 않고 바로 429를 돌려준다 (둘 다 Retry-After 포함).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        local_limit: int,
+        global_limit: int,
+        max_wait_seconds: float,
+        max_queue: int,
+    ):
+        """
+        Args:
+            name: 풀 이름 (전체 슬롯 임대 키)
+            local_limit: 워커별 동시 실행 개수
+            global_limit: 전체 워커 동시 실행 개수 (0이면 제한 없음)
+            max_wait_seconds: 자리가 날 때까지 기다리는 최대 시간 (초)
+            max_queue: 워커별 최대 대기 요청 개수
+        """
+        self.name = name
+        self.local_limit = local_limit
+        self.global_limit = global_limit
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue = max_queue
+        self._waiting = 0
+        self._running = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def running(self) -> int:
+        """이 워커에서 실행 중인 작업 개수"""
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        """이 워커에서 자리를 기다리는 요청 개수"""
+        return self._waiting
+
+    @property
+    def busy(self) -> bool:
+        """이 워커의 자리가 모두 찼는지 (다음 요청은 기다려야 함)"""
+        return self._running >= self.local_limit
+
+    @property
+    def saturated(self) -> bool:
+        """자리가 모두 차고 기다리는 요청도 있는지 (readiness 판단용)"""
+        return self._running >= self.local_limit and self._waiting > 0
+
+    @property
+    def retry_after(self) -> str:
+        """Retry-After 헤더 값 (초)"""
+        return str(max(1, math.ceil(self.max_wait_seconds)))
+
+    def _reject(self, status_code: int, detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": self.retry_after},
+        )
+
+    def _local_semaphore(self) -> asyncio.Semaphore:
+        """이벤트 루프별 세마포어 (세마포어는 처음 기다린 루프에 묶이므로 루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.local_limit)
+        return self._semaphore
+
+    async def _acquire_lease(self, holder: str, deadline: float) -> str:
+        """전체 슬롯 임대 (deadline까지 빈 슬롯이 없으면 503)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            lease_id = await AdmissionLeaseCollection.try_acquire(
+                self.name,
+                self.global_limit,
+                holder,
+                settings.ADMISSION_LEASE_SECONDS,
+            )
+            if lease_id is not None:
+                return lease_id
+            if loop.time() + ADMISSION_POLL_INTERVAL_SECONDS > deadline:
+                raise self._reject(
+                    503, "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요"
+                )
+            await asyncio.sleep(ADMISSION_POLL_INTERVAL_SECONDS)
+
+    async def _keep_lease(self, lease_id: str, holder: str):
+        """작업이 끝날 때까지 임대 기간 연장 (일시적인 오류는 다음 주기에 다시 연장)"""
+        while True:
+            await asyncio.sleep(settings.ADMISSION_LEASE_SECONDS / 3)
+            try:
+                await AdmissionLeaseCollection.renew(
+                    lease_id, holder, settings.ADMISSION_LEASE_SECONDS
+                )
+            except Exception as e:
+                logger.warning("실행 슬롯 임대 연장 실패 (%s): %s", lease_id, e)
+
+    async def _release_lease(self, keeper: asyncio.Task, lease_id: str, holder: str):
+        """임대 연장 중단 후 슬롯 반납
+
+        반납에 실패해도 예외를 올리지 않는다 (임대 기간이 지나면 다른 워커가 가져감).
+        """
+        keeper.cancel()
+        try:
+            await keeper
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning("실행 슬롯 임대 연장 작업 오류 (%s): %s", lease_id, e)
+        try:
+            await AdmissionLeaseCollection.release(lease_id, holder)
+        except Exception as e:
+            logger.warning("실행 슬롯 반납 실패 (%s): %s", lease_id, e)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """실행 자리 확보 후 작업 실행
+
+        Raises:
+            HTTPException: 대기열이 가득 차면 429, 기다려도 자리가 나지 않으면 503
+        """
+        if self._waiting >= self.max_queue:
+            raise self._reject(
+                429, "대기 중인 요청이 너무 많습니다. 잠시 후 다시 시도해 주세요"
+            )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_seconds
+        semaphore = self._local_semaphore()
+
+        self._waiting += 1
+        try:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.max_wait_seconds)
+            except TimeoutError:
+                raise self._reject(
+                    503, "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요"
+                )
+
+            lease_id = None
+            holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+            try:
+                if self.global_limit > 0:
+                    lease_id = await self._acquire_lease(holder, deadline)
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        keeper = (
+            asyncio.create_task(self._keep_lease(lease_id, holder))
+            if lease_id
+            else None
+        )
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            try:
+                if keeper:
+                    await self._release_lease(keeper, lease_id, holder)
+            finally:
+                # 전체 슬롯 반납 중 오류나 취소가 있어도 워커 자리는 반드시 반납
+                semaphore.release()
+
+
+# 파일 업로드 (파일 전체와 DataFrame을 메모리에 올림)
+upload_admission = AdmissionLimiter(
+    "upload",
+    local_limit=settings.UPLOAD_CONCURRENCY_PER_WORKER,
+    global_limit=settings.UPLOAD_CONCURRENCY_GLOBAL,
+    max_wait_seconds=settings.ADMISSION_MAX_WAIT_SECONDS,
+    max_queue=settings.ADMISSION_MAX_QUEUE,
+)
+
+# 통계 / 분포 / 시계열 집계
+aggregation_admission = AdmissionLimiter(
+    "aggregation",
+    local_limit=settings.AGGREGATION_CONCURRENCY_PER_WORKER,
+    global_limit=settings.AGGREGATION_CONCURRENCY_GLOBAL,
+    max_wait_seconds=settings.ADMISSION_MAX_WAIT_SECONDS,
+    max_queue=settings.ADMISSION_MAX_QUEUE,
+)
@@ -0,0 +1,219 @@
+"""응답 압축 ASGI 미들웨어 (Accept-Encoding 협상, zstd / br / gzip)
+
+한 번에 보내는 응답은 COMPRESSION_MIN_SIZE보다 작으면 그대로 보내고,
+스트리밍 응답(NDJSON 등)은 본문을 모으지 않고 받은 조각마다 압축해 flush한다.
+"""
+
+import zlib
+
+import brotli
+import zstandard
+
+from app.core.settings import settings
+
+# 압축할 Content-Type (접두사)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/openmetrics-text",
+    "image/svg+xml",
+)
+
+
+class GzipEncoder:
+    """gzip 스트림 압축 (finish 전까지는 조각마다 sync flush)"""
+
+    def __init__(self):
+        # wbits 31: gzip 헤더 포함
+        self._compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+        )
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        body = self._compressor.compress(data)
+        return body + self._compressor.flush(
+            zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+        )
+
+
+class BrotliEncoder:
+    """brotli 스트림 압축"""
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        body = self._compressor.process(data)
+        return body + (
+            self._compressor.finish() if finish else self._compressor.flush()
+        )
+
+
+class ZstdEncoder:
+    """zstd 스트림 압축 (finish 전까지는 조각마다 블록 flush)"""
+
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(
+            level=settings.COMPRESSION_ZSTD_LEVEL
+        ).compressobj()
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        body = self._compressor.compress(data)
+        return body + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+            if finish
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+ENCODERS = {"zstd": ZstdEncoder, "br": BrotliEncoder, "gzip": GzipEncoder}
+
+
+def negotiate_encoding(
+    accept_encoding: str, encodings: list[str] | None = None
+) -> str | None:
+    """Accept-Encoding에서 사용할 압축 방식 선택
+
+    q 값이 가장 큰 방식을 고르고, 같으면 encodings 순서를 따른다.
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+        encodings: 고를 수 있는 방식 (우선순위 순, 없으면 COMPRESSION_ENCODINGS)
+
+    Returns:
+        encodings 중 하나 또는 None (압축하지 않음)
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            qualities[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    if encodings is None:
+        encodings = [
+            encoding.strip()
+            for encoding in settings.COMPRESSION_ENCODINGS.split(",")
+            if encoding.strip() in ENCODERS
+        ]
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """응답 압축 ASGI 미들웨어
+
+    이미 Content-Encoding이 있는 응답, 부분 응답(Content-Range), 압축할 필요 없는 타입은 그대로 보낸다.
+    압축한 응답은 Content-Length를 지우고 ETag를 약한 ETag로 바꾼다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+
+        start_message = None
+        encoder = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, encoder
+
+            if message["type"] == "http.response.start":
+                headers = {
+                    key.lower(): value for key, value in message.get("headers", [])
+                }
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                if not content_type.startswith(COMPRESSIBLE_TYPES) or (
+                    b"content-encoding" in headers or b"content-range" in headers
+                ):
+                    await send(message)
+                    return
+                # 첫 본문을 보고 압축 여부를 정함
+                message["headers"] = _vary(message.get("headers", []))
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or (
+                start_message is None and encoder is None
+            ):
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                if encoding is None or (
+                    not more_body and len(body) < settings.COMPRESSION_MIN_SIZE
+                ):
+                    # 이후 본문도 그대로 전달 (start_message, encoder 모두 None)
+                    await send(start)
+                    await send(message)
+                    return
+                encoder = ENCODERS[encoding]()
+                start["headers"] = _compressed_headers(start["headers"], encoding)
+                await send(start)
+
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": encoder.compress(body, finish=not more_body),
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _vary(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    """Vary에 Accept-Encoding 추가 (압축 여부가 요청 헤더에 따라 달라짐)"""
+    headers = list(headers)
+    for index, (key, value) in enumerate(headers):
+        if key.lower() == b"vary":
+            if b"accept-encoding" not in value.lower():
+                headers[index] = (key, value + b", Accept-Encoding")
+            return headers
+    return [*headers, (b"vary", b"Accept-Encoding")]
+
+
+def _compressed_headers(
+    headers: list[tuple[bytes, bytes]], encoding: str
+) -> list[tuple[bytes, bytes]]:
+    """압축 응답 헤더 (Content-Length 제거, Content-Encoding 추가, ETag는 약한 ETag로)"""
+    compressed = []
+    for key, value in headers:
+        name = key.lower()
+        if name == b"content-length":
+            continue
+        if name == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value
+        compressed.append((key, value))
+    compressed.append((b"content-encoding", encoding.encode()))
+    return compressed
@@ -0,0 +1,114 @@
+"""워커 readiness 판단 (MongoDB ping 지연, 커넥션 풀 사용률, 이벤트 루프 지연, 무거운 작업)
+
+무거운 작업은 대기 요청이 있으면 준비되지 않음으로 보고, HEALTH_BUSY_POOLS에 있는 풀(기본 upload)은
+워커별 자리가 모두 차기만 해도 준비되지 않음으로 본다.
+
+MongoDB ping은 요청마다 보내지 않고 HealthMonitor.run이 주기적으로 보내 결과를 저장해 둔다.
+readiness 요청은 저장된 값과 워커 안의 카운터만 읽으므로 빠르고 DB에 부하를 주지 않는다.
+"""
+
+import asyncio
+import time
+
+from app.core.admission import aggregation_admission, upload_admission
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import MongoPoolMetrics
+from app.core.settings import settings
+from app.db.mongo_db import MongoDB
+from app.responses.health_response import (
+    HealthJobData,
+    HealthMongoData,
+    HealthReadinessData,
+)
+
+
+class HealthMonitor:
+    """MongoDB ping 결과 저장 및 readiness 판단"""
+
+    # 마지막 ping 지연 (밀리초) / 오류 / 시각 (time.monotonic)
+    _ping_ms: float | None = None
+    _ping_error: str | None = None
+    _ping_at: float | None = None
+
+    @classmethod
+    async def ping(cls):
+        """MongoDB ping 후 결과 저장"""
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                MongoDB.get_database().command("ping"),
+                settings.HEALTH_MAX_PING_MS / 1000 * 2,
+            )
+        except Exception as e:
+            cls._ping_ms = None
+            cls._ping_error = f"{type(e).__name__}: {e}"
+        else:
+            cls._ping_ms = (time.perf_counter() - started) * 1000
+            cls._ping_error = None
+        cls._ping_at = time.monotonic()
+
+    @classmethod
+    async def run(cls):
+        """주기적 MongoDB ping 루프 (lifespan에서 실행)"""
+        while True:
+            await cls.ping()
+            await asyncio.sleep(settings.HEALTH_PING_INTERVAL_SECONDS)
+
+    @classmethod
+    def readiness(cls) -> HealthReadinessData:
+        """저장된 ping 결과와 워커 상태로 readiness 판단
+
+        Returns:
+            준비 여부, 준비되지 않은 이유, 항목별 값
+        """
+        reasons = []
+
+        ping_age = None if cls._ping_at is None else time.monotonic() - cls._ping_at
+        if ping_age is None:
+            reasons.append("MongoDB ping 결과 없음")
+        elif cls._ping_error:
+            reasons.append(f"MongoDB ping 실패 ({cls._ping_error})")
+        elif ping_age > settings.HEALTH_PING_INTERVAL_SECONDS * 3:
+            reasons.append("MongoDB ping 결과가 오래됨")
+        elif cls._ping_ms > settings.HEALTH_MAX_PING_MS:
+            reasons.append(f"MongoDB ping 지연 {cls._ping_ms:.0f}ms")
+
+        checked_out = MongoPoolMetrics.max_checked_out()
+        pool_utilization = checked_out / settings.MONGO_MAX_POOL_SIZE
+        if pool_utilization >= settings.HEALTH_MAX_POOL_UTILIZATION:
+            reasons.append(f"커넥션 풀 사용률 {pool_utilization:.0%}")
+
+        loop_lag_ms = loop_monitor.last_lag_seconds * 1000
+        if loop_lag_ms > settings.HEALTH_MAX_LOOP_LAG_MS:
+            reasons.append(f"이벤트 루프 지연 {loop_lag_ms:.0f}ms")
+
+        busy_pools = {pool.strip() for pool in settings.HEALTH_BUSY_POOLS.split(",")}
+        jobs = {}
+        for limiter in (upload_admission, aggregation_admission):
+            jobs[limiter.name] = HealthJobData(
+                running=limiter.running,
+                waiting=limiter.waiting,
+                limit=limiter.local_limit,
+            )
+            if limiter.saturated:
+                reasons.append(f"{limiter.name} 작업 대기 중 ({limiter.waiting}건)")
+            elif limiter.busy and limiter.name in busy_pools:
+                # 다음 요청은 기다리거나 503을 받으므로 다른 워커로 보내도록 함
+                reasons.append(
+                    f"{limiter.name} 작업 자리 없음 ({limiter.running}/{limiter.local_limit})"
+                )
+
+        return HealthReadinessData(
+            ready=not reasons,
+            reasons=reasons,
+            mongo=HealthMongoData(
+                ping_ms=cls._ping_ms,
+                ping_age_seconds=ping_age,
+                error=cls._ping_error,
+                pool_checked_out=checked_out,
+                pool_size=settings.MONGO_MAX_POOL_SIZE,
+                pool_utilization=pool_utilization,
+            ),
+            loop_lag_ms=loop_lag_ms,
+            jobs=jobs,
+        )
@@ -0,0 +1,109 @@
+"""이벤트 루프 지연 감시
+
+지연 측정: 일정 간격으로 sleep하고 예약한 시각보다 늦게 깨어난 시간을 지표로 기록한다.
+멈춤 감지 (MODE=DEV): 감시 스레드가 루프에 콜백을 보내고 LOOP_BLOCK_THRESHOLD_MS 안에 실행되지 않으면
+그 순간 루프 스레드가 실행 중인 코드의 스택을 로그로 남긴다.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import suppress
+
+from app.core.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정 및 멈춤 감지"""
+
+    def __init__(self, interval_seconds: float, block_threshold_seconds: float | None):
+        """
+        Args:
+            interval_seconds: 지연 측정 간격 (초)
+            block_threshold_seconds: 멈춤으로 볼 시간 (초, None이면 멈춤 감지 안 함)
+        """
+        self.interval_seconds = interval_seconds
+        self.block_threshold_seconds = block_threshold_seconds
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        # 마지막으로 측정한 지연 (초, readiness 판단용)
+        self.last_lag_seconds = 0.0
+
+    async def _measure(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.last_lag_seconds = max(0.0, loop.time() - expected)
+            EVENT_LOOP_LAG.observe(self.last_lag_seconds)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int):
+        """감시 스레드: 루프가 콜백을 제때 실행하지 못하면 루프 스레드의 스택 기록"""
+        threshold = self.block_threshold_seconds
+        while not self._stopped.wait(threshold):
+            answered = threading.Event()
+            started = time.monotonic()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                # 루프가 닫힘
+                return
+            if answered.wait(threshold):
+                continue
+
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            EVENT_LOOP_BLOCKS.inc()
+
+            # 멈춤이 끝날 때까지 기다려 전체 멈춘 시간도 기록
+            while not answered.wait(threshold):
+                if self._stopped.is_set():
+                    return
+            logger.warning(
+                "이벤트 루프가 %.0fms 동안 멈춤 (%.0fms 시점 스택):\n%s",
+                (time.monotonic() - started) * 1000,
+                threshold * 1000,
+                stack,
+            )
+
+    def start(self):
+        """현재 이벤트 루프 감시 시작 (lifespan에서 호출)"""
+        loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._measure())
+        if self.block_threshold_seconds is not None:
+            self._stopped.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self):
+        """감시 종료"""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+
+# 멈춤 감지는 개발 모드에서만 (스택 수집 비용과 로그 양 때문)
+loop_monitor = LoopMonitor(
+    interval_seconds=settings.LOOP_LAG_INTERVAL_SECONDS,
+    block_threshold_seconds=(
+        settings.LOOP_BLOCK_THRESHOLD_MS / 1000 if settings.MODE == "DEV" else None
+    ),
+)
@@ -0,0 +1,287 @@
+"""Prometheus 지표 (HTTP 요청, MongoDB 명령/커넥션 풀, 오픈API)
+
+gunicorn 워커 여러 개의 지표를 합치려면 PROMETHEUS_MULTIPROC_DIR 환경 변수로
+워커들이 함께 쓰는 디렉터리를 지정한다 (gunicorn.conf.py 참고).
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from pymongo import monitoring
+
+from app.core.tracing import route_template, span
+
+# MongoDB 명령 / 커넥션 대기 / 이벤트 루프 지연 시간 구간 (초)
+MONGO_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+# 응답 크기 구간 (바이트)
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(10))
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 개수",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP 응답 본문 크기",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB 명령 실행 시간",
+    ["command", "operation"],
+    buckets=MONGO_BUCKETS,
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongo_command_failures_total",
+    "실패한 MongoDB 명령 개수",
+    ["command", "operation"],
+)
+MONGO_POOL_CHECKOUT_WAIT = Histogram(
+    "mongo_pool_checkout_wait_seconds",
+    "MongoDB 커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+    buckets=MONGO_BUCKETS,
+)
+MONGO_POOL_CHECKOUT_FAILURES = Counter(
+    "mongo_pool_checkout_failures_total",
+    "MongoDB 커넥션을 얻지 못한 횟수",
+    ["reason"],
+)
+OPENAPI_REQUEST_DURATION = Histogram(
+    "openapi_request_duration_seconds",
+    "오픈API 요청 시간",
+    ["outcome"],
+)
+OPENAPI_REQUEST_ERRORS = Counter(
+    "openapi_request_errors_total",
+    "실패한 오픈API 요청 개수",
+    ["reason"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 스케줄링 지연 (예약한 시각보다 늦게 실행된 시간)",
+    buckets=MONGO_BUCKETS,
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "이벤트 루프가 LOOP_BLOCK_THRESHOLD_MS 이상 멈춘 횟수",
+)
+
+# 지금 실행 중인 컬렉션 메서드 (MongoDB 명령 지표의 operation 라벨)
+mongo_operation: ContextVar[str] = ContextVar("mongo_operation", default="-")
+
+
+def instrument_collection(cls):
+    """컬렉션 클래스의 공개 비동기 메서드를 '클래스.메서드' 이름으로 계측
+
+    메서드 실행 중 MongoDB 명령에 지표 라벨을 붙이고, 메서드 실행을 span으로 기록한다.
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not isinstance(attr, classmethod):
+            continue
+        func = attr.__func__
+        label = f"{cls.__name__}.{name}"
+        if inspect.iscoroutinefunction(func):
+            setattr(cls, name, classmethod(_label_coroutine(func, label)))
+        elif inspect.isasyncgenfunction(func):
+            setattr(cls, name, classmethod(_label_async_generator(func, label)))
+    return cls
+
+
+def _label_coroutine(func, label: str):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = mongo_operation.set(label)
+        try:
+            with span(label):
+                return await func(*args, **kwargs)
+        finally:
+            mongo_operation.reset(token)
+
+    return wrapper
+
+
+def _label_async_generator(func, label: str):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        generator = func(*args, **kwargs)
+        while True:
+            # 한 단계씩 라벨을 바꿔 호출한 쪽 컨텍스트에 라벨이 남지 않도록 함
+            token = mongo_operation.set(label)
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                mongo_operation.reset(token)
+            yield item
+
+    return wrapper
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """MongoDB 명령 실행 시간 수집 (motor는 호출한 쪽 컨텍스트에서 명령을 실행)"""
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        MONGO_COMMAND_DURATION.labels(
+            event.command_name, mongo_operation.get()
+        ).observe(event.duration_micros / 1_000_000)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        operation = mongo_operation.get()
+        MONGO_COMMAND_DURATION.labels(event.command_name, operation).observe(
+            event.duration_micros / 1_000_000
+        )
+        MONGO_COMMAND_FAILURES.labels(event.command_name, operation).inc()
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """MongoDB 커넥션 풀 대기 시간 수집 및 서버별 사용 중인 커넥션 개수 집계"""
+
+    # 서버 주소별 사용 중인 커넥션 개수 (이 워커 기준, readiness 판단용)
+    checked_out: dict[tuple, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def max_checked_out(cls) -> int:
+        """가장 많이 쓰는 서버 풀의 사용 중인 커넥션 개수 (풀 크기는 서버별)"""
+        with cls._lock:
+            return max([0, *cls.checked_out.values()])
+
+    def _add(self, address: tuple, count: int):
+        with self._lock:
+            self.checked_out[address] = self.checked_out.get(address, 0) + count
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent):
+        MONGO_POOL_CHECKOUT_WAIT.observe(event.duration)
+        self._add(event.address, 1)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent):
+        self._add(event.address, -1)
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ):
+        MONGO_POOL_CHECKOUT_WAIT.observe(event.duration)
+        MONGO_POOL_CHECKOUT_FAILURES.labels(event.reason).inc()
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent):
+        with self._lock:
+            self.checked_out[event.address] = 0
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent):
+        with self._lock:
+            self.checked_out.pop(event.address, None)
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+
+class MetricsMiddleware:
+    """HTTP 요청 지표 수집 ASGI 미들웨어
+
+    route 라벨은 실제 경로가 아니라 라우트 템플릿(/bid/id/{bid_id})이고,
+    어느 라우트에도 맞지 않는 요청은 unmatched로 묶는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        status = "500"
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            HTTP_REQUEST_DURATION.labels(method, route, status).observe(
+                time.perf_counter() - started
+            )
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(size)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식 지표 (멀티프로세스 모드면 모든 워커 합산)
+
+    Returns:
+        (본문, Content-Type)
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,184 @@
+"""요청 단위 프로파일링 미들웨어
+
+관리자 토큰과 함께 X-Profile 헤더를 보내거나 PROFILE_SAMPLE_RATE 비율로 뽑힌 요청만 프로파일링한다.
+둘 다 아니면 헤더 확인 외에 하는 일이 없다.
+"""
+
+import cProfile
+import logging
+import marshal
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Awaitable, Callable
+
+from bson import ObjectId
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 프로파일 방식 (sample: 스택 샘플링 collapsed stack, cprofile: pstats)
+PROFILE_MODES = ("sample", "cprofile")
+
+# 샘플링에서 제외하는 대기 중 스레드의 마지막 프레임 (함수 이름, 파일 이름 끝)
+IDLE_FRAMES = {("_worker", "thread.py"), ("wait", "threading.py")}
+
+
+class StackSampler:
+    """스택 샘플러 (별도 스레드에서 일정 간격으로 모든 스레드의 스택을 수집)
+
+    결과는 flamegraph.pl / speedscope에서 바로 읽을 수 있는 collapsed stack 형식이다.
+    이벤트 루프 스레드를 통째로 샘플링하므로 같은 워커에서 동시에 처리된 다른 요청도 섞일 수 있다.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _frame_name(self, frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                code = frame.f_code
+                if any(
+                    code.co_name == name and code.co_filename.endswith(filename)
+                    for name, filename in IDLE_FRAMES
+                ):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._frame_name(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> bytes:
+        """샘플링 종료
+
+        Returns:
+            collapsed stack ("스레드;함수;...;함수 샘플수" 줄 목록)
+        """
+        self._stop.set()
+        self._thread.join()
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._stacks.most_common()
+        ).encode()
+
+
+class CProfiler:
+    """cProfile 프로파일러 (이벤트 루프 스레드의 모든 함수 호출 기록, 결과는 pstats 파일 형식)"""
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self) -> bytes:
+        self._profile.disable()
+        self._profile.create_stats()
+        return marshal.dumps(self._profile.stats)
+
+
+class ProfilingMiddleware:
+    """요청 단위 프로파일링 ASGI 미들웨어
+
+    프로파일링한 응답에는 X-Profile-Id 헤더가 붙고, 결과는 /admin/profiles/{id}에서 내려받는다.
+    한 워커에서 동시에 하나의 요청만 프로파일링한다.
+    """
+
+    def __init__(
+        self,
+        app,
+        save: Callable[..., Awaitable[None]],
+    ):
+        """
+        Args:
+            app: ASGI 앱
+            save: 프로파일 저장 함수 (ProfileService.save_profile)
+        """
+        self.app = app
+        self.save = save
+        self._busy = False
+
+    def _requested_mode(self, scope) -> str | None:
+        """프로파일 방식 (프로파일링하지 않으면 None)"""
+        headers = dict(scope["headers"])
+        mode = headers.get(b"x-profile")
+        if mode is not None and settings.ADMIN_TOKEN:
+            token = headers.get(b"x-admin-token", b"")
+            if secrets.compare_digest(token, settings.ADMIN_TOKEN.encode()):
+                mode = mode.decode()
+                return mode if mode in PROFILE_MODES else PROFILE_MODES[0]
+        if (
+            settings.PROFILE_SAMPLE_RATE
+            and random.random() < settings.PROFILE_SAMPLE_RATE
+        ):
+            return PROFILE_MODES[0]
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+
+        mode = self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = ObjectId()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-profile-id", str(profile_id).encode()),
+                ]
+            await send(message)
+
+        profiler = (
+            CProfiler()
+            if mode == "cprofile"
+            else StackSampler(settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        )
+        self._busy = True
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            data = profiler.stop()
+            self._busy = False
+            # 저장 실패가 요청 결과에 영향을 주지 않도록 기록만 남김
+            try:
+                await self.save(
+                    profile_id=profile_id,
+                    mode=mode,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status=status,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    data=data,
+                )
+            except Exception as e:
+                logger.warning("프로파일 저장 실패 (%s): %s", profile_id, e)
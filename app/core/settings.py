@@ -1,5 +1,7 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 
 
 class Settings(BaseSettings):
@@ -7,6 +9,103 @@ class Settings(BaseSettings):
     MODE: str
     OPENAPI_API_KEY: str
 
+    # MongoDB 커넥션 풀 최대 / 최소 크기 (워커별)
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 10
+    # 풀에 빈 커넥션이 없을 때 기다리는 시간 / 서버 선택 / 연결 / 소켓 응답 타임아웃 (밀리초)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int | None = 5000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_TIMEOUT_MS: int = 5000
+    MONGO_SOCKET_TIMEOUT_MS: int | None = 120000
+    # 전송 압축 (쉼표로 구분한 우선순위, zstd/zlib/snappy, snappy는 python-snappy 필요, 비우면 압축 안 함)
+    MONGO_COMPRESSORS: str = "zstd,zlib"
+    # 워커 시작 시 인덱스 생성 여부 (배포 시 python -m app.db.indexes로 한 번 만들면 끄기)
+    MONGO_CREATE_INDEXES_ON_STARTUP: bool = True
+    # 분석 / 목록 조회 읽기 대상, read concern, 세컨더리 최대 지연 시간 (초, 90 이상, 비우면 제한 없음)
+    MONGO_ANALYTICS_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "secondaryPreferred"
+    MONGO_ANALYTICS_READ_CONCERN: Literal["local", "available", "majority"] = "majority"
+    MONGO_ANALYTICS_MAX_STALENESS_SECONDS: int | None = Field(default=None, ge=90)
+
+    # 오픈API 클라이언트 모드 (LIVE, RECORD, REPLAY)
+    OPENAPI_CLIENT_MODE: Literal["LIVE", "RECORD", "REPLAY"] = "LIVE"
+    # 오픈API 원본 응답 아카이브 경로
+    OPENAPI_ARCHIVE_DIR: str = "archive/openapi"
+
+    # xlsx 읽기 엔진 (xls, xlsb, ods는 항상 calamine)
+    XLSX_ENGINE: Literal["calamine", "openpyxl"] = "calamine"
+
+    # 여러 파일 업로드 시 파싱 워커 프로세스 개수 (없으면 CPU 개수)
+    UPLOAD_PARSE_WORKERS: int | None = None
+    # ZIP 업로드 시 압축 해제 후 최대 크기 (바이트)
+    UPLOAD_ARCHIVE_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # 분할 업로드 스테이징 경로 / 세션 만료 시간 (초) / 최대 크기 (바이트)
+    UPLOAD_STAGING_DIR: str = "staging/uploads"
+    UPLOAD_SESSION_TTL_SECONDS: int = 86400
+    UPLOAD_SESSION_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # 같은 파일 재업로드 시 저장된 결과를 돌려주는 기간 (초)
+    UPLOAD_DIGEST_TTL_SECONDS: int = 86400
+    # 이 시간 동안 갱신이 없는 처리 중 업로드는 중단된 것으로 보고 다시 처리 (초)
+    UPLOAD_PROCESSING_TIMEOUT_SECONDS: int = 600
+
+    # 무거운 API 동시 실행 개수 (워커별 / 전체 워커 합계, 전체가 0이면 워커별 제한만 적용)
+    UPLOAD_CONCURRENCY_PER_WORKER: int = 1
+    UPLOAD_CONCURRENCY_GLOBAL: int = 2
+    AGGREGATION_CONCURRENCY_PER_WORKER: int = 4
+    AGGREGATION_CONCURRENCY_GLOBAL: int = 16
+    # 실행 자리가 날 때까지 기다리는 최대 시간 (초) / 워커별 최대 대기 요청 개수
+    ADMISSION_MAX_WAIT_SECONDS: float = 10
+    ADMISSION_MAX_QUEUE: int = 8
+    # 전체 실행 슬롯 임대 기간 (초, 워커가 반납하지 못하고 죽으면 이 시간 뒤 회수)
+    ADMISSION_LEASE_SECONDS: int = 60
+
+    # 느린 MongoDB 명령 기준 (밀리초, 비우면 기록하지 않음) / explain 실행 비율 (0~1)
+    SLOW_QUERY_THRESHOLD_MS: float | None = 100
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    # 느린 명령 기록 capped 컬렉션 크기 (바이트)
+    SLOW_QUERY_LOG_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # 자동 프로파일링 요청 비율 (0~1, 0이면 X-Profile 헤더 요청만) / 스택 샘플링 간격 (밀리초)
+    PROFILE_SAMPLE_RATE: float = 0
+    PROFILE_SAMPLE_INTERVAL_MS: float = 5
+    # 프로파일 보관 기간 (초)
+    PROFILE_TTL_SECONDS: int = 7 * 86400
+
+    # 추적 span 내보내기 (none: trace id 전파만, json: JSON Lines 파일, otlp: OTLP/HTTP 수집기)
+    TRACE_EXPORTER: Literal["none", "json", "otlp"] = "none"
+    # 추적할 요청 비율 (0~1, traceparent 헤더가 있으면 그 sampled 플래그를 따름)
+    TRACE_SAMPLE_RATE: float = 1.0
+    TRACE_JSON_PATH: str = "traces/spans.jsonl"
+    TRACE_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACE_SERVICE_NAME: str = "gyeongin-backend"
+
+    # 이벤트 루프 지연 측정 간격 (초) / 멈춤 감지 기준 (밀리초, MODE=DEV에서만 스택 로그)
+    LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    LOOP_BLOCK_THRESHOLD_MS: float = 100
+
+    # 응답 압축 방식 (쉼표로 구분한 우선순위, zstd/br/gzip, 비우면 압축 안 함) / 압축할 최소 응답 크기 (바이트)
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+    COMPRESSION_MIN_SIZE: int = 1024
+    # 압축 수준 (높을수록 CPU를 더 쓰고 더 작게, gzip 1~9 / brotli 0~11 / zstd 1~22)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # readiness용 MongoDB ping 간격 (초) / 준비되지 않음으로 볼 ping 지연 (밀리초)
+    HEALTH_PING_INTERVAL_SECONDS: float = 5
+    HEALTH_MAX_PING_MS: float = 500
+    # 준비되지 않음으로 볼 커넥션 풀 사용률 (0~1) / 이벤트 루프 지연 (밀리초)
+    HEALTH_MAX_POOL_UTILIZATION: float = 0.9
+    HEALTH_MAX_LOOP_LAG_MS: float = 500
+    # 워커별 자리가 모두 차면 기다리는 요청이 없어도 준비되지 않음으로 볼 작업 풀 (쉼표 구분, upload / aggregation)
+    HEALTH_BUSY_POOLS: str = "upload"
+
+    # 관리자 API 토큰 (X-Admin-Token 헤더, 비우면 관리자 API 비활성화)
+    ADMIN_TOKEN: str | None = None
+
     model_config = ConfigDict(env_file=".env", extra="ignore")
 
 
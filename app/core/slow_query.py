@@ -0,0 +1,159 @@
+"""느린 MongoDB 명령 감지
+
+명령 리스너는 드라이버 스레드에서 동기로 호출되므로 여기서는 느린 명령을 대기열에 넣기만 하고,
+explain 실행과 저장은 SlowQueryService가 이벤트 루프에서 처리한다.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from pymongo import monitoring
+
+from app.core.metrics import mongo_operation
+from app.core.settings import settings
+
+# 기록 대상 명령 (explain은 읽기 명령만 실행)
+RECORDED_COMMANDS = {
+    "find",
+    "aggregate",
+    "count",
+    "distinct",
+    "insert",
+    "update",
+    "delete",
+    "findAndModify",
+}
+EXPLAINABLE_COMMANDS = {"find", "aggregate", "count", "distinct"}
+
+# 명령 본문 중 조회 형태에 필요한 필드 / 값을 그대로 남기는 필드 (큰 skip 확인용)
+SHAPE_FIELDS = ("filter", "query", "q", "sort", "projection", "pipeline")
+VALUE_FIELDS = ("skip", "limit")
+
+# explain 재실행 시 제거할 드라이버 필드
+DRIVER_FIELDS = {
+    "$db",
+    "lsid",
+    "$clusterTime",
+    "$readPreference",
+    "txnNumber",
+    "autocommit",
+    "startTransaction",
+    "readConcern",
+    "writeConcern",
+}
+
+# 저장 전 최대 대기 개수 (넘으면 오래된 것부터 버림)
+MAX_PENDING = 1000
+
+
+def query_shape(value: Any) -> Any:
+    """값을 타입 이름으로 바꾼 조회 형태 (같은 형태의 조회를 묶기 위함)
+
+    Args:
+        value: 필터, 정렬, 파이프라인 등
+
+    Returns:
+        키와 연산자는 유지하고 값만 타입 이름으로 바꾼 구조 ($in 등 리스트는 첫 원소 형태만 유지)
+    """
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [query_shape(value[0])] if value else []
+    return type(value).__name__
+
+
+@dataclass
+class SlowCommand:
+    """대기열에 넣은 느린 명령"""
+
+    operation: str  # 명령을 실행한 컬렉션 메서드 (BidCollection.find_all_bids)
+    command_name: str
+    database: str
+    collection: str
+    duration_ms: float
+    returned: int | None
+    command: dict[
+        str, Any
+    ]  # 드라이버 필드를 뺀 읽기 명령 (explain 재실행용, 쓰기 명령은 비움)
+    shape: dict[str, Any]
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """SLOW_QUERY_THRESHOLD_MS를 넘은 컬렉션 메서드 명령을 대기열에 추가"""
+
+    pending: deque[SlowCommand] = deque(maxlen=MAX_PENDING)
+
+    def __init__(self):
+        self._started: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, event) -> tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        # 컬렉션 메서드 밖의 명령(explain, 인덱스 생성 등)은 기록하지 않음
+        if (
+            settings.SLOW_QUERY_THRESHOLD_MS is None
+            or event.command_name not in RECORDED_COMMANDS
+            or mongo_operation.get() == "-"
+        ):
+            return
+        command = {
+            key: value
+            for key, value in event.command.items()
+            if key not in DRIVER_FIELDS
+        }
+        with self._lock:
+            self._started[self._key(event)] = command
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        with self._lock:
+            command = self._started.pop(self._key(event), None)
+        if command is None:
+            return
+
+        duration_ms = event.duration_micros / 1000
+        if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        self.pending.append(
+            SlowCommand(
+                operation=mongo_operation.get(),
+                command_name=event.command_name,
+                database=event.database_name,
+                collection=str(command.get(event.command_name)),
+                duration_ms=duration_ms,
+                returned=self._returned(event.command_name, event.reply),
+                command=command if event.command_name in EXPLAINABLE_COMMANDS else {},
+                shape={
+                    key: query_shape(command[key])
+                    for key in SHAPE_FIELDS
+                    if key in command
+                }
+                | {key: command[key] for key in VALUE_FIELDS if key in command}
+                | self._write_shape(command),
+            )
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        with self._lock:
+            self._started.pop(self._key(event), None)
+
+    def _returned(self, command_name: str, reply: dict[str, Any]) -> int | None:
+        """응답으로 돌려준 문서 개수 (첫 배치 기준)"""
+        if command_name in ("find", "aggregate"):
+            return len(reply.get("cursor", {}).get("firstBatch", []))
+        if command_name in ("count", "insert", "delete", "update"):
+            return reply.get("n")
+        return None
+
+    def _write_shape(self, command: dict[str, Any]) -> dict[str, Any]:
+        """쓰기 명령의 조회 조건 형태 (update/delete는 첫 작업 기준)"""
+        for key in ("updates", "deletes"):
+            if command.get(key):
+                return {"q": query_shape(command[key][0].get("q", {}))}
+        return {}
@@ -0,0 +1,211 @@
+"""프론트 정적 파일 배포 (내용 해시 파일명, 미리 압축한 .br / .gz, ETag)
+
+app/static의 원본을 dist에 빌드한다.
+- index.html 외 파일은 이름에 내용 해시를 붙여 immutable로 오래 캐시한다.
+- index.html은 해시 파일명을 가리키도록 고쳐 쓰고, ETag로 재검증(304)한다.
+- 각 파일은 brotli / gzip 최고 압축 수준으로 미리 압축해 두고 Accept-Encoding에 따라 고른다.
+
+이미지 빌드 시 `python -m app.core.static_assets` 로 빌드하고,
+빌드가 없거나 원본이 바뀌었으면 처음 요청할 때 다시 빌드한다 (개발용).
+여러 워커가 동시에 빌드하지 않도록 빌드는 파일 잠금 안에서 한 번만 한다.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import brotli
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, Response
+
+STATIC_DIR = Path(__file__).parent.parent / "static"
+DIST_DIR = STATIC_DIR / "dist"
+INDEX_NAME = "index.html"
+LOCK_NAME = ".dist.lock"
+
+# 미리 압축할 방식 (우선순위 순) / 파일 확장자
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# 해시 파일명 캐시 (1년, 내용이 바뀌면 파일명이 바뀜) / index.html은 매번 재검증
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class StaticAssets:
+    """정적 파일 빌드 / 응답"""
+
+    # 빌드 결과 (파일명 → ETag, Content-Type, 미리 압축한 방식)
+    _manifest: dict | None = None
+
+    @classmethod
+    def _source_files(cls) -> list[Path]:
+        """원본 파일 (숨김 파일 제외)"""
+        return sorted(
+            path
+            for path in STATIC_DIR.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        )
+
+    @classmethod
+    def _source_digest(cls) -> str:
+        """원본 전체 해시 (빌드가 최신인지 확인용)"""
+        digest = hashlib.sha256()
+        for path in cls._source_files():
+            digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def _write(cls, directory: Path, name: str, content: bytes) -> dict:
+        """파일과 더 작아지는 압축본 저장
+
+        Returns:
+            manifest 항목
+        """
+        (directory / name).write_bytes(content)
+        compressed = {
+            "br": brotli.compress(content, quality=11),
+            "gzip": gzip.compress(content, compresslevel=9, mtime=0),
+        }
+        encodings = []
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            if len(compressed[encoding]) < len(content):
+                (directory / f"{name}{suffix}").write_bytes(compressed[encoding])
+                encodings.append(encoding)
+        return {
+            "etag": _digest(content)[:16],
+            "content_type": mimetypes.guess_type(name)[0] or "application/octet-stream",
+            "encodings": encodings,
+        }
+
+    @classmethod
+    def build(cls) -> dict:
+        """dist 빌드 (임시 디렉터리에 만든 뒤 교체)
+
+        Returns:
+            manifest
+        """
+        building = DIST_DIR.with_name(f"{DIST_DIR.name}.{os.getpid()}.tmp")
+        shutil.rmtree(building, ignore_errors=True)
+        building.mkdir(parents=True)
+
+        files = {}
+        index = (STATIC_DIR / INDEX_NAME).read_bytes()
+        for path in cls._source_files():
+            if path.name == INDEX_NAME:
+                continue
+            content = path.read_bytes()
+            hashed_name = f"{path.stem}.{_digest(content)[:12]}{path.suffix}"
+            files[hashed_name] = cls._write(building, hashed_name, content)
+            # index.html이 가리키는 원본 경로를 해시 파일명으로 교체
+            index = index.replace(
+                f"/static/{path.name}".encode(), f"/static/{hashed_name}".encode()
+            )
+        files[INDEX_NAME] = cls._write(building, INDEX_NAME, index)
+
+        manifest = {"source": cls._source_digest(), "files": files}
+        (building / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+        # 이전 빌드는 옆으로 옮긴 뒤 교체 (지운 뒤 교체하면 그 사이 요청이 404)
+        previous = DIST_DIR.with_name(f"{DIST_DIR.name}.{os.getpid()}.old")
+        if DIST_DIR.exists():
+            DIST_DIR.rename(previous)
+        building.rename(DIST_DIR)
+        shutil.rmtree(previous, ignore_errors=True)
+        return manifest
+
+    @classmethod
+    @contextmanager
+    def build_lock(cls) -> Iterator[None]:
+        """빌드 파일 잠금 (같은 호스트의 여러 워커 / 빌드 명령이 동시에 빌드하지 않도록)"""
+        import fcntl
+
+        with open(DIST_DIR.with_name(LOCK_NAME), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @classmethod
+    def _read_manifest(cls) -> dict | None:
+        """원본과 같은 빌드의 manifest (빌드가 없거나 원본이 바뀌었으면 None)"""
+        manifest_path = DIST_DIR / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text())
+        return manifest if manifest["source"] == cls._source_digest() else None
+
+    @classmethod
+    def _read_or_build(cls) -> dict:
+        """빌드 결과 읽기 (빌드가 없거나 원본과 다르면 잠금 안에서 다시 빌드)"""
+        manifest = cls._read_manifest()
+        if manifest is None:
+            with cls.build_lock():
+                # 잠금을 기다리는 동안 다른 워커가 빌드했으면 그 결과 사용
+                manifest = cls._read_manifest() or cls.build()
+        return manifest
+
+    @classmethod
+    def load(cls) -> dict:
+        """빌드 결과 로드 (워커 안에서 캐시)"""
+        if cls._manifest is None:
+            cls._manifest = cls._read_or_build()
+        return cls._manifest
+
+    @classmethod
+    def response(cls, name: str, request: Request) -> Response:
+        """정적 파일 응답
+
+        Args:
+            name: 빌드된 파일명 (index.html 또는 해시 파일명)
+            request: 요청 (Accept-Encoding, If-None-Match)
+
+        Returns:
+            미리 압축한 파일 응답, 또는 ETag가 같으면 304
+        """
+        from app.core.compression import negotiate_encoding
+
+        entry = cls.load()["files"].get(name)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+        encoding = negotiate_encoding(
+            request.headers.get("accept-encoding", ""), entry["encodings"]
+        )
+        # 압축 방식마다 본문이 다르므로 ETag도 구분
+        etag = f'"{entry["etag"]}-{encoding}"' if encoding else f'"{entry["etag"]}"'
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": (
+                INDEX_CACHE_CONTROL if name == INDEX_NAME else IMMUTABLE_CACHE_CONTROL
+            ),
+        }
+
+        # 압축 미들웨어를 거친 응답은 약한 ETag(W/)로 받았으므로 약한 비교
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+
+        path = DIST_DIR / name
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            path = DIST_DIR / f"{name}{PRECOMPRESSED_SUFFIXES[encoding]}"
+        return FileResponse(path, media_type=entry["content_type"], headers=headers)
+
+
+if __name__ == "__main__":
+    with StaticAssets.build_lock():
+        built = StaticAssets.build()
+    for file_name, file_entry in built["files"].items():
+        print(file_name, ", ".join(file_entry["encodings"]) or "-")
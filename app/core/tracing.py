@@ -0,0 +1,361 @@
+"""요청 추적 span (라우터 → 서비스 → 컬렉션 / 오픈API 클라이언트 → MongoDB / HTTP)
+
+span은 ContextVar로 부모를 이어 받으므로 asyncio 태스크와 motor 실행 스레드에서도 중첩된다.
+끝난 span은 대기열에 모았다가 TraceExporter가 JSON Lines 파일이나 OTLP/HTTP 수집기로 보낸다.
+TRACE_EXPORTER가 none이면 trace id 전파(traceparent, X-Trace-Id)만 하고 span은 기록하지 않는다.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+from pymongo import monitoring
+from starlette.routing import Match
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# W3C traceparent (버전-trace id-부모 span id-플래그)
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# 내보내기 전 최대 대기 span 개수 (넘으면 오래된 것부터 버림)
+MAX_PENDING_SPANS = 10000
+
+# 대기열의 span을 내보내는 간격 (초)
+TRACE_EXPORT_INTERVAL_SECONDS = 2.0
+
+# OTLP span 종류 코드
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+@dataclass
+class Span:
+    """추적 span (sampled가 False면 id 전파에만 쓰고 기록하지 않음)"""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: str | None = None
+    kind: str = "internal"  # internal, server, client
+    sampled: bool = True
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any):
+        """속성 추가 (행 개수, 배치 크기 등)"""
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_json(self) -> dict[str, Any]:
+        """JSON Lines 파일용 dict"""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1_000_000,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        """OTLP/HTTP JSON span"""
+        otlp = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": OTLP_SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error} if self.error else {"code": 1}
+            ),
+        }
+        if self.parent_id:
+            otlp["parentSpanId"] = self.parent_id
+        return otlp
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# 지금 실행 중인 span
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+# 끝났지만 아직 내보내지 않은 span
+finished_spans: deque[Span] = deque(maxlen=MAX_PENDING_SPANS)
+
+
+def route_template(scope) -> str:
+    """요청이 맞는 라우트 템플릿 (/bid/id/{bid_id}, 맞는 라우트가 없으면 unmatched)
+
+    실제 경로 대신 템플릿을 span 이름과 지표 라벨로 써서 종류 수가 늘어나지 않게 한다.
+    """
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match != Match.NONE:
+            return route.path
+    return "unmatched"
+
+
+def tracing_enabled() -> bool:
+    return settings.TRACE_EXPORTER != "none"
+
+
+def _new_span(name: str, kind: str, attributes: dict[str, Any]) -> Span:
+    """현재 span의 자식 span 생성 (현재 span이 없으면 새 trace 시작)"""
+    parent = current_span.get()
+    if parent is None:
+        return Span(
+            name=name,
+            trace_id=secrets.token_hex(16),
+            kind=kind,
+            sampled=tracing_enabled() and random.random() < settings.TRACE_SAMPLE_RATE,
+            attributes=attributes,
+        )
+    return Span(
+        name=name,
+        trace_id=parent.trace_id,
+        parent_id=parent.span_id,
+        kind=kind,
+        sampled=parent.sampled,
+        attributes=attributes,
+    )
+
+
+def _finish(finished: Span):
+    finished.end_ns = time.time_ns()
+    if finished.sampled:
+        finished_spans.append(finished)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+    """현재 span 아래에 자식 span 실행 (동기 / 비동기 코드 모두 with로 사용)
+
+    Args:
+        name: span 이름 (BidService.parse_table 등)
+        kind: internal, server, client
+        attributes: 시작 시 속성
+
+    Yields:
+        span (set_attribute로 속성 추가)
+    """
+    child = _new_span(name, kind, attributes)
+    token = current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current_span.reset(token)
+        _finish(child)
+
+
+def record_span(
+    name: str,
+    duration_ns: int,
+    kind: str = "client",
+    error: str | None = None,
+    **attributes: Any,
+):
+    """이미 끝난 작업을 현재 span의 자식 span으로 기록 (MongoDB 명령 리스너용)"""
+    parent = current_span.get()
+    if parent is None or not parent.sampled:
+        return
+    end_ns = time.time_ns()
+    finished_spans.append(
+        Span(
+            name=name,
+            trace_id=parent.trace_id,
+            parent_id=parent.span_id,
+            kind=kind,
+            start_ns=end_ns - duration_ns,
+            end_ns=end_ns,
+            attributes=attributes,
+            error=error,
+        )
+    )
+
+
+class MongoTraceListener(monitoring.CommandListener):
+    """MongoDB 명령을 호출한 컬렉션 메서드 span의 자식 span으로 기록"""
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        record_span(
+            f"mongo.{event.command_name}",
+            event.duration_micros * 1000,
+            **{"db.system": "mongodb", "db.name": event.database_name},
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        record_span(
+            f"mongo.{event.command_name}",
+            event.duration_micros * 1000,
+            error=str(event.failure.get("errmsg", event.failure)),
+            **{"db.system": "mongodb", "db.name": event.database_name},
+        )
+
+
+class TracingMiddleware:
+    """요청 root span 생성 및 trace id 전파 ASGI 미들웨어
+
+    요청의 traceparent 헤더가 있으면 그 trace를 이어가고,
+    응답에는 traceparent와 X-Trace-Id 헤더를 붙인다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def _parent(self, scope) -> Span | None:
+        """요청 traceparent 헤더의 원격 부모 span"""
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                match = TRACEPARENT_PATTERN.match(value.decode("latin-1").strip())
+                if match:
+                    trace_id, span_id, flags = match.groups()
+                    return Span(
+                        name="remote",
+                        trace_id=trace_id,
+                        span_id=span_id,
+                        sampled=tracing_enabled() and int(flags, 16) & 1 == 1,
+                    )
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = route_template(scope)
+        parent = self._parent(scope)
+        parent_token = current_span.set(parent) if parent else None
+        try:
+            with span(
+                f"{scope['method']} {route}",
+                kind="server",
+                **{
+                    "http.method": scope["method"],
+                    "http.route": route,
+                    "http.target": scope["path"],
+                },
+            ) as root:
+
+                async def send_wrapper(message):
+                    if message["type"] == "http.response.start":
+                        root.set_attribute("http.status_code", message["status"])
+                        message["headers"] = [
+                            *message.get("headers", []),
+                            (b"traceparent", root.traceparent.encode()),
+                            (b"x-trace-id", root.trace_id.encode()),
+                        ]
+                    await send(message)
+
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            if parent_token:
+                current_span.reset(parent_token)
+
+
+class TraceExporter:
+    """끝난 span 내보내기 (json: JSON Lines 파일, otlp: OTLP/HTTP JSON)"""
+
+    @classmethod
+    def _write_json(cls, spans: list[Span]):
+        path = Path(settings.TRACE_JSON_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as file:
+            for item in spans:
+                file.write(
+                    json.dumps(item.to_json(), ensure_ascii=False, default=str) + "\n"
+                )
+
+    @classmethod
+    async def _post_otlp(cls, spans: list[Span]):
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": settings.TRACE_SERVICE_NAME},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app"},
+                            "spans": [item.to_otlp() for item in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.post(settings.TRACE_OTLP_ENDPOINT, json=payload)
+            response.raise_for_status()
+
+    @classmethod
+    async def flush(cls) -> int:
+        """대기열의 span 내보내기
+
+        Returns:
+            내보낸 span 개수
+        """
+        spans = []
+        while finished_spans:
+            spans.append(finished_spans.popleft())
+        if not spans:
+            return 0
+
+        if settings.TRACE_EXPORTER == "json":
+            await asyncio.to_thread(cls._write_json, spans)
+        elif settings.TRACE_EXPORTER == "otlp":
+            await cls._post_otlp(spans)
+        return len(spans)
+
+    @classmethod
+    async def run(cls):
+        """span 내보내기 루프 (lifespan에서 실행)"""
+        while True:
+            await asyncio.sleep(TRACE_EXPORT_INTERVAL_SECONDS)
+            try:
+                await cls.flush()
+            except (OSError, httpx.HTTPError) as e:
+                logger.warning("trace 내보내기 실패: %s", e)
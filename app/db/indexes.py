@@ -0,0 +1,37 @@
+"""컬렉션 인덱스 / capped 컬렉션 생성
+
+배포할 때 한 번 실행한다 (워커마다 시작할 때 실행하지 않음).
+실행: python -m app.db.indexes
+"""
+
+import asyncio
+
+from app.collections.admission_lease_collection import AdmissionLeaseCollection
+from app.collections.bid_collection import BidCollection
+from app.collections.bid_stats_collection import BidStatsCollection
+from app.collections.bid_upload_collection import BidUploadCollection
+from app.collections.profile_collection import ProfileCollection
+from app.collections.slow_query_collection import SlowQueryCollection
+from app.db.mongo_db import MongoDB
+
+
+async def create_indexes():
+    """모든 컬렉션의 인덱스와 capped 컬렉션 생성 (이미 있으면 그대로 둠)"""
+    await BidCollection.create_indexes()
+    await BidStatsCollection.create_indexes()
+    await BidUploadCollection.create_indexes()
+    await AdmissionLeaseCollection.create_indexes()
+    await SlowQueryCollection.create_collection()
+    await ProfileCollection.create_indexes()
+
+
+async def main():
+    MongoDB.connect()
+    try:
+        await create_indexes()
+    finally:
+        MongoDB.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
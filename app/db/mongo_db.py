@@ -1,8 +1,134 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
 from app.core.settings import settings
+from app.core.metrics import MongoCommandMetrics, MongoPoolMetrics
+from app.core.slow_query import SlowQueryListener
+from app.core.tracing import MongoTraceListener
+
+# 사용할 데이터베이스 이름
+DATABASE_NAME = "base"
+
+# 세컨더리로 보낼 수 있는 읽기 설정 (primary는 최대 지연 시간을 받지 않음)
+READ_PREFERENCES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+class MongoDB:
+    """MongoDB 클라이언트 수명 관리
+
+    클라이언트는 모니터링 스레드와 커넥션 풀을 가지므로 import 시점이 아니라
+    워커 프로세스의 lifespan에서 만들고(fork 이후), 종료 시 닫는다.
+    lifespan 밖(스크립트, 테스트)에서는 처음 사용할 때 만든다.
+    """
+
+    client: "AsyncIOMotorClient | None" = None
+
+    @classmethod
+    def connect(cls) -> AsyncIOMotorClient:
+        """설정값으로 클라이언트 생성 (풀 크기, 타임아웃, 전송 압축, 지표/추적 리스너)"""
+        cls.client = AsyncIOMotorClient(
+            settings.MONGO_DB_URL,  # type: ignore
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+            # 비우면 압축하지 않음
+            **(
+                {"compressors": settings.MONGO_COMPRESSORS}
+                if settings.MONGO_COMPRESSORS
+                else {}
+            ),
+            event_listeners=[
+                MongoCommandMetrics(),
+                MongoPoolMetrics(),
+                SlowQueryListener(),
+                MongoTraceListener(),
+            ],
+        )
+        return cls.client
+
+    @classmethod
+    async def warm_up(cls):
+        """서버 선택과 첫 커넥션 연결을 미리 수행 (첫 요청 지연 방지)
+
+        MONGO_MIN_POOL_SIZE만큼의 커넥션은 드라이버가 백그라운드에서 채운다.
+        """
+        await cls.get_database().command("ping")
+
+    @classmethod
+    def get_database(cls) -> AsyncIOMotorDatabase:
+        """현재 클라이언트의 데이터베이스 (클라이언트가 없으면 생성)"""
+        if cls.client is None:
+            cls.connect()
+        return cls.client[DATABASE_NAME]
+
+    @classmethod
+    def close(cls):
+        """클라이언트 종료 (커넥션 풀과 모니터링 스레드 정리)"""
+        if cls.client is not None:
+            cls.client.close()
+            cls.client = None
+
+
+class MongoCollection:
+    """컬렉션 클래스 속성용 descriptor
+
+    접근할 때 현재 클라이언트의 컬렉션을 돌려주므로 컬렉션 클래스를 import해도 클라이언트가 만들어지지 않는다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._client: AsyncIOMotorClient | None = None
+        self._collection: AsyncIOMotorCollection | None = None
+
+    def __get__(self, instance, owner) -> AsyncIOMotorCollection:
+        database = MongoDB.get_database()
+        # 클라이언트가 바뀔 때만 컬렉션 객체를 새로 만듦
+        if self._client is not MongoDB.client:
+            self._client = MongoDB.client
+            self._collection = database[self.name]
+        return self._collection
+
+
+def analytics_reads(collection: AsyncIOMotorCollection) -> AsyncIOMotorCollection:
+    """분석 / 목록 조회용 읽기 설정을 적용한 컬렉션
+
+    집계와 목록 조회를 세컨더리로 보내 업로드 쓰기와 프라이머리를 나눠 쓰지 않게 한다.
+    방금 쓴 문서를 다시 읽어야 하는 조회는 원래 컬렉션(프라이머리)을 그대로 쓴다.
 
-# MongoDB 클라이언트 설정
-client = AsyncIOMotorClient(settings.MONGO_DB_URL)  # type: ignore
+    Args:
+        collection: 대상 컬렉션
 
-# 필요한 MongoDB 컬렉션을 가져옵니다
-db = client["base"]
+    Returns:
+        MONGO_ANALYTICS_* 설정의 read preference / read concern을 적용한 컬렉션
+    """
+    mode = settings.MONGO_ANALYTICS_READ_PREFERENCE
+    if mode == "primary":
+        read_preference = Primary()
+    else:
+        # -1: 최대 지연 시간 제한 없음
+        read_preference = READ_PREFERENCES[mode](
+            max_staleness=settings.MONGO_ANALYTICS_MAX_STALENESS_SECONDS or -1
+        )
+    return collection.with_options(
+        read_preference=read_preference,
+        read_concern=ReadConcern(settings.MONGO_ANALYTICS_READ_CONCERN),
+    )
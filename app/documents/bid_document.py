@@ -26,3 +26,11 @@ class BidDocument(BaseDocument):
     base_to_winning_ratio: float  # 기초/낙찰 (소수점 5자리)
     expected_to_winning_ratio: float  # 예정/낙찰 (소수점 5자리)
     estimated_to_winning_ratio: float  # 추정/낙찰 (소수점 5자리)
+
+
+# 통계/분포 조회 대상 비율 필드
+RATIO_FIELDS = (
+    "base_to_winning_ratio",
+    "expected_to_winning_ratio",
+    "estimated_to_winning_ratio",
+)
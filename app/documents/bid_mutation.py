@@ -0,0 +1,18 @@
+import dataclasses
+from typing import Any
+
+from app.documents.bid_document import BidDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class BidMutation:
+    op: str  # create, update, delete
+    bid_id: str | None = None  # 수정/삭제 대상 ID
+    document: BidDocument | None = None  # 생성할 문서
+    fields: dict[str, Any] | None = None  # 수정할 필드
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class BidMutationResult:
+    bid_id: str | None = None  # 처리된 문서 ID
+    error: str | None = None  # 실패 사유 (성공 시 None)
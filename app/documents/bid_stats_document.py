@@ -0,0 +1,14 @@
+import dataclasses
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class BidStatsDocument(BaseDocument):
+    region: str  # 지역
+    industry: str  # 업종
+    ordering_agency: str  # 발주기관
+    month: str  # 입찰월 (YYYY-MM)
+    count: int  # 입찰 건수
+    sums: dict[str, float]  # 비율 필드별 합계
+    histograms: dict[str, dict[str, int]]  # 비율 필드별 {버킷: 건수}
@@ -0,0 +1,16 @@
+import dataclasses
+from datetime import datetime
+from typing import Any
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class BidUploadDocument(BaseDocument):
+    digest: str  # 업로드 파일 sha256
+    status: str  # processing, done, failed
+    result: dict[str, Any] | None = None  # 처리 결과 (BidUploadData)
+    error: str | None = None  # 실패 사유
+    owner: str | None = None  # 처리 권한을 가진 처리자 식별자
+    created_at: datetime  # 최초 업로드 시각 (TTL 기준)
+    updated_at: datetime  # 상태 변경 시각 (처리 중 기록 만료 판단 기준)
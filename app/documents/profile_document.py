@@ -0,0 +1,16 @@
+import dataclasses
+from datetime import datetime
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class ProfileDocument(BaseDocument):
+    mode: str  # sample (collapsed stack), cprofile (pstats)
+    method: str  # 요청 메서드
+    path: str  # 요청 경로
+    status: int  # 응답 상태 코드
+    duration_ms: float  # 요청 처리 시간 (밀리초)
+    size: int  # 프로파일 크기 (바이트)
+    data: bytes | None = None  # 프로파일 내용 (목록 조회 시 제외)
+    created_at: datetime  # 기록 시각 (TTL 기준)
@@ -0,0 +1,20 @@
+import dataclasses
+from datetime import datetime
+from typing import Any
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class SlowQueryDocument(BaseDocument):
+    operation: str  # 명령을 실행한 컬렉션 메서드 (BidCollection.find_all_bids)
+    command_name: str  # MongoDB 명령 (find, aggregate, count ...)
+    collection: str  # 대상 컬렉션
+    duration_ms: float  # 실행 시간 (밀리초)
+    shape: dict[str, Any]  # 값을 타입 이름으로 바꾼 조회 형태
+    returned: int | None = None  # 돌려준 문서 개수 (find/aggregate는 첫 배치 기준)
+    docs_examined: int | None = None  # 읽은 문서 개수 (explain 실행 시)
+    keys_examined: int | None = None  # 읽은 인덱스 키 개수 (explain 실행 시)
+    examined_ratio: float | None = None  # 읽은 문서 / 돌려준 문서 (explain 실행 시)
+    plan: dict[str, Any] | None = None  # explain winningPlan (explain 실행 시)
+    created_at: datetime  # 기록 시각
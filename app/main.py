@@ -1,22 +1,56 @@
+import asyncio
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
-from pathlib import Path
+from contextlib import asynccontextmanager, suppress
 
 from app.routers import health_router
 from app.routers import bid_router
 from app.routers import openapi_router
-from app.collections.bid_collection import BidCollection
+from app.routers import metrics_router
+from app.routers import admin_router
+from app.routers import static_router
+from app.services.bid_service import BidService
+from app.services.slow_query_service import SlowQueryService
+from app.services.profile_service import ProfileService
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.core.tracing import TracingMiddleware, TraceExporter
+from app.core.loop_monitor import loop_monitor
+from app.core.health import HealthMonitor
+from app.core.settings import settings
+from app.db.mongo_db import MongoDB
+from app.db.indexes import create_indexes
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: 인덱스 생성
-    await BidCollection.create_indexes()
+    # Startup: 워커마다 MongoDB 클라이언트 생성 후 미리 연결
+    MongoDB.connect()
+    await MongoDB.warm_up()
+    # 인덱스 생성 (배포 시 python -m app.db.indexes로 한 번 실행했으면 생략)
+    if settings.MONGO_CREATE_INDEXES_ON_STARTUP:
+        await create_indexes()
+    # 느린 명령 기록 저장 루프
+    slow_query_task = asyncio.create_task(SlowQueryService.run())
+    # 추적 span 내보내기 루프
+    trace_task = asyncio.create_task(TraceExporter.run())
+    # readiness용 MongoDB ping 루프
+    health_task = asyncio.create_task(HealthMonitor.run())
+    # 이벤트 루프 지연 측정 / 멈춤 감지
+    loop_monitor.start()
     yield
     # Shutdown: 필요한 정리 작업
+    await loop_monitor.stop()
+    for task in (slow_query_task, trace_task, health_task):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    BidService.shutdown_parse_executor()
+    # 남은 느린 명령 기록 저장
+    await SlowQueryService.flush()
+    await TraceExporter.flush()
+    MongoDB.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -30,18 +64,22 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 응답 압축 (Accept-Encoding 협상, 지표의 응답 크기는 압축 후 크기)
+app.add_middleware(CompressionMiddleware)
+
+# 요청 단위 프로파일링 (관리자 토큰 + X-Profile 헤더 또는 PROFILE_SAMPLE_RATE)
+app.add_middleware(ProfilingMiddleware, save=ProfileService.save_profile)
+
+# 요청 추적 (traceparent / X-Trace-Id 전파, TRACE_EXPORTER로 span 내보내기)
+app.add_middleware(TracingMiddleware)
+
+# 요청 지표 수집 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
 # Include Router
 app.include_router(health_router.router)
 app.include_router(bid_router.router)
 app.include_router(openapi_router.router)
-
-# Static files mount
-static_dir = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-
-
-# Root endpoint to serve index.html
-@app.get("/")
-async def read_root():
-    """루트 경로에서 차트 페이지 제공"""
-    return FileResponse(str(static_dir / "index.html"))
+app.include_router(metrics_router.router)
+app.include_router(admin_router.router)
+app.include_router(static_router.router)
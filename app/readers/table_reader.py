@@ -0,0 +1,155 @@
+"""업로드 표 파일(엑셀/CSV) 포맷 판별 및 읽기
+
+pandas는 업로드를 처리할 때만 필요하므로 읽기 함수 안에서 import한다
+(업로드를 처리하지 않는 워커의 시작 시간과 메모리 절약).
+"""
+
+import zipfile
+from io import BytesIO
+from typing import TYPE_CHECKING, Callable
+
+from app.core.settings import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# CSV 판별 기준 헤더
+REQUIRED_HEADER = "공고번호"
+
+# 포맷 판별용 시그니처
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+ODS_MIMETYPE = b"application/vnd.oasis.opendocument.spreadsheet"
+
+# CSV 인코딩 후보 (국내 엑셀에서 내보낸 CSV는 cp949가 흔함)
+CSV_ENCODINGS = ("utf-8-sig", "cp949")
+
+# 지원 포맷
+TABLE_FORMATS = ("xlsx", "xls", "xlsb", "ods", "csv")
+
+
+class TableReader:
+    """업로드 표 파일 리더
+
+    확장자가 아니라 파일 내용으로 포맷을 판별하고, 모든 셀을 문자열(dtype=str)로 읽는다.
+    포맷별 리더는 register로 교체하거나 추가할 수 있다.
+    """
+
+    _readers: dict[str, Callable[[bytes], "pd.DataFrame"]] = {}
+
+    @classmethod
+    def register(cls, fmt: str, reader: Callable[[bytes], "pd.DataFrame"]):
+        """포맷별 리더 등록
+
+        Args:
+            fmt: 포맷 이름
+            reader: 파일 내용을 받아 DataFrame을 돌려주는 함수
+        """
+        cls._readers[fmt] = reader
+
+    @classmethod
+    def sniff(cls, contents: bytes) -> str | None:
+        """파일 내용으로 포맷 판별
+
+        Args:
+            contents: 파일 내용
+
+        Returns:
+            포맷 이름 (xlsx, xls, xlsb, ods, csv) 또는 None (지원하지 않는 파일)
+        """
+        if contents.startswith(OLE2_MAGIC):
+            return "xls"
+
+        if contents.startswith(ZIP_MAGIC):
+            try:
+                with zipfile.ZipFile(BytesIO(contents)) as archive:
+                    names = set(archive.namelist())
+                    if "xl/workbook.bin" in names:
+                        return "xlsb"
+                    if "xl/workbook.xml" in names:
+                        return "xlsx"
+                    if "mimetype" in names and archive.read("mimetype").startswith(
+                        ODS_MIMETYPE
+                    ):
+                        return "ods"
+            except zipfile.BadZipFile:
+                return None
+            return None
+
+        if cls._csv_encoding(contents):
+            return "csv"
+        return None
+
+    @classmethod
+    def _csv_encoding(cls, contents: bytes) -> str | None:
+        """첫 줄에 필수 헤더가 있는 CSV의 인코딩 판별"""
+        header = contents.split(b"\n", 1)[0]
+        for encoding in CSV_ENCODINGS:
+            try:
+                if REQUIRED_HEADER in header.decode(encoding):
+                    return encoding
+            except UnicodeDecodeError:
+                continue
+        return None
+
+    @classmethod
+    def read(cls, contents: bytes, fmt: str | None = None) -> "pd.DataFrame":
+        """표 파일을 DataFrame으로 읽기
+
+        Args:
+            contents: 파일 내용
+            fmt: 포맷 이름 (없으면 내용으로 판별)
+
+        Returns:
+            모든 셀이 문자열인 DataFrame (빈 셀은 NaN)
+
+        Raises:
+            ValueError: 지원하지 않는 파일
+        """
+        fmt = fmt or cls.sniff(contents)
+        if fmt not in cls._readers:
+            raise ValueError("지원하지 않는 파일 형식입니다")
+        return cls._readers[fmt](contents)
+
+    @classmethod
+    def read_excel(cls, contents: bytes, engine: str = "calamine") -> "pd.DataFrame":
+        """엑셀 계열 파일 읽기 (날짜 자동 파싱 방지)
+
+        Args:
+            contents: 파일 내용
+            engine: pandas 엑셀 엔진 (calamine, openpyxl)
+
+        Returns:
+            DataFrame
+        """
+        import pandas as pd
+
+        return pd.read_excel(BytesIO(contents), dtype=str, engine=engine)
+
+    @classmethod
+    def read_csv(cls, contents: bytes) -> "pd.DataFrame":
+        """CSV 파일 읽기 (pandas C 파서)
+
+        Args:
+            contents: 파일 내용
+
+        Returns:
+            DataFrame
+        """
+        import pandas as pd
+
+        return pd.read_csv(
+            BytesIO(contents),
+            dtype=str,
+            encoding=cls._csv_encoding(contents) or CSV_ENCODINGS[0],
+            engine="c",
+        )
+
+
+# 기본 리더: 엑셀 계열은 calamine (xlsx만 설정으로 openpyxl 선택 가능)
+TableReader.register(
+    "xlsx", lambda contents: TableReader.read_excel(contents, settings.XLSX_ENGINE)
+)
+for _fmt in ("xls", "xlsb", "ods"):
+    TableReader.register(_fmt, TableReader.read_excel)
+TableReader.register("csv", TableReader.read_csv)
@@ -1,5 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
+from typing import Any, Literal
+
+# 일괄 조회 최대 키 개수
+MAX_BATCH_LOOKUP_KEYS = 5000
 
 
 class BidCreateRequest(BaseModel):
@@ -52,3 +56,58 @@ class BidUpdateRequest(BaseModel):
     base_to_winning_ratio: float | None = Field(None, description="기초/낙찰")
     expected_to_winning_ratio: float | None = Field(None, description="예정/낙찰")
     estimated_to_winning_ratio: float | None = Field(None, description="추정/낙찰")
+
+
+class BidFilterRequest(BaseModel):
+    """입찰 문서 조회 필터 모델 (목록/분포/시계열 공통)"""
+
+    region: str | None = Field(None, description="지역")
+    industry: str | None = Field(None, description="업종")
+    ordering_agency: str | None = Field(None, description="발주기관")
+    bid_date_from: datetime | None = Field(None, description="입찰일 시작 (포함)")
+    bid_date_to: datetime | None = Field(None, description="입찰일 종료 (포함)")
+
+
+class BidBatchLookupRequest(BaseModel):
+    """입찰 문서 일괄 조회 요청 모델"""
+
+    ids: list[str] = Field(default_factory=list, description="입찰 문서 ID 리스트")
+    announcement_numbers: list[str] = Field(
+        default_factory=list, description="공고번호 리스트"
+    )
+
+    @model_validator(mode="after")
+    def check_key_count(self):
+        if len(self.ids) + len(self.announcement_numbers) > MAX_BATCH_LOOKUP_KEYS:
+            raise ValueError(
+                f"한 번에 조회할 수 있는 키는 최대 {MAX_BATCH_LOOKUP_KEYS}개입니다"
+            )
+        return self
+
+
+class BidBulkOperationRequest(BaseModel):
+    """입찰 문서 일괄 변경 작업 모델 (NDJSON 한 줄)"""
+
+    op: Literal["create", "update", "delete"] = Field(..., description="작업 종류")
+    id: str | None = Field(None, description="입찰 문서 ID (update, delete)")
+    data: dict[str, Any] | None = Field(
+        None,
+        description="생성 데이터(BidCreateRequest) 또는 수정 데이터(BidUpdateRequest)",
+    )
+
+    @model_validator(mode="after")
+    def check_operation(self):
+        if self.op == "create" and self.data is None:
+            raise ValueError("create 작업에는 data가 필요합니다")
+        if self.op in ("update", "delete") and not self.id:
+            raise ValueError(f"{self.op} 작업에는 id가 필요합니다")
+        return self
+
+
+class BidUploadSessionCreateRequest(BaseModel):
+    """분할 업로드 세션 생성 요청 모델"""
+
+    filename: str | None = Field(None, description="파일명")
+    size: int | None = Field(
+        None, ge=0, description="전체 파일 크기 (바이트, 완료 시 검증)"
+    )
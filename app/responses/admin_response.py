@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any
+
+from app.base.base_response import BaseResponse
+
+
+class SlowQueryData(BaseModel):
+    """느린 MongoDB 명령 기록 모델"""
+
+    id: str  # 기록 ID
+    operation: str  # 명령을 실행한 컬렉션 메서드
+    command_name: str  # MongoDB 명령
+    collection: str  # 대상 컬렉션
+    duration_ms: float  # 실행 시간 (밀리초)
+    shape: dict[str, Any]  # 값을 타입 이름으로 바꾼 조회 형태
+    returned: int | None  # 돌려준 문서 개수
+    docs_examined: int | None  # 읽은 문서 개수 (explain 실행 시)
+    keys_examined: int | None  # 읽은 인덱스 키 개수 (explain 실행 시)
+    examined_ratio: float | None  # 읽은 문서 / 돌려준 문서 (explain 실행 시)
+    plan: dict[str, Any] | None  # 실행 계획 (explain 실행 시)
+    created_at: datetime  # 기록 시각
+
+
+class SlowQueryListResponse(BaseResponse):
+    """느린 MongoDB 명령 기록 조회 응답 모델"""
+
+    data: list[SlowQueryData]
+
+
+class ProfileData(BaseModel):
+    """요청 프로파일 모델 (내용 제외)"""
+
+    id: str  # 프로파일 ID (응답의 X-Profile-Id)
+    mode: str  # sample (collapsed stack), cprofile (pstats)
+    method: str  # 요청 메서드
+    path: str  # 요청 경로
+    status: int  # 응답 상태 코드
+    duration_ms: float  # 요청 처리 시간 (밀리초)
+    size: int  # 프로파일 크기 (바이트)
+    created_at: datetime  # 기록 시각
+
+
+class ProfileListResponse(BaseResponse):
+    """요청 프로파일 목록 응답 모델"""
+
+    data: list[ProfileData]
@@ -10,6 +10,7 @@ class BidUploadData(BaseModel):
     inserted_count: int  # 새로 삽입된 개수
     updated_count: int  # 업데이트된 개수
     updated_list: list[str]  # 업데이트된 공고번호 리스트
+    unchanged_count: int  # 내용이 같아 쓰지 않은 개수
 
 
 class BidUploadResponse(BaseResponse):
@@ -18,6 +19,44 @@ class BidUploadResponse(BaseResponse):
     data: BidUploadData
 
 
+class BidUploadFileData(BaseModel):
+    """여러 파일 업로드 시 파일별 결과 모델"""
+
+    filename: str  # 파일명 (ZIP 내부 파일은 "압축파일명/내부경로")
+    row_count: int  # 파싱된 행 개수
+    merged_count: int  # 뒤 파일에 덮어쓰이지 않고 저장 대상이 된 행 개수
+    error: str | None = None  # 파일 처리 실패 사유
+
+
+class BidBatchUploadData(BaseModel):
+    """여러 파일 업로드 결과 모델"""
+
+    files: list[BidUploadFileData]  # 파일별 결과 (처리 순서)
+    total: BidUploadData  # 병합 후 전체 저장 결과
+
+
+class BidBatchUploadResponse(BaseResponse):
+    """여러 파일 업로드 응답 모델"""
+
+    data: BidBatchUploadData
+
+
+class BidUploadSessionData(BaseModel):
+    """분할 업로드 세션 모델"""
+
+    upload_id: str  # 업로드 ID
+    filename: str | None  # 파일명
+    size: int | None  # 선언한 전체 크기 (바이트)
+    offset: int  # 지금까지 받은 크기 (다음 청크 시작 위치)
+    expires_at: datetime  # 추가 전송이 없으면 세션이 삭제되는 시각
+
+
+class BidUploadSessionResponse(BaseResponse):
+    """분할 업로드 세션 응답 모델"""
+
+    data: BidUploadSessionData
+
+
 class BidData(BaseModel):
     """입찰 문서 응답 데이터 모델"""
 
@@ -62,3 +101,86 @@ class BidListResponse(BaseResponse):
     """입찰 문서 리스트 응답 모델"""
 
     data: BidListData
+
+
+class RatioStatsData(BaseModel):
+    """비율 통계 데이터 모델"""
+
+    mean: float | None  # 평균
+    median: float | None  # 중앙값
+    p10: float | None  # 10 백분위수
+    p90: float | None  # 90 백분위수
+
+
+class BidStatsGroupData(BaseModel):
+    """세그먼트 통계 그룹 데이터 모델"""
+
+    group: dict[str, str]  # 그룹 키 (예: {"region": "서울"})
+    count: int  # 입찰 건수
+    ratios: dict[str, RatioStatsData]  # 비율 필드별 통계
+
+
+class BidStatsData(BaseModel):
+    """세그먼트 통계 응답 데이터 모델"""
+
+    group_by: list[str]  # 그룹 기준 필드
+    segment_count: int  # 집계에 사용된 롤업 문서 개수
+    groups: list[BidStatsGroupData]  # 그룹별 통계
+
+
+class BidStatsResponse(BaseResponse):
+    """세그먼트 통계 응답 모델"""
+
+    data: BidStatsData
+
+
+class BidHistogramData(BaseModel):
+    """비율 분포 히스토그램 응답 데이터 모델"""
+
+    field: str  # 집계 필드
+    lower: float  # 첫 구간 하한
+    upper: float  # 마지막 구간 상한 (포함)
+    bin_width: float  # 구간 폭
+    total: int  # 범위 내 전체 건수
+    counts: list[int]  # 구간별 건수 (lower부터 bin_width 간격)
+
+
+class BidHistogramResponse(BaseResponse):
+    """비율 분포 히스토그램 응답 모델"""
+
+    data: BidHistogramData
+
+
+class BidSeriesPointData(BaseModel):
+    """시계열 점 데이터 모델"""
+
+    bid_date: datetime  # 입찰일
+    value: float  # 비율 값
+
+
+class BidSeriesData(BaseModel):
+    """다운샘플링 시계열 응답 데이터 모델"""
+
+    field: str  # 값 필드
+    total: int  # 다운샘플링 전 전체 점 개수
+    points: list[BidSeriesPointData]  # 다운샘플링된 점 리스트
+
+
+class BidSeriesResponse(BaseResponse):
+    """다운샘플링 시계열 응답 모델"""
+
+    data: BidSeriesData
+
+
+class BidBatchLookupData(BaseModel):
+    """입찰 문서 일괄 조회 응답 데이터 모델"""
+
+    items: list[BidData]  # 조회된 입찰 문서 리스트
+    missing_ids: list[str]  # 찾지 못한 ID 리스트
+    missing_announcement_numbers: list[str]  # 찾지 못한 공고번호 리스트
+
+
+class BidBatchLookupResponse(BaseResponse):
+    """입찰 문서 일괄 조회 응답 모델"""
+
+    data: BidBatchLookupData
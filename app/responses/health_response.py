@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+from app.base.base_response import BaseResponse
+
+
+class HealthMongoData(BaseModel):
+    """MongoDB 상태 모델"""
+
+    ping_ms: float | None  # 마지막 ping 지연 (밀리초, 실패 시 None)
+    ping_age_seconds: float | None  # 마지막 ping 이후 지난 시간 (초)
+    error: str | None  # 마지막 ping 오류
+    pool_checked_out: int  # 사용 중인 커넥션 개수 (가장 많이 쓰는 서버 풀)
+    pool_size: int  # 서버별 최대 풀 크기
+    pool_utilization: float  # 풀 사용률 (0~1)
+
+
+class HealthJobData(BaseModel):
+    """무거운 작업 실행 상태 모델 (이 워커 기준)"""
+
+    running: int  # 실행 중
+    waiting: int  # 자리 대기 중
+    limit: int  # 워커별 동시 실행 개수
+
+
+class HealthReadinessData(BaseModel):
+    """readiness 모델"""
+
+    ready: bool  # 요청을 받을 수 있는지
+    reasons: list[str]  # 준비되지 않은 이유
+    mongo: HealthMongoData
+    loop_lag_ms: float  # 마지막으로 측정한 이벤트 루프 지연 (밀리초)
+    jobs: dict[str, HealthJobData]  # 작업 종류별 상태 (upload, aggregation)
+
+
+class HealthReadinessResponse(BaseResponse):
+    """readiness 응답 모델"""
+
+    data: HealthReadinessData
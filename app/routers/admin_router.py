@@ -0,0 +1,98 @@
+"""관리자 API Router (X-Admin-Token 헤더 필요)"""
+
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
+from starlette.status import HTTP_200_OK
+
+from app.core.settings import settings
+from app.responses.admin_response import SlowQueryListResponse, ProfileListResponse
+from app.services.slow_query_service import SlowQueryService
+from app.services.profile_service import ProfileService
+
+
+async def verify_admin_token(
+    x_admin_token: str | None = Header(default=None, description="관리자 토큰"),
+):
+    """관리자 토큰 확인 (ADMIN_TOKEN이 없으면 관리자 API 비활성화)"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token, settings.ADMIN_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다")
+
+
+router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(verify_admin_token)]
+)
+
+
+@router.get("/slow-queries", tags=["Admin"], response_model=SlowQueryListResponse)
+async def get_slow_queries(
+    limit: int = Query(default=100, ge=1, le=1000, description="최대 개수"),
+    operation: str | None = Query(
+        default=None, description="컬렉션 메서드 (예: BidCollection.find_all_bids)"
+    ),
+):
+    """느린 MongoDB 명령 기록 조회 API
+
+    Args:
+        limit: 최대 개수
+        operation: 컬렉션 메서드
+
+    Returns:
+        느린 명령 기록 (최신순)
+    """
+    data = await SlowQueryService.get_slow_queries(limit, operation)
+
+    return SlowQueryListResponse(
+        status_code=HTTP_200_OK, detail="느린 명령 기록 조회 성공", data=data
+    )
+
+
+@router.get("/profiles", tags=["Admin"], response_model=ProfileListResponse)
+async def get_profiles(
+    limit: int = Query(default=100, ge=1, le=1000, description="최대 개수"),
+):
+    """요청 프로파일 목록 조회 API
+
+    관리자 토큰과 X-Profile 헤더(sample, cprofile)를 함께 보낸 요청이 프로파일링되고,
+    응답의 X-Profile-Id 헤더로 프로파일 ID를 알려준다.
+
+    Args:
+        limit: 최대 개수
+
+    Returns:
+        프로파일 목록 (최신순)
+    """
+    data = await ProfileService.get_profiles(limit)
+
+    return ProfileListResponse(
+        status_code=HTTP_200_OK, detail="프로파일 목록 조회 성공", data=data
+    )
+
+
+@router.get("/profiles/{profile_id}", tags=["Admin"])
+async def download_profile(profile_id: str = Path(..., description="프로파일 ID")):
+    """요청 프로파일 내려받기 API
+
+    sample은 collapsed stack(.folded, flamegraph.pl / speedscope),
+    cprofile은 pstats(.prof, snakeviz / python -m pstats) 파일이다.
+
+    Args:
+        profile_id: 프로파일 ID
+
+    Returns:
+        프로파일 파일
+    """
+    profile = await ProfileService.get_profile_file(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+
+    content, filename, media_type = profile
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,6 +1,18 @@
 """입찰 데이터 API Router"""
 
-from fastapi import APIRouter, UploadFile, File, Query, Path, HTTPException
+from typing import Literal
+
+from fastapi import (
+    APIRouter,
+    UploadFile,
+    File,
+    Query,
+    Path,
+    HTTPException,
+    Depends,
+    Request,
+)
+from fastapi.responses import StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
@@ -9,54 +21,345 @@ from starlette.status import (
 
 from app.responses.bid_response import (
     BidUploadResponse,
+    BidBatchUploadResponse,
+    BidUploadSessionResponse,
     BidResponse,
     BidListResponse,
+    BidStatsResponse,
+    BidHistogramResponse,
+    BidSeriesResponse,
+    BidBatchLookupResponse,
+)
+from app.requests.bid_request import (
+    BidCreateRequest,
+    BidUpdateRequest,
+    BidFilterRequest,
+    BidBatchLookupRequest,
+    BidUploadSessionCreateRequest,
 )
-from app.requests.bid_request import BidCreateRequest, BidUpdateRequest
+from app.core.admission import upload_admission, aggregation_admission
 from app.services.bid_service import BidService
+from app.services.bid_upload_session_service import BidUploadSessionService
 from app.base.base_response import BaseResponse
 
 router = APIRouter(prefix="/bid", tags=["Bid"])
 
 
 @router.post("/upload", tags=["Bid"])
-async def upload_bid_data(file: UploadFile = File(...)):
+async def upload_bid_data(
+    file: UploadFile = File(...),
+    mode: Literal["upsert", "replace"] = Query(
+        default="upsert",
+        description="upsert: 공고번호 기준 추가/수정, replace: 전체 데이터 교체",
+    ),
+):
     """입찰 데이터 업로드 API
 
     Args:
-        file: 업로드할 엑셀 파일 (.xls 또는 .xlsx)
+        file: 업로드할 엑셀/CSV 파일 (xlsx, xls, xlsb, ods, csv)
+        mode: 저장 방식 (upsert, replace)
 
     Returns:
         저장된 개수, 중복된 데이터 정보
     """
-    data = await BidService.upload_bid_data(file)
+    async with upload_admission.slot():
+        data = await BidService.upload_bid_data(file, mode)
+
+    return BidUploadResponse(
+        status_code=HTTP_200_OK, detail="입찰 데이터 업로드 성공", data=data
+    )
+
+
+@router.post("/upload/batch", tags=["Bid"], response_model=BidBatchUploadResponse)
+async def upload_bid_files(files: list[UploadFile] = File(...)):
+    """여러 파일 / ZIP 입찰 데이터 업로드 API
+
+    Args:
+        files: 업로드할 엑셀/CSV 파일 또는 ZIP 파일 (공고번호가 겹치면 뒤 파일 우선)
+
+    Returns:
+        파일별 결과와 전체 저장 결과
+    """
+    async with upload_admission.slot():
+        data = await BidService.upload_bid_files(files)
+
+    return BidBatchUploadResponse(
+        status_code=HTTP_200_OK, detail="입찰 데이터 업로드 성공", data=data
+    )
+
+
+@router.post("/upload/sessions", tags=["Bid"], response_model=BidUploadSessionResponse)
+async def create_upload_session(
+    request: BidUploadSessionCreateRequest = BidUploadSessionCreateRequest(),
+):
+    """분할 업로드 세션 생성 API
+
+    Args:
+        request: 파일명, 전체 크기 (선택)
+
+    Returns:
+        업로드 ID와 받은 크기(offset)
+    """
+    data = await BidUploadSessionService.create_session(request)
+
+    return BidUploadSessionResponse(
+        status_code=HTTP_201_CREATED, detail="업로드 세션 생성 성공", data=data
+    )
+
+
+@router.get(
+    "/upload/sessions/{upload_id}",
+    tags=["Bid"],
+    response_model=BidUploadSessionResponse,
+)
+async def get_upload_session(upload_id: str = Path(..., description="업로드 ID")):
+    """분할 업로드 세션 조회 API (재개할 offset 확인)
+
+    Args:
+        upload_id: 업로드 ID
+
+    Returns:
+        받은 크기(offset)
+    """
+    data = await BidUploadSessionService.get_session(upload_id)
+
+    return BidUploadSessionResponse(
+        status_code=HTTP_200_OK, detail="업로드 세션 조회 성공", data=data
+    )
+
+
+@router.put(
+    "/upload/sessions/{upload_id}",
+    tags=["Bid"],
+    response_model=BidUploadSessionResponse,
+)
+async def append_upload_chunk(
+    request: Request,
+    upload_id: str = Path(..., description="업로드 ID"),
+    offset: int = Query(
+        ..., ge=0, description="청크 시작 위치 (받은 크기와 같아야 함)"
+    ),
+):
+    """분할 업로드 청크 전송 API (요청 본문이 청크 바이트)
+
+    Args:
+        request: 요청 (본문을 스트리밍으로 읽음)
+        upload_id: 업로드 ID
+        offset: 청크 시작 위치
+
+    Returns:
+        갱신된 offset
+    """
+    data = await BidUploadSessionService.append_chunk(
+        upload_id, offset, request.stream()
+    )
+
+    return BidUploadSessionResponse(
+        status_code=HTTP_200_OK, detail="청크 저장 성공", data=data
+    )
+
+
+@router.post(
+    "/upload/sessions/{upload_id}/complete",
+    tags=["Bid"],
+    response_model=BidUploadResponse,
+)
+async def complete_upload_session(
+    upload_id: str = Path(..., description="업로드 ID"),
+    mode: Literal["upsert", "replace"] = Query(
+        default="upsert",
+        description="upsert: 공고번호 기준 추가/수정, replace: 전체 데이터 교체",
+    ),
+):
+    """분할 업로드 완료 API (받은 파일을 저장)
+
+    Args:
+        upload_id: 업로드 ID
+        mode: 저장 방식 (upsert, replace)
+
+    Returns:
+        저장 결과
+    """
+    async with upload_admission.slot():
+        data = await BidUploadSessionService.complete_session(upload_id, mode)
 
     return BidUploadResponse(
         status_code=HTTP_200_OK, detail="입찰 데이터 업로드 성공", data=data
     )
 
 
+@router.delete(
+    "/upload/sessions/{upload_id}", tags=["Bid"], response_model=BaseResponse
+)
+async def delete_upload_session(upload_id: str = Path(..., description="업로드 ID")):
+    """분할 업로드 세션 취소 API
+
+    Args:
+        upload_id: 업로드 ID
+
+    Returns:
+        삭제 결과
+    """
+    await BidUploadSessionService.delete_session(upload_id)
+
+    return BaseResponse(
+        status_code=HTTP_200_OK, detail="업로드 세션 삭제 성공", data={"success": True}
+    )
+
+
 @router.get("", tags=["Bid"], response_model=BidListResponse)
 async def get_bids(
     page: int = Query(default=1, ge=1, description="페이지 번호 (1부터 시작)"),
     size: int = Query(default=100, ge=1, le=1000, description="페이지 크기"),
+    filters: BidFilterRequest = Depends(),
 ):
     """입찰 문서 목록 조회 API
 
     Args:
         page: 페이지 번호
         size: 페이지 크기
+        filters: 조회 필터 (지역, 업종, 발주기관, 입찰일 범위)
 
     Returns:
         입찰 문서 목록
     """
-    data = await BidService.get_bids(page=page, size=size)
+    data = await BidService.get_bids(page=page, size=size, filters=filters)
 
     return BidListResponse(
         status_code=HTTP_200_OK, detail="입찰 목록 조회 성공", data=data
     )
 
 
+@router.get("/stats", tags=["Bid"], response_model=BidStatsResponse)
+async def get_bid_stats(
+    group_by: list[Literal["region", "industry", "ordering_agency", "month"]] = Query(
+        default=["region"], description="그룹 기준 필드 (여러 개 지정 가능)"
+    ),
+    region: str | None = Query(default=None, description="지역"),
+    industry: str | None = Query(default=None, description="업종"),
+    ordering_agency: str | None = Query(default=None, description="발주기관"),
+    month_from: str | None = Query(
+        default=None, pattern=r"^\d{4}-\d{2}$", description="시작 월 (YYYY-MM)"
+    ),
+    month_to: str | None = Query(
+        default=None, pattern=r"^\d{4}-\d{2}$", description="종료 월 (YYYY-MM)"
+    ),
+):
+    """세그먼트 통계 조회 API
+
+    지역/업종/발주기관/월 단위 롤업에서 비율 필드의 건수, 평균, 중앙값, p10, p90을 계산
+
+    Args:
+        group_by: 그룹 기준 필드
+        region: 지역
+        industry: 업종
+        ordering_agency: 발주기관
+        month_from: 시작 월
+        month_to: 종료 월
+
+    Returns:
+        그룹별 통계
+    """
+    async with aggregation_admission.slot():
+        data = await BidService.get_bid_stats(
+            group_by=list(dict.fromkeys(group_by)),
+            region=region,
+            industry=industry,
+            ordering_agency=ordering_agency,
+            month_from=month_from,
+            month_to=month_to,
+        )
+
+    return BidStatsResponse(
+        status_code=HTTP_200_OK, detail="입찰 통계 조회 성공", data=data
+    )
+
+
+@router.post("/stats/rebuild", tags=["Bid"], response_model=BaseResponse)
+async def rebuild_bid_stats():
+    """세그먼트 통계 롤업 재계산 API
+
+    Returns:
+        재계산에 사용된 입찰 문서 개수
+    """
+    async with aggregation_admission.slot():
+        bid_count = await BidService.rebuild_bid_stats()
+
+    return BaseResponse(
+        status_code=HTTP_200_OK,
+        detail="입찰 통계 재계산 성공",
+        data={"bid_count": bid_count},
+    )
+
+
+@router.get("/histogram", tags=["Bid"], response_model=BidHistogramResponse)
+async def get_bid_histogram(
+    field: Literal[
+        "base_to_winning_ratio",
+        "expected_to_winning_ratio",
+        "estimated_to_winning_ratio",
+    ] = Query(default="base_to_winning_ratio", description="비율 필드"),
+    bin_width: float = Query(default=0.001, gt=0, description="구간 폭"),
+    lower: float | None = Query(default=None, description="범위 하한"),
+    upper: float | None = Query(default=None, description="범위 상한 (포함)"),
+    filters: BidFilterRequest = Depends(),
+):
+    """비율 분포 히스토그램 API
+
+    원본 행 대신 구간별 건수만 반환
+
+    Args:
+        field: 비율 필드
+        bin_width: 구간 폭
+        lower: 범위 하한 (없으면 데이터 최소값)
+        upper: 범위 상한 (없으면 데이터 최대값)
+        filters: 조회 필터 (목록 조회와 동일)
+
+    Returns:
+        구간별 건수
+    """
+    async with aggregation_admission.slot():
+        data = await BidService.get_bid_histogram(
+            field=field, bin_width=bin_width, lower=lower, upper=upper, filters=filters
+        )
+
+    return BidHistogramResponse(
+        status_code=HTTP_200_OK, detail="입찰 분포 조회 성공", data=data
+    )
+
+
+@router.get("/series", tags=["Bid"], response_model=BidSeriesResponse)
+async def get_bid_series(
+    field: Literal[
+        "base_to_winning_ratio",
+        "expected_to_winning_ratio",
+        "estimated_to_winning_ratio",
+    ] = Query(default="base_to_winning_ratio", description="비율 필드"),
+    points: int = Query(default=1000, ge=3, le=10000, description="최대 점 개수"),
+    filters: BidFilterRequest = Depends(),
+):
+    """차트용 다운샘플링 시계열 API
+
+    입찰일 순 비율 값을 LTTB로 지정한 점 개수 이하로 줄여 반환
+
+    Args:
+        field: 비율 필드
+        points: 최대 점 개수
+        filters: 조회 필터 (목록 조회와 동일)
+
+    Returns:
+        다운샘플링된 시계열
+    """
+    async with aggregation_admission.slot():
+        data = await BidService.get_bid_series(
+            field=field, points=points, filters=filters
+        )
+
+    return BidSeriesResponse(
+        status_code=HTTP_200_OK, detail="입찰 시계열 조회 성공", data=data
+    )
+
+
 @router.get("/id/{bid_id}", tags=["Bid"], response_model=BidResponse)
 async def get_bid_by_id(bid_id: str = Path(..., description="입찰 문서 ID")):
     """ID로 입찰 문서 조회 API
@@ -101,6 +404,50 @@ async def get_bid_by_announcement_number(
     return BidResponse(status_code=HTTP_200_OK, detail="입찰 조회 성공", data=data)
 
 
+@router.post("/batch", tags=["Bid"], response_model=BidBatchLookupResponse)
+async def get_bids_in_batch(request: BidBatchLookupRequest):
+    """입찰 문서 일괄 조회 API
+
+    ID/공고번호 목록을 한 번의 요청으로 조회 (최대 5000개)
+
+    Args:
+        request: 일괄 조회 요청
+
+    Returns:
+        조회된 입찰 문서와 찾지 못한 키 리스트
+    """
+    data = await BidService.get_bids_in_batch(request)
+
+    return BidBatchLookupResponse(
+        status_code=HTTP_200_OK, detail="입찰 일괄 조회 성공", data=data
+    )
+
+
+@router.post("/bulk", tags=["Bid"])
+async def bulk_mutate_bids(request: Request):
+    """입찰 문서 NDJSON 일괄 생성/수정/삭제 API
+
+    요청 본문(application/x-ndjson)의 한 줄이 하나의 작업:
+        {"op": "create", "data": {...}}
+        {"op": "update", "id": "...", "data": {...}}
+        {"op": "delete", "id": "..."}
+
+    Args:
+        request: NDJSON 작업 요청
+
+    Returns:
+        작업별 결과 NDJSON 스트림 (마지막 줄은 요약)
+    """
+    # 응답 스트리밍이 시작되면 연결 종료 감지 태스크가 receive를 소비하므로
+    # 본문은 응답을 만들기 전에 모두 읽는다
+    body = await request.body()
+
+    return StreamingResponse(
+        BidService.bulk_mutate_bids(body),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post("", tags=["Bid"], response_model=BaseResponse)
 async def create_bid(request: BidCreateRequest):
     """입찰 문서 생성 API
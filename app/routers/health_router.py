@@ -1,10 +1,13 @@
 """헬스체크 API Router"""
 
 from fastapi import APIRouter
-from starlette.status import HTTP_200_OK
+from fastapi.responses import JSONResponse
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
 
 from app.base.base_response import BaseResponse
-from app.db.mongo_db import db
+from app.core.health import HealthMonitor
+from app.db.mongo_db import MongoDB
+from app.responses.health_response import HealthReadinessResponse
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -21,7 +24,7 @@ async def health_check():
 async def health_check_db():
     """DB 헬스체크 API"""
     try:
-        await db.command("ping")  # MongoDB에 ping 명령어 전송
+        await MongoDB.get_database().command("ping")  # MongoDB에 ping 명령어 전송
         return BaseResponse(
             status_code=HTTP_200_OK,
             detail="DB 헬스체크 성공",
@@ -31,3 +34,33 @@ async def health_check_db():
         return BaseResponse(
             status_code=500, detail="DB 헬스체크 실패", data={"error": str(e)}
         )
+
+
+@router.get("/live", tags=["Health"])
+async def health_live():
+    """liveness API (이벤트 루프가 응답하면 성공, 외부 의존성은 확인하지 않음)"""
+    return BaseResponse(
+        status_code=HTTP_200_OK, detail="liveness 성공", data={"status": "alive"}
+    )
+
+
+@router.get("/ready", tags=["Health"], response_model=HealthReadinessResponse)
+async def health_ready():
+    """readiness API
+
+    주기적으로 저장한 MongoDB ping 지연, 커넥션 풀 사용률, 이벤트 루프 지연, 무거운 작업 대기를 보고
+    준비되지 않았으면 로드 밸런서가 다른 워커로 보내도록 HTTP 503을 돌려준다.
+    """
+    readiness = HealthMonitor.readiness()
+    if readiness.ready:
+        return HealthReadinessResponse(
+            status_code=HTTP_200_OK, detail="readiness 성공", data=readiness
+        )
+    return JSONResponse(
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        content=HealthReadinessResponse(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청을 받을 준비가 되지 않았습니다",
+            data=readiness,
+        ).model_dump(mode="json"),
+    )
@@ -0,0 +1,14 @@
+"""Prometheus 지표 API Router"""
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", tags=["Metrics"], include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표 API (모든 워커 합산)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,20 @@
+"""프론트 정적 파일 Router"""
+
+from fastapi import APIRouter, Request
+
+from app.core.static_assets import INDEX_NAME, StaticAssets
+
+router = APIRouter(tags=["Static"])
+
+
+# 처음 요청 시 빌드할 수 있으므로 스레드 풀에서 실행 (def)
+@router.get("/", include_in_schema=False)
+def read_root(request: Request):
+    """루트 경로에서 차트 페이지 제공 (ETag 재검증)"""
+    return StaticAssets.response(INDEX_NAME, request)
+
+
+@router.get("/static/{name}", include_in_schema=False)
+def read_static(name: str, request: Request):
+    """해시 파일명 정적 파일 제공 (immutable 캐시)"""
+    return StaticAssets.response(name, request)
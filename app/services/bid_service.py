@@ -1,99 +1,532 @@
-import pandas as pd
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+import uuid
+import zipfile
+import zlib
 from fastapi import UploadFile, HTTPException
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from datetime import datetime, timedelta, timezone
+from collections import Counter, defaultdict
+from typing import AsyncIterator, Iterator
+from pydantic import ValidationError
+from pymongo.errors import DuplicateKeyError
 
-from app.responses.bid_response import BidUploadData, BidData, BidListData
-from app.requests.bid_request import BidCreateRequest, BidUpdateRequest
+from app.responses.bid_response import (
+    BidUploadData,
+    BidUploadFileData,
+    BidBatchUploadData,
+    BidData,
+    BidListData,
+    BidStatsData,
+    BidStatsGroupData,
+    RatioStatsData,
+    BidHistogramData,
+    BidSeriesData,
+    BidSeriesPointData,
+    BidBatchLookupData,
+)
+from app.requests.bid_request import (
+    BidCreateRequest,
+    BidUpdateRequest,
+    BidFilterRequest,
+    BidBatchLookupRequest,
+    BidBulkOperationRequest,
+)
 from app.collections.bid_collection import BidCollection
-from app.documents.bid_document import BidDocument
+from app.collections.bid_stats_collection import BidStatsCollection
+from app.collections.bid_upload_collection import BidUploadCollection
+from app.core.settings import settings
+from app.core.tracing import span
+from app.documents.bid_document import BidDocument, RATIO_FIELDS
+from app.documents.bid_mutation import BidMutation
+from app.readers.table_reader import TableReader, ZIP_MAGIC
 from app.utils.bid_utils import BidUtils
+from app.utils.stats_utils import StatsUtils
+
+logger = logging.getLogger(__name__)
+
+# NDJSON 일괄 변경 시 한 번의 bulk_write로 보낼 최대 작업 개수
+BULK_BATCH_SIZE = 1000
+
+# 히스토그램 최대 구간 개수
+MAX_HISTOGRAM_BINS = 2000
+
+# 업로드 저장 시 한 번의 bulk_write로 보낼 최대 문서 개수 / 동시에 보낼 청크 개수
+UPLOAD_WRITE_CHUNK_SIZE = 5000
+UPLOAD_WRITE_CONCURRENCY = 4
+
+# 다른 워커가 같은 파일을 처리 중일 때 완료 여부를 확인하는 간격 (초)
+UPLOAD_POLL_INTERVAL_SECONDS = 0.5
 
 
 class BidService:
+    # 이 워커에서 처리 중인 업로드 (파일 digest -> 처리 작업)
+    _running_uploads: dict[str, asyncio.Future] = {}
+
     @classmethod
-    async def upload_bid_data(cls, uploaded_file: UploadFile) -> BidUploadData:
+    async def upload_bid_data(
+        cls, uploaded_file: UploadFile, mode: str = "upsert"
+    ) -> BidUploadData:
         """엑셀 파일 업로드 및 MongoDB 저장
 
+        같은 내용의 파일이 이미 처리됐으면 저장된 결과를 돌려주고,
+        처리 중이면 그 작업이 끝나기를 기다려 같은 결과를 돌려준다.
+        전체 교체는 컬렉션을 파일 내용과 같게 만드는 작업이므로 처리 중인 작업에만 합류하고
+        이미 처리된 파일이어도 다시 교체한다.
+
         Args:
             uploaded_file: 업로드된 엑셀 파일
+            mode: upsert (공고번호 기준 추가/수정) 또는 replace (전체 교체)
 
         Returns:
             저장 결과 (저장 개수, 중복 개수, 중복 리스트)
         """
-        # 파일 확장자 검증
-        if not uploaded_file.filename.endswith((".xls", ".xlsx")):
+        return await cls.upload_bid_contents(await uploaded_file.read(), mode)
+
+    @classmethod
+    async def upload_bid_contents(
+        cls, contents: bytes, mode: str = "upsert"
+    ) -> BidUploadData:
+        """업로드 파일 내용 저장 (같은 파일은 한 번만 처리)
+
+        Args:
+            contents: 엑셀/CSV 파일 내용
+            mode: upsert (공고번호 기준 추가/수정) 또는 replace (전체 교체)
+
+        Returns:
+            저장 결과
+        """
+        # 파일 형식 검증 (확장자가 아닌 내용으로 판별)
+        if TableReader.sniff(contents) is None:
             raise HTTPException(
-                status_code=400, detail="엑셀 파일만 업로드 가능합니다."
+                status_code=400,
+                detail="엑셀 파일만 업로드 가능합니다. (xlsx, xls, xlsb, ods, csv)",
             )
 
+        # 같은 파일이라도 모드가 다르면 다른 작업
+        digest = f"{mode}:{hashlib.sha256(contents).hexdigest()}"
+
+        # 같은 워커에서 처리 중인 파일이면 그 작업에 합류
+        running = cls._running_uploads.get(digest)
+        if running is None:
+            running = asyncio.ensure_future(cls._upload_once(digest, contents, mode))
+            cls._running_uploads[digest] = running
+            running.add_done_callback(lambda _: cls._running_uploads.pop(digest, None))
+
+        # 요청이 취소돼도 처리 작업은 끝까지 진행
+        return await asyncio.shield(running)
+
+    @classmethod
+    async def _upload_once(
+        cls, digest: str, contents: bytes, mode: str
+    ) -> BidUploadData:
+        """파일 digest 단위로 한 번만 처리 (다른 워커와는 처리 기록으로 조율)
+
+        전체 교체는 이미 끝난 처리 기록을 재사용하지 않고, 다른 워커가 처리 중일 때만 그 결과를 기다린다.
+        """
+        timeout = timedelta(seconds=settings.UPLOAD_PROCESSING_TIMEOUT_SECONDS)
+        owner = uuid.uuid4().hex
+        joined = False
+        while True:
+            stale_before = datetime.now(timezone.utc) - timeout
+            take_done = mode == "replace" and not joined
+            if await BidUploadCollection.claim(digest, stale_before, owner, take_done):
+                break
+
+            record = await BidUploadCollection.find_by_digest(digest)
+            if record and record.status == "done":
+                return BidUploadData(**record.result)
+            joined = True
+            await asyncio.sleep(UPLOAD_POLL_INTERVAL_SECONDS)
+
+        heartbeat = asyncio.create_task(cls._keep_upload_claim(digest, owner))
         try:
-            # 파일 읽기 (날짜 자동 파싱 방지)
-            contents = await uploaded_file.read()
-            df = pd.read_excel(BytesIO(contents), dtype=str)
+            try:
+                data = await cls._store_table(contents, mode)
+            except Exception as e:
+                await BidUploadCollection.mark_failed(digest, owner, str(e))
+                raise
+
+            await BidUploadCollection.mark_done(digest, owner, data.model_dump())
+            return data
+        finally:
+            heartbeat.cancel()
+
+    @classmethod
+    async def _keep_upload_claim(cls, digest: str, owner: str):
+        """처리하는 동안 처리 기록 갱신 시각 연장 (다른 워커가 중단된 처리로 보고 가져가지 않도록)"""
+        while True:
+            await asyncio.sleep(settings.UPLOAD_PROCESSING_TIMEOUT_SECONDS / 3)
+            try:
+                await BidUploadCollection.touch(digest, owner)
+            except Exception as e:
+                # 일시적인 오류는 다음 주기에 다시 연장
+                logger.warning("업로드 처리 기록 연장 실패 (%s): %s", digest, e)
+
+    @classmethod
+    async def _store_table(cls, contents: bytes, mode: str) -> BidUploadData:
+        """엑셀/CSV 파일 파싱 후 MongoDB에 일괄 저장
+
+        파싱은 파싱 워커 프로세스에서 실행해 처리하는 동안에도 이벤트 루프가 다른 요청에 응답하게 한다.
+
+        Args:
+            contents: 파일 내용
+            mode: upsert 또는 replace
+
+        Returns:
+            저장 결과
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            # 워커 프로세스 안의 span은 기록되지 않으므로 파싱 전체를 하나의 span으로 기록
+            with span("BidService.parse_file", bytes=len(contents)) as parse_span:
+                bid_documents = await loop.run_in_executor(
+                    cls._get_parse_executor(), cls.parse_table, contents
+                )
+                parse_span.set_attribute("documents", len(bid_documents))
+        except Exception as e:
+            # 포맷 판별은 통과했지만 잘리거나 손상된 파일
+            raise HTTPException(
+                status_code=400, detail=f"파일 처리 중 오류 발생: {str(e)}"
+            )
+        if mode == "replace" and not bid_documents:
+            raise HTTPException(status_code=400, detail="전체 교체할 데이터가 없습니다")
+
+        try:
+            if mode == "replace":
+                return await cls._replace_documents(bid_documents)
+            return await cls._store_documents(bid_documents)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"파일 처리 중 오류 발생: {str(e)}"
+            )
+
+    @classmethod
+    def parse_table(cls, contents: bytes) -> list[BidDocument]:
+        """엑셀/CSV 파일을 입찰 문서 리스트로 파싱 (파싱 워커 프로세스에서도 사용)
+
+        Args:
+            contents: 파일 내용
+
+        Returns:
+            입찰 문서 리스트 (파싱 실패 행 제외)
+        """
+        with span("BidService.parse_table", bytes=len(contents)):
+            # 파일 읽기 (모든 셀을 문자열로)
+            with span("TableReader.read") as read_span:
+                df = TableReader.read(contents)
+                read_span.set_attribute("rows", len(df))
 
             # 데이터 파싱
-            bid_documents = []
+            with span("BidService.validate_rows", rows=len(df)) as validate_span:
+                bid_documents = cls._rows_to_documents(df)
+                validate_span.set_attribute("documents", len(bid_documents))
+                validate_span.set_attribute("skipped", len(df) - len(bid_documents))
+
+        return bid_documents
+
+    @classmethod
+    def _rows_to_documents(cls, df) -> list[BidDocument]:
+        """표의 각 행을 입찰 문서로 변환 (공고번호가 없거나 파싱에 실패한 행 제외)"""
+        bid_documents = []
+
+        for _, row in df.iterrows():
+            try:
+                # 공고번호가 없으면 스킵
+                announcement_number = BidUtils.parse_string(row["공고번호"])
+                if not announcement_number:
+                    continue
+
+                bid_doc = BidDocument(
+                    number=BidUtils.parse_optional_float(row["번호"]),
+                    type=BidUtils.parse_string(row["타입"]),
+                    participation_deadline=BidUtils.parse_optional_int(row["참가마감"]),
+                    bid_deadline=BidUtils.parse_datetime(row["투찰마감"]),
+                    bid_date=BidUtils.parse_datetime(row["입찰일"]),
+                    ordering_agency=BidUtils.parse_string(row["발주기관"]),
+                    announcement_name=BidUtils.parse_string(row["공고명"]),
+                    announcement_number=announcement_number,
+                    industry=BidUtils.parse_string(row["업종"]),
+                    region=BidUtils.parse_string(row["지역"]),
+                    estimated_price=BidUtils.parse_integer(row["추정가격"]),
+                    base_amount=BidUtils.parse_integer(row["기초금액"]),
+                    first_place_company=BidUtils.parse_string(row["1순위업체"]),
+                    winning_bid_amount=BidUtils.parse_integer(row["낙찰금액"]),
+                    expected_price=BidUtils.parse_integer(row["예정가격"]),
+                    expected_adjustment=BidUtils.parse_ratio(row["예정사정"]),
+                    base_to_winning_ratio=BidUtils.parse_ratio(row["기초/낙찰"]),
+                    expected_to_winning_ratio=BidUtils.parse_ratio(row["예정/낙찰"]),
+                    estimated_to_winning_ratio=BidUtils.parse_ratio(row["추정/낙찰"]),
+                )
+                bid_documents.append(bid_doc)
+
+            except Exception as e:
+                # 개별 row 파싱 실패는 로깅만 하고 계속 진행
+                print(
+                    f"Row 파싱 실패 (공고번호: {row.get('공고번호', 'N/A')}): {str(e)}"
+                )
+                continue
+
+        return bid_documents
+
+    @classmethod
+    async def _store_documents(cls, bid_documents: list[BidDocument]) -> BidUploadData:
+        """입찰 문서를 청크 단위 bulk upsert로 저장 (청크를 동시에 최대 N개 전송)
+
+        Args:
+            bid_documents: 저장할 입찰 문서 리스트
+
+        Returns:
+            전체 저장 결과
+        """
+        # 청크끼리 공고번호가 겹치지 않도록 먼저 중복 제거 (마지막 행 기준)
+        unique_documents = list(
+            {doc.announcement_number: doc for doc in bid_documents}.values()
+        )
+        chunks = [
+            unique_documents[i : i + UPLOAD_WRITE_CHUNK_SIZE]
+            for i in range(0, len(unique_documents), UPLOAD_WRITE_CHUNK_SIZE)
+        ] or [[]]
+
+        semaphore = asyncio.Semaphore(UPLOAD_WRITE_CONCURRENCY)
+
+        async def write(index: int, chunk: list[BidDocument]):
+            async with semaphore:
+                with span(
+                    "BidService.write_chunk", chunk_index=index, batch_size=len(chunk)
+                ):
+                    return await BidCollection.bulk_insert_bids(chunk)
+
+        data = BidUploadData(
+            inserted_count=0, updated_count=0, updated_list=[], unchanged_count=0
+        )
+        with span(
+            "BidService.store_documents",
+            rows=len(bid_documents),
+            unique_rows=len(unique_documents),
+            chunks=len(chunks),
+        ):
+            for inserted, updated, updated_list, unchanged in await asyncio.gather(
+                *(write(index, chunk) for index, chunk in enumerate(chunks))
+            ):
+                data.inserted_count += inserted
+                data.updated_count += updated
+                data.updated_list.extend(updated_list)
+                data.unchanged_count += unchanged
+        return data
+
+    @classmethod
+    async def _replace_documents(
+        cls, bid_documents: list[BidDocument]
+    ) -> BidUploadData:
+        """전체 입찰 문서 교체 후 통계 롤업 재계산
+
+        Args:
+            bid_documents: 새 입찰 문서 리스트
+
+        Returns:
+            저장 결과 (교체 후 문서 개수를 inserted_count로 반환)
+        """
+        loaded_count = await BidCollection.replace_all_bids(bid_documents)
+        await cls.rebuild_bid_stats()
+
+        return BidUploadData(
+            inserted_count=loaded_count,
+            updated_count=0,
+            updated_list=[],
+            unchanged_count=0,
+        )
+
+    # 여러 파일 업로드용 파싱 워커 프로세스 풀 (처음 사용할 때 생성)
+    _parse_executor: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def _get_parse_executor(cls) -> ProcessPoolExecutor:
+        """파싱 워커 프로세스 풀
+
+        이벤트 루프와 MongoDB 클라이언트 스레드가 있는 프로세스를 fork하지 않도록 spawn을 사용한다.
+        """
+        if cls._parse_executor is None:
+            cls._parse_executor = ProcessPoolExecutor(
+                max_workers=settings.UPLOAD_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return cls._parse_executor
+
+    @classmethod
+    def shutdown_parse_executor(cls):
+        """파싱 워커 프로세스 풀 종료"""
+        if cls._parse_executor is not None:
+            cls._parse_executor.shutdown(cancel_futures=True)
+            cls._parse_executor = None
+
+    @classmethod
+    def _extract_archive(
+        cls, filename: str, contents: bytes
+    ) -> list[tuple[str, bytes | ValueError]]:
+        """ZIP 파일에서 표 파일 추출 (파싱 워커 프로세스에서 실행)
+
+        Args:
+            filename: ZIP 파일명
+            contents: ZIP 파일 내용
+
+        Returns:
+            (파일명, 내용) 리스트 (이름순, 지원하지 않거나 압축을 풀 수 없는 파일은 내용 대신 오류)
+
+        Raises:
+            ValueError: ZIP 파일을 열 수 없거나 압축 해제 크기가 너무 큰 경우
+        """
+        try:
+            archive = zipfile.ZipFile(BytesIO(contents))
+        except zipfile.BadZipFile:
+            raise ValueError(f"ZIP 파일을 열 수 없습니다: {filename}")
 
-            for _, row in df.iterrows():
+        with archive:
+            members = sorted(
+                (
+                    info
+                    for info in archive.infolist()
+                    if not info.is_dir()
+                    and not info.filename.startswith("__MACOSX/")
+                    and not os.path.basename(info.filename).startswith(".")
+                ),
+                key=lambda info: info.filename,
+            )
+            if (
+                sum(info.file_size for info in members)
+                > settings.UPLOAD_ARCHIVE_MAX_BYTES
+            ):
+                raise ValueError(f"압축 해제 크기가 너무 큽니다: {filename}")
+
+            sources = []
+            for info in members:
+                name = f"{filename}/{info.filename}"
                 try:
-                    # 공고번호가 없으면 스킵
-                    announcement_number = BidUtils.parse_string(row["공고번호"])
-                    if not announcement_number:
-                        continue
-
-                    bid_doc = BidDocument(
-                        number=BidUtils.parse_optional_float(row["번호"]),
-                        type=BidUtils.parse_string(row["타입"]),
-                        participation_deadline=BidUtils.parse_optional_int(
-                            row["참가마감"]
-                        ),
-                        bid_deadline=BidUtils.parse_datetime(row["투찰마감"]),
-                        bid_date=BidUtils.parse_datetime(row["입찰일"]),
-                        ordering_agency=BidUtils.parse_string(row["발주기관"]),
-                        announcement_name=BidUtils.parse_string(row["공고명"]),
-                        announcement_number=announcement_number,
-                        industry=BidUtils.parse_string(row["업종"]),
-                        region=BidUtils.parse_string(row["지역"]),
-                        estimated_price=BidUtils.parse_integer(row["추정가격"]),
-                        base_amount=BidUtils.parse_integer(row["기초금액"]),
-                        first_place_company=BidUtils.parse_string(row["1순위업체"]),
-                        winning_bid_amount=BidUtils.parse_integer(row["낙찰금액"]),
-                        expected_price=BidUtils.parse_integer(row["예정가격"]),
-                        expected_adjustment=BidUtils.parse_ratio(row["예정사정"]),
-                        base_to_winning_ratio=BidUtils.parse_ratio(row["기초/낙찰"]),
-                        expected_to_winning_ratio=BidUtils.parse_ratio(
-                            row["예정/낙찰"]
-                        ),
-                        estimated_to_winning_ratio=BidUtils.parse_ratio(
-                            row["추정/낙찰"]
-                        ),
+                    data = archive.read(info)
+                except (
+                    zipfile.BadZipFile,
+                    zlib.error,
+                    RuntimeError,
+                    NotImplementedError,
+                ) as e:
+                    # CRC 불일치, 손상된 압축 데이터, 암호화, 지원하지 않는 압축 방식
+                    sources.append((name, ValueError(f"압축 해제 실패: {e}")))
+                    continue
+                sources.append(
+                    (
+                        name,
+                        data
+                        if TableReader.sniff(data)
+                        else ValueError("지원하지 않는 파일 형식입니다"),
                     )
-                    bid_documents.append(bid_doc)
+                )
+            return sources
+
+    @classmethod
+    async def upload_bid_files(
+        cls, uploaded_files: list[UploadFile]
+    ) -> BidBatchUploadData:
+        """여러 엑셀/CSV 파일 또는 ZIP 파일 업로드 및 MongoDB 저장
+
+        파일(ZIP 내부 파일 포함)을 워커 프로세스에서 병렬로 압축 해제 / 파싱하고,
+        공고번호가 겹치면 뒤에 오는 파일의 행으로 병합한 뒤 한 번에 저장한다.
+
+        Args:
+            uploaded_files: 업로드된 파일 리스트 (순서대로 병합)
 
-                except Exception as e:
-                    # 개별 row 파싱 실패는 로깅만 하고 계속 진행
-                    print(
-                        f"Row 파싱 실패 (공고번호: {row.get('공고번호', 'N/A')}): {str(e)}"
+        Returns:
+            파일별 결과와 전체 저장 결과
+        """
+        loop = asyncio.get_running_loop()
+        executor = cls._get_parse_executor()
+
+        sources: list[tuple[str, bytes | ValueError]] = []
+        for uploaded_file in uploaded_files:
+            contents = await uploaded_file.read()
+            if TableReader.sniff(contents):
+                sources.append((uploaded_file.filename, contents))
+            elif contents.startswith(ZIP_MAGIC):
+                try:
+                    sources.extend(
+                        await loop.run_in_executor(
+                            executor,
+                            cls._extract_archive,
+                            uploaded_file.filename,
+                            contents,
+                        )
                     )
-                    continue
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        "엑셀 파일만 업로드 가능합니다. (xlsx, xls, xlsb, ods, csv, zip): "
+                        f"{uploaded_file.filename}"
+                    ),
+                )
 
-            # MongoDB에 bulk upsert (insert + update)
-            (
-                inserted_count,
-                updated_count,
-                updated_list,
-            ) = await BidCollection.bulk_insert_bids(bid_documents)
-
-            return BidUploadData(
-                inserted_count=inserted_count,
-                updated_count=updated_count,
-                updated_list=updated_list,
+        async def parse(contents: bytes | ValueError) -> list[BidDocument]:
+            if isinstance(contents, ValueError):
+                raise contents
+            return await loop.run_in_executor(executor, cls.parse_table, contents)
+
+        # 워커 프로세스 안의 span은 기록되지 않으므로 파일 전체 파싱을 하나의 span으로 기록
+        with span("BidService.parse_files", files=len(sources)):
+            parsed = await asyncio.gather(
+                *(parse(contents) for _, contents in sources), return_exceptions=True
             )
 
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"파일 처리 중 오류 발생: {str(e)}"
+        # 공고번호별로 마지막 파일의 행을 남김
+        merged: dict[str, BidDocument] = {}
+        owners: dict[str, int] = {}
+        for index, documents in enumerate(parsed):
+            if isinstance(documents, BaseException):
+                continue
+            for document in documents:
+                merged[document.announcement_number] = document
+                owners[document.announcement_number] = index
+
+        merged_counts = Counter(owners.values())
+        files = [
+            BidUploadFileData(
+                filename=filename,
+                row_count=0 if isinstance(documents, BaseException) else len(documents),
+                merged_count=merged_counts[index],
+                error=str(documents) if isinstance(documents, BaseException) else None,
             )
+            for index, ((filename, _), documents) in enumerate(zip(sources, parsed))
+        ]
+
+        total = await cls._store_documents(list(merged.values()))
+        return BidBatchUploadData(files=files, total=total)
+
+    @classmethod
+    def _filter_to_query(cls, filters: BidFilterRequest | None) -> dict:
+        """조회 필터를 MongoDB 쿼리로 변환"""
+        if filters is None:
+            return {}
+
+        query: dict = {}
+        for field in ("region", "industry", "ordering_agency"):
+            value = getattr(filters, field)
+            if value:
+                query[field] = value
+
+        if filters.bid_date_from or filters.bid_date_to:
+            query["bid_date"] = {}
+            if filters.bid_date_from:
+                query["bid_date"]["$gte"] = filters.bid_date_from
+            if filters.bid_date_to:
+                query["bid_date"]["$lte"] = filters.bid_date_to
+
+        return query
 
     @classmethod
     def _document_to_data(cls, document: BidDocument) -> BidData:
@@ -122,19 +555,28 @@ class BidService:
         )
 
     @classmethod
-    async def get_bids(cls, page: int = 1, size: int = 100) -> BidListData:
+    async def get_bids(
+        cls, page: int = 1, size: int = 100, filters: BidFilterRequest | None = None
+    ) -> BidListData:
         """입찰 문서 목록 조회
 
         Args:
             page: 페이지 번호 (1부터 시작)
             size: 페이지 크기
+            filters: 조회 필터
 
         Returns:
             입찰 문서 리스트 데이터
         """
         skip = (page - 1) * size
-        documents = await BidCollection.find_all_bids(skip=skip, limit=size)
-        total = await BidCollection.count_all_bids()
+        query = cls._filter_to_query(filters)
+        with span("BidService.get_bids", page=page, size=size, skip=skip) as list_span:
+            documents = await BidCollection.find_all_bids(
+                skip=skip, limit=size, query=query
+            )
+            total = await BidCollection.count_all_bids(query=query)
+            list_span.set_attribute("returned", len(documents))
+            list_span.set_attribute("total", total)
 
         return BidListData(
             total=total,
@@ -178,26 +620,47 @@ class BidService:
         return cls._document_to_data(document)
 
     @classmethod
-    async def create_bid(cls, request: BidCreateRequest) -> str | None:
-        """입찰 문서 생성
+    async def get_bids_in_batch(
+        cls, request: BidBatchLookupRequest
+    ) -> BidBatchLookupData:
+        """ID/공고번호 목록으로 입찰 문서 일괄 조회
 
         Args:
-            request: 입찰 문서 생성 요청
+            request: 일괄 조회 요청
 
         Returns:
-            생성된 문서 ID 또는 None
+            조회된 입찰 문서와 찾지 못한 키 리스트
         """
-        # 중복 체크
-        is_duplicate = await BidCollection.check_duplicate_by_announcement_number(
-            request.announcement_number
+        ids = list(dict.fromkeys(request.ids))
+        announcement_numbers = list(dict.fromkeys(request.announcement_numbers))
+
+        by_id, by_announcement_number = await asyncio.gather(
+            BidCollection.find_bids_by_ids(ids),
+            BidCollection.find_bids_by_announcement_numbers(announcement_numbers),
         )
-        if is_duplicate:
-            raise HTTPException(
-                status_code=400,
-                detail=f"이미 존재하는 공고번호입니다: {request.announcement_number}",
-            )
 
-        bid_document = BidDocument(
+        found_ids = {str(document._id) for document in by_id}
+        found_announcement_numbers = {
+            document.announcement_number for document in by_announcement_number
+        }
+
+        # 두 조건에 모두 걸린 문서는 한 번만 반환
+        documents = {str(doc._id): doc for doc in by_id + by_announcement_number}
+
+        return BidBatchLookupData(
+            items=[cls._document_to_data(doc) for doc in documents.values()],
+            missing_ids=[bid_id for bid_id in ids if bid_id not in found_ids],
+            missing_announcement_numbers=[
+                number
+                for number in announcement_numbers
+                if number not in found_announcement_numbers
+            ],
+        )
+
+    @classmethod
+    def _request_to_document(cls, request: BidCreateRequest) -> BidDocument:
+        """BidCreateRequest를 BidDocument로 변환"""
+        return BidDocument(
             number=request.number,
             type=request.type,
             participation_deadline=request.participation_deadline,
@@ -219,12 +682,44 @@ class BidService:
             estimated_to_winning_ratio=request.estimated_to_winning_ratio,
         )
 
-        inserted_id = await BidCollection.insert_bid(bid_document)
+    @classmethod
+    def _update_fields(cls, request: BidUpdateRequest) -> dict:
+        """업데이트 요청에서 실제로 반영할 필드만 추출
+
+        명시적으로 전달된 필드만 반영하고, 필수 필드에 전달된 null은 무시한다.
+        """
+        return {
+            field: value
+            for field, value in request.model_dump(exclude_unset=True).items()
+            if value is not None
+            or not BidCreateRequest.model_fields[field].is_required()
+        }
+
+    @classmethod
+    async def create_bid(cls, request: BidCreateRequest) -> str | None:
+        """입찰 문서 생성
+
+        Args:
+            request: 입찰 문서 생성 요청
+
+        Returns:
+            생성된 문서 ID 또는 None
+        """
+        bid_document = cls._request_to_document(request)
+
+        # 중복 체크는 공고번호 unique index에 맡김
+        try:
+            inserted_id = await BidCollection.insert_bid(bid_document)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"이미 존재하는 공고번호입니다: {request.announcement_number}",
+            )
         return str(inserted_id) if inserted_id else None
 
     @classmethod
     async def update_bid(cls, bid_id: str, request: BidUpdateRequest) -> bool:
-        """입찰 문서 업데이트
+        """입찰 문서 업데이트 (전달된 필드만 반영)
 
         Args:
             bid_id: 입찰 문서 ID
@@ -233,26 +728,23 @@ class BidService:
         Returns:
             성공 여부
         """
-        # 기존 문서 조회
-        existing_doc = await BidCollection.find_bid_by_id(bid_id)
-        if not existing_doc:
-            raise HTTPException(status_code=404, detail="입찰 문서를 찾을 수 없습니다")
-
-        # 업데이트할 필드만 적용
-        update_data = request.model_dump(exclude_unset=True)
-
-        # 기존 문서 데이터를 dict로 변환
-        import dataclasses
-
-        doc_dict = dataclasses.asdict(existing_doc)
-
-        # 업데이트할 필드 적용
-        doc_dict.update(update_data)
+        update_data = cls._update_fields(request)
 
-        # BidDocument로 재생성
-        updated_document = BidDocument(**doc_dict)
+        # 변경할 필드가 없으면 존재 여부만 확인
+        if not update_data:
+            updated = await BidCollection.find_bid_by_id(bid_id) is not None
+        else:
+            try:
+                updated = await BidCollection.update_bid(bid_id, update_data)
+            except DuplicateKeyError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"이미 존재하는 공고번호입니다: {update_data['announcement_number']}",
+                )
 
-        return await BidCollection.update_bid(bid_id, updated_document)
+        if not updated:
+            raise HTTPException(status_code=404, detail="입찰 문서를 찾을 수 없습니다")
+        return True
 
     @classmethod
     async def delete_bid(cls, bid_id: str) -> bool:
@@ -264,9 +756,393 @@ class BidService:
         Returns:
             성공 여부
         """
-        # 문서 존재 확인
-        existing_doc = await BidCollection.find_bid_by_id(bid_id)
-        if not existing_doc:
+        if not await BidCollection.delete_bid(bid_id):
             raise HTTPException(status_code=404, detail="입찰 문서를 찾을 수 없습니다")
+        return True
+
+    @classmethod
+    async def get_bid_stats(
+        cls,
+        group_by: list[str],
+        region: str | None = None,
+        industry: str | None = None,
+        ordering_agency: str | None = None,
+        month_from: str | None = None,
+        month_to: str | None = None,
+    ) -> BidStatsData:
+        """세그먼트 통계 조회 (롤업 컬렉션 기반)
+
+        Args:
+            group_by: 그룹 기준 필드 (region, industry, ordering_agency, month)
+            region: 지역
+            industry: 업종
+            ordering_agency: 발주기관
+            month_from: 시작 월 (YYYY-MM, 포함)
+            month_to: 종료 월 (YYYY-MM, 포함)
+
+        Returns:
+            그룹별 건수와 비율 통계 (평균, 중앙값, p10, p90)
+        """
+        filters: dict = {}
+        if region:
+            filters["region"] = region
+        if industry:
+            filters["industry"] = industry
+        if ordering_agency:
+            filters["ordering_agency"] = ordering_agency
+        if month_from or month_to:
+            filters["month"] = {}
+            if month_from:
+                filters["month"]["$gte"] = month_from
+            if month_to:
+                filters["month"]["$lte"] = month_to
+
+        stats_documents = await BidStatsCollection.find_stats(filters)
+
+        # 롤업 문서를 그룹 키 기준으로 병합
+        counts: Counter = Counter()
+        sums: dict[tuple, Counter] = defaultdict(Counter)
+        histograms: dict[tuple, dict[str, Counter]] = defaultdict(
+            lambda: defaultdict(Counter)
+        )
+        for document in stats_documents:
+            key = tuple(getattr(document, field) for field in group_by)
+            counts[key] += document.count
+            for field in RATIO_FIELDS:
+                sums[key][field] += document.sums.get(field, 0.0)
+                for bucket, count in document.histograms.get(field, {}).items():
+                    histograms[key][field][int(bucket)] += count
+
+        groups = []
+        for key in sorted(counts):
+            count = counts[key]
+            if count <= 0:
+                continue
+            groups.append(
+                BidStatsGroupData(
+                    group=dict(zip(group_by, key)),
+                    count=count,
+                    ratios={
+                        field: RatioStatsData(
+                            mean=round(sums[key][field] / count, 5),
+                            median=StatsUtils.quantile(histograms[key][field], 0.5),
+                            p10=StatsUtils.quantile(histograms[key][field], 0.1),
+                            p90=StatsUtils.quantile(histograms[key][field], 0.9),
+                        )
+                        for field in RATIO_FIELDS
+                    },
+                )
+            )
+
+        return BidStatsData(
+            group_by=group_by, segment_count=len(stats_documents), groups=groups
+        )
+
+    @classmethod
+    async def rebuild_bid_stats(cls) -> int:
+        """통계 롤업 전체 재계산
+
+        롤업 도입 이전 데이터나 불일치 복구용. 재계산 중의 쓰기는 반영이 누락될 수 있다.
+
+        Returns:
+            재계산에 사용된 입찰 문서 개수
+        """
+        await BidStatsCollection.delete_all()
+
+        bid_count = 0
+        async for documents in BidCollection.iter_all_bids():
+            await BidStatsCollection.apply_changes(added=documents)
+            bid_count += len(documents)
+
+        return bid_count
+
+    @classmethod
+    async def get_bid_histogram(
+        cls,
+        field: str,
+        bin_width: float,
+        lower: float | None = None,
+        upper: float | None = None,
+        filters: BidFilterRequest | None = None,
+    ) -> BidHistogramData:
+        """비율 필드 분포 히스토그램 조회 (DB 집계)
+
+        Args:
+            field: 비율 필드명
+            bin_width: 구간 폭
+            lower: 범위 하한 (없으면 데이터 최소값)
+            upper: 범위 상한 (없으면 데이터 최대값)
+            filters: 조회 필터
+
+        Returns:
+            구간별 건수
+        """
+        query = cls._filter_to_query(filters)
+        if lower is None or upper is None:
+            value_range = await BidCollection.find_value_range(field, query=query)
+            if value_range is None:
+                return BidHistogramData(
+                    field=field,
+                    lower=lower or 0.0,
+                    upper=upper or 0.0,
+                    bin_width=bin_width,
+                    total=0,
+                    counts=[],
+                )
+            lower = value_range[0] if lower is None else lower
+            upper = value_range[1] if upper is None else upper
+
+        if upper < lower:
+            raise HTTPException(
+                status_code=400, detail="범위 상한은 하한보다 커야 합니다"
+            )
+
+        bin_count = max(1, math.ceil(round((upper - lower) / bin_width, 9)))
+        if bin_count > MAX_HISTOGRAM_BINS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"구간 개수가 너무 많습니다 (최대 {MAX_HISTOGRAM_BINS}개)",
+            )
+
+        # 요청 상한까지만 집계하고, 폭이 나누어떨어지지 않으면 마지막 구간이 좁아짐
+        counts = await BidCollection.aggregate_histogram(
+            field=field,
+            lower=lower,
+            upper=upper,
+            bin_width=bin_width,
+            bin_count=bin_count,
+            query=query,
+        )
+
+        return BidHistogramData(
+            field=field,
+            lower=lower,
+            upper=upper,
+            bin_width=bin_width,
+            total=sum(counts),
+            counts=counts,
+        )
+
+    @classmethod
+    async def get_bid_series(
+        cls,
+        field: str,
+        points: int,
+        filters: BidFilterRequest | None = None,
+    ) -> BidSeriesData:
+        """입찰일 기준 비율 시계열 조회 (LTTB 다운샘플링)
+
+        Args:
+            field: 비율 필드명
+            points: 반환할 최대 점 개수
+            filters: 조회 필터
+
+        Returns:
+            다운샘플링된 시계열
+        """
+        dates, values = await BidCollection.find_series(
+            field, query=cls._filter_to_query(filters)
+        )
+        if not dates:
+            return BidSeriesData(field=field, total=0, points=[])
+
+        # numpy는 시계열 조회에서만 쓰므로 여기서 import (워커 시작 시간 / 메모리 절약)
+        import numpy as np
+
+        from app.utils.series_utils import SeriesUtils
+
+        # datetime을 epoch(초) 배열로 변환해 벡터 연산
+        timestamps = np.array(dates, dtype="datetime64[ms]").astype(np.float64)
+        indices = SeriesUtils.lttb(timestamps, np.array(values), points)
+
+        return BidSeriesData(
+            field=field,
+            total=len(dates),
+            points=[
+                BidSeriesPointData(bid_date=dates[index], value=values[index])
+                for index in indices
+            ],
+        )
+
+    @classmethod
+    def _iter_ndjson_lines(cls, body: bytes) -> Iterator[tuple[int, bytes]]:
+        """요청 본문을 (줄 번호, 줄) 단위로 분리 (빈 줄 제외)"""
+        for line_number, line in enumerate(body.split(b"\n"), start=1):
+            if line.strip():
+                yield line_number, line
+
+    @classmethod
+    def _format_validation_error(cls, error: ValidationError) -> str:
+        """pydantic 검증 오류를 한 줄 메시지로 변환"""
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}"
+            for item in error.errors()
+        )
+
+    @classmethod
+    def _parse_bulk_line(cls, line: bytes) -> tuple[str | None, BidMutation | str]:
+        """NDJSON 한 줄을 검증해 BidMutation으로 변환
+
+        Returns:
+            (작업 종류, BidMutation 또는 오류 메시지)
+        """
+        try:
+            operation = BidBulkOperationRequest.model_validate_json(line)
+        except ValidationError as e:
+            return None, cls._format_validation_error(e)
 
-        return await BidCollection.delete_bid(bid_id)
+        try:
+            if operation.op == "create":
+                request = BidCreateRequest.model_validate(operation.data)
+                return operation.op, BidMutation(
+                    op="create", document=cls._request_to_document(request)
+                )
+            if operation.op == "update":
+                request = BidUpdateRequest.model_validate(operation.data or {})
+                return operation.op, BidMutation(
+                    op="update",
+                    bid_id=operation.id,
+                    fields=cls._update_fields(request),
+                )
+        except ValidationError as e:
+            return operation.op, cls._format_validation_error(e)
+
+        return operation.op, BidMutation(op="delete", bid_id=operation.id)
+
+    @classmethod
+    def _mutation_keys(cls, mutation: BidMutation, numbers: dict[str, str]) -> set[str]:
+        """같은 배치에 함께 들어가면 안 되는 작업을 구분하기 위한 키
+
+        수정/삭제는 대상 문서의 현재 공고번호도 키로 써서, 같은 공고번호로 다시 생성하는
+        작업과 한 배치에 들어가지 않도록 한다.
+
+        Args:
+            mutation: 작업
+            numbers: 수정/삭제 대상 ID → 현재 공고번호 (공고번호를 바꾸는 수정이면 갱신)
+        """
+        keys = set()
+        if mutation.bid_id:
+            keys.add(f"id:{mutation.bid_id}")
+            if mutation.bid_id in numbers:
+                keys.add(f"announcement_number:{numbers[mutation.bid_id]}")
+        if mutation.document:
+            keys.add(f"announcement_number:{mutation.document.announcement_number}")
+        if mutation.fields and mutation.fields.get("announcement_number"):
+            keys.add(f"announcement_number:{mutation.fields['announcement_number']}")
+            if mutation.bid_id:
+                numbers[mutation.bid_id] = mutation.fields["announcement_number"]
+        return keys
+
+    @classmethod
+    async def _split_bulk_batches(
+        cls, window: list[tuple[int, str | None, BidMutation | str]]
+    ) -> list[list[tuple[int, str | None, BidMutation | str]]]:
+        """작업 묶음을 같은 문서 / 같은 공고번호를 다루지 않는 배치로 순서대로 나눔
+
+        수정/삭제 대상의 현재 공고번호는 묶음당 한 번 $in으로 조회한다.
+        """
+        target_ids = [
+            item.bid_id
+            for _, _, item in window
+            if isinstance(item, BidMutation) and item.bid_id
+        ]
+        numbers = {
+            str(document._id): document.announcement_number
+            for document in await BidCollection.find_bids_by_ids(target_ids)
+        }
+
+        batches = [[]]
+        batch_keys: set[str] = set()
+        for entry in window:
+            item = entry[2]
+            keys = (
+                cls._mutation_keys(item, numbers)
+                if isinstance(item, BidMutation)
+                else set()
+            )
+            # 같은 문서를 다루는 작업은 순서를 지키기 위해 다음 배치로 넘김
+            if keys & batch_keys:
+                batches.append([])
+                batch_keys = set()
+            batches[-1].append(entry)
+            batch_keys |= keys
+        return batches
+
+    @classmethod
+    async def _run_bulk_batch(
+        cls, batch: list[tuple[int, str | None, BidMutation | str]]
+    ) -> list[dict]:
+        """배치 실행 후 줄 순서대로 작업 결과 생성"""
+        mutations = [item for _, _, item in batch if isinstance(item, BidMutation)]
+        results = iter(
+            await BidCollection.bulk_mutate_bids(mutations) if mutations else []
+        )
+
+        outputs = []
+        for line_number, op, item in batch:
+            if isinstance(item, BidMutation):
+                result = next(results)
+                bid_id, error = result.bid_id, result.error
+            else:
+                bid_id, error = None, item
+            outputs.append(
+                {
+                    "line": line_number,
+                    "op": op,
+                    "status": "error" if error else "ok",
+                    "id": bid_id,
+                    "error": error,
+                }
+            )
+        return outputs
+
+    @classmethod
+    async def bulk_mutate_bids(cls, body: bytes) -> AsyncIterator[str]:
+        """NDJSON 생성/수정/삭제 작업 일괄 처리
+
+        한 줄에 하나의 작업({"op": "create", "data": {...}},
+        {"op": "update", "id": "...", "data": {...}}, {"op": "delete", "id": "..."})을 받아
+        BULK_BATCH_SIZE 단위 unordered bulk_write로 처리하고, 배치가 끝날 때마다
+        작업별 결과를 NDJSON으로 스트리밍한다. 마지막 줄은 요약이다.
+
+        Args:
+            body: NDJSON 요청 본문
+
+        Yields:
+            NDJSON 결과 줄
+        """
+        window: list[tuple[int, str | None, BidMutation | str]] = []
+        summary = Counter()
+
+        async def run_window():
+            outputs = []
+            for batch in await cls._split_bulk_batches(window):
+                outputs.extend(await cls._run_bulk_batch(batch))
+            return outputs
+
+        for line_number, line in cls._iter_ndjson_lines(body):
+            window.append((line_number, *cls._parse_bulk_line(line)))
+            if len(window) < BULK_BATCH_SIZE:
+                continue
+            for output in await run_window():
+                summary[output["status"]] += 1
+                yield json.dumps(output, ensure_ascii=False) + "\n"
+            window = []
+
+        if window:
+            for output in await run_window():
+                summary[output["status"]] += 1
+                yield json.dumps(output, ensure_ascii=False) + "\n"
+
+        yield (
+            json.dumps(
+                {
+                    "summary": {
+                        "total": summary["ok"] + summary["error"],
+                        "succeeded": summary["ok"],
+                        "failed": summary["error"],
+                    }
+                }
+            )
+            + "\n"
+        )
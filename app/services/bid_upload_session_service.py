@@ -0,0 +1,196 @@
+import asyncio
+import fcntl
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from app.core.settings import settings
+from app.requests.bid_request import BidUploadSessionCreateRequest
+from app.responses.bid_response import BidUploadData, BidUploadSessionData
+from app.services.bid_service import BidService
+
+# 업로드 ID 형식 (uuid4 hex)
+UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class BidUploadSessionService:
+    """재개 가능한 분할 업로드 세션
+
+    세션마다 로컬 디스크에 디렉터리(meta.json, data)를 두고, 받은 바이트를 data 파일에 이어 쓴다.
+    받은 크기(offset)는 data 파일 크기이므로 연결이 끊겨도 받은 곳부터 다시 보낼 수 있다.
+    """
+
+    root = Path(settings.UPLOAD_STAGING_DIR)
+
+    @classmethod
+    def _session_dir(cls, upload_id: str) -> Path:
+        """세션 디렉터리 (없는 세션이면 404)"""
+        if not UPLOAD_ID_PATTERN.match(upload_id):
+            raise HTTPException(
+                status_code=404, detail="업로드 세션을 찾을 수 없습니다"
+            )
+        directory = cls.root / upload_id
+        if not (directory / "meta.json").exists():
+            raise HTTPException(
+                status_code=404, detail="업로드 세션을 찾을 수 없습니다"
+            )
+        return directory
+
+    @classmethod
+    def _to_data(cls, upload_id: str, directory: Path) -> BidUploadSessionData:
+        meta = json.loads((directory / "meta.json").read_text())
+        data_path = directory / "data"
+        return BidUploadSessionData(
+            upload_id=upload_id,
+            filename=meta.get("filename"),
+            size=meta.get("size"),
+            offset=data_path.stat().st_size,
+            expires_at=datetime.fromtimestamp(data_path.stat().st_mtime)
+            + timedelta(seconds=settings.UPLOAD_SESSION_TTL_SECONDS),
+        )
+
+    @classmethod
+    def _sweep_expired(cls):
+        """마지막 전송 후 TTL이 지난 세션 삭제"""
+        if not cls.root.exists():
+            return
+        deadline = time.time() - settings.UPLOAD_SESSION_TTL_SECONDS
+        for directory in cls.root.iterdir():
+            data_path = directory / "data"
+            try:
+                if data_path.stat().st_mtime < deadline:
+                    shutil.rmtree(directory, ignore_errors=True)
+            except FileNotFoundError:
+                continue
+
+    @classmethod
+    async def create_session(
+        cls, request: BidUploadSessionCreateRequest
+    ) -> BidUploadSessionData:
+        """업로드 세션 생성
+
+        Args:
+            request: 세션 생성 요청 (파일명, 전체 크기)
+
+        Returns:
+            세션 정보 (offset 0)
+        """
+        if (
+            request.size is not None
+            and request.size > settings.UPLOAD_SESSION_MAX_BYTES
+        ):
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일이 너무 큽니다 (최대 {settings.UPLOAD_SESSION_MAX_BYTES}바이트)",
+            )
+
+        cls._sweep_expired()
+
+        upload_id = uuid.uuid4().hex
+        directory = cls.root / upload_id
+        directory.mkdir(parents=True)
+        (directory / "data").touch()
+        (directory / "meta.json").write_text(
+            json.dumps({"filename": request.filename, "size": request.size})
+        )
+        return cls._to_data(upload_id, directory)
+
+    @classmethod
+    async def get_session(cls, upload_id: str) -> BidUploadSessionData:
+        """업로드 세션 조회 (받은 offset 확인용)"""
+        return cls._to_data(upload_id, cls._session_dir(upload_id))
+
+    @classmethod
+    async def append_chunk(
+        cls, upload_id: str, offset: int, chunks: AsyncIterator[bytes]
+    ) -> BidUploadSessionData:
+        """청크 이어 쓰기
+
+        요청한 offset이 지금까지 받은 크기와 다르면 409와 함께 받은 크기(Upload-Offset)를 알린다.
+        전송 중 연결이 끊겨도 그때까지 받은 바이트는 남는다.
+
+        Args:
+            upload_id: 업로드 ID
+            offset: 이 청크의 시작 위치
+            chunks: 요청 본문 스트림
+
+        Returns:
+            세션 정보 (갱신된 offset)
+        """
+        directory = cls._session_dir(upload_id)
+        meta = json.loads((directory / "meta.json").read_text())
+        limit = (
+            meta["size"]
+            if meta.get("size") is not None
+            else settings.UPLOAD_SESSION_MAX_BYTES
+        )
+
+        with open(directory / "data", "ab") as data_file:
+            try:
+                fcntl.flock(data_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise HTTPException(
+                    status_code=409, detail="같은 세션에 다른 전송이 진행 중입니다"
+                )
+
+            received = os.fstat(data_file.fileno()).st_size
+            if offset != received:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"offset이 맞지 않습니다 (받은 크기: {received})",
+                    headers={"Upload-Offset": str(received)},
+                )
+
+            async for chunk in chunks:
+                if received + len(chunk) > limit:
+                    data_file.flush()
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"선언한 크기를 넘었습니다 (최대 {limit}바이트)",
+                        headers={"Upload-Offset": str(received)},
+                    )
+                data_file.write(chunk)
+                received += len(chunk)
+
+        return cls._to_data(upload_id, directory)
+
+    @classmethod
+    async def complete_session(
+        cls, upload_id: str, mode: str = "upsert"
+    ) -> BidUploadData:
+        """업로드 완료 후 저장 (성공하면 세션 삭제)
+
+        Args:
+            upload_id: 업로드 ID
+            mode: upsert 또는 replace
+
+        Returns:
+            저장 결과
+        """
+        directory = cls._session_dir(upload_id)
+        session = cls._to_data(upload_id, directory)
+        if session.size is not None and session.offset != session.size:
+            raise HTTPException(
+                status_code=409,
+                detail=f"업로드가 끝나지 않았습니다 ({session.offset}/{session.size}바이트)",
+                headers={"Upload-Offset": str(session.offset)},
+            )
+
+        contents = await asyncio.to_thread((directory / "data").read_bytes)
+        data = await BidService.upload_bid_contents(contents, mode)
+
+        shutil.rmtree(directory, ignore_errors=True)
+        return data
+
+    @classmethod
+    async def delete_session(cls, upload_id: str):
+        """업로드 세션 취소"""
+        shutil.rmtree(cls._session_dir(upload_id), ignore_errors=True)
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.collections.profile_collection import ProfileCollection
+from app.documents.profile_document import ProfileDocument
+from app.responses.admin_response import ProfileData
+
+# 프로파일 방식별 파일 확장자 / Content-Type
+PROFILE_FILE_TYPES = {
+    "sample": ("folded", "text/plain; charset=utf-8"),
+    "cprofile": ("prof", "application/octet-stream"),
+}
+
+
+class ProfileService:
+    @classmethod
+    async def save_profile(
+        cls,
+        profile_id: ObjectId,
+        mode: str,
+        method: str,
+        path: str,
+        status: int,
+        duration_ms: float,
+        data: bytes,
+    ):
+        """요청 프로파일 저장 (ProfilingMiddleware에서 호출)
+
+        Args:
+            profile_id: 응답 X-Profile-Id 헤더로 알려준 ID
+            mode: sample 또는 cprofile
+            method: 요청 메서드
+            path: 요청 경로
+            status: 응답 상태 코드
+            duration_ms: 요청 처리 시간 (밀리초)
+            data: 프로파일 내용
+        """
+        await ProfileCollection.insert_profile(
+            ProfileDocument(
+                _id=profile_id,
+                mode=mode,
+                method=method,
+                path=path,
+                status=status,
+                duration_ms=duration_ms,
+                size=len(data),
+                data=data,
+                created_at=datetime.now(),
+            )
+        )
+
+    @classmethod
+    def _document_to_data(cls, document: ProfileDocument) -> ProfileData:
+        return ProfileData(
+            id=str(document.id),
+            mode=document.mode,
+            method=document.method,
+            path=document.path,
+            status=document.status,
+            duration_ms=document.duration_ms,
+            size=document.size,
+            created_at=document.created_at,
+        )
+
+    @classmethod
+    async def get_profiles(cls, limit: int) -> list[ProfileData]:
+        """최근 프로파일 목록 조회 (최신순)"""
+        documents = await ProfileCollection.find_recent(limit)
+        return [cls._document_to_data(document) for document in documents]
+
+    @classmethod
+    async def get_profile_file(cls, profile_id: str) -> tuple[bytes, str, str] | None:
+        """프로파일 파일 조회
+
+        Args:
+            profile_id: 프로파일 ID
+
+        Returns:
+            (내용, 파일명, Content-Type) 또는 None
+        """
+        document = await ProfileCollection.find_profile_by_id(profile_id)
+        if document is None:
+            return None
+        extension, media_type = PROFILE_FILE_TYPES[document.mode]
+        return document.data, f"{profile_id}.{extension}", media_type
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import random
+from typing import Any
+
+from pymongo.errors import PyMongoError
+
+from app.collections.slow_query_collection import SlowQueryCollection
+from app.core.settings import settings
+from app.core.slow_query import SlowCommand, SlowQueryListener
+from app.documents.slow_query_document import SlowQueryDocument
+from app.responses.admin_response import SlowQueryData
+
+logger = logging.getLogger(__name__)
+
+# 대기열에 쌓인 느린 명령을 저장하는 간격 (초)
+SLOW_QUERY_FLUSH_INTERVAL_SECONDS = 1.0
+
+# explain을 실행하지 않는 집계 단계 (결과를 다른 컬렉션에 씀)
+WRITE_STAGES = ("$out", "$merge")
+
+
+class SlowQueryService:
+    @classmethod
+    def _find_key(cls, value: Any, key: str) -> Any:
+        """explain 결과에서 키를 깊이 우선으로 찾기 (find와 aggregate의 결과 구조가 다름)"""
+        if isinstance(value, dict):
+            if key in value:
+                return value[key]
+            value = list(value.values())
+        if isinstance(value, list):
+            for item in value:
+                found = cls._find_key(item, key)
+                if found is not None:
+                    return found
+        return None
+
+    @classmethod
+    def _explainable(cls, slow: SlowCommand) -> bool:
+        if not slow.command:
+            return False
+        return not any(
+            stage_name in stage
+            for stage in slow.command.get("pipeline", [])
+            for stage_name in WRITE_STAGES
+        )
+
+    @classmethod
+    async def _explain(cls, slow: SlowCommand) -> dict[str, Any]:
+        """explain("executionStats")로 읽은 문서 / 인덱스 키 개수와 실행 계획 조회
+
+        Returns:
+            SlowQueryDocument 추가 필드 (explain 실패 시 빈 dict)
+        """
+        database = SlowQueryCollection._collection.database.client[slow.database]
+        try:
+            explain = await database.command(
+                {"explain": slow.command, "verbosity": "executionStats"}
+            )
+        except PyMongoError as e:
+            logger.warning("느린 명령 explain 실패 (%s): %s", slow.operation, e)
+            return {}
+
+        stats = cls._find_key(explain, "executionStats") or {}
+        docs_examined = stats.get("totalDocsExamined")
+        returned = stats.get("nReturned")
+        return {
+            "docs_examined": docs_examined,
+            "keys_examined": stats.get("totalKeysExamined"),
+            "examined_ratio": (
+                docs_examined / max(returned, 1)
+                if docs_examined is not None and returned is not None
+                else None
+            ),
+            "plan": cls._find_key(explain, "winningPlan"),
+        }
+
+    @classmethod
+    async def flush(cls) -> int:
+        """대기열의 느린 명령 저장 (일부는 explain 실행)
+
+        Returns:
+            저장한 개수
+        """
+        documents = []
+        while SlowQueryListener.pending:
+            slow = SlowQueryListener.pending.popleft()
+            extra = {}
+            if (
+                cls._explainable(slow)
+                and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+            ):
+                extra = await cls._explain(slow)
+            documents.append(
+                SlowQueryDocument(
+                    operation=slow.operation,
+                    command_name=slow.command_name,
+                    collection=slow.collection,
+                    duration_ms=slow.duration_ms,
+                    shape=slow.shape,
+                    returned=slow.returned,
+                    created_at=slow.created_at,
+                    **extra,
+                )
+            )
+
+        await SlowQueryCollection.insert_many(documents)
+        return len(documents)
+
+    @classmethod
+    async def run(cls):
+        """느린 명령 저장 루프 (lifespan에서 실행)"""
+        while True:
+            await asyncio.sleep(SLOW_QUERY_FLUSH_INTERVAL_SECONDS)
+            try:
+                await cls.flush()
+            except PyMongoError as e:
+                logger.warning("느린 명령 기록 저장 실패: %s", e)
+
+    @classmethod
+    async def get_slow_queries(
+        cls, limit: int, operation: str | None = None
+    ) -> list[SlowQueryData]:
+        """최근 느린 명령 기록 조회
+
+        Args:
+            limit: 최대 개수
+            operation: 컬렉션 메서드 (BidCollection.find_all_bids, 없으면 전체)
+
+        Returns:
+            느린 명령 기록 리스트 (최신순)
+        """
+        documents = await SlowQueryCollection.find_recent(limit, operation)
+        return [
+            SlowQueryData(
+                id=str(document.id),
+                operation=document.operation,
+                command_name=document.command_name,
+                collection=document.collection,
+                duration_ms=document.duration_ms,
+                shape=document.shape,
+                returned=document.returned,
+                docs_examined=document.docs_examined,
+                keys_examined=document.keys_examined,
+                examined_ratio=document.examined_ratio,
+                plan=document.plan,
+                created_at=document.created_at,
+            )
+            for document in documents
+        ]
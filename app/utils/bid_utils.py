@@ -3,19 +3,32 @@
 from datetime import datetime
 from typing import Any
 
-import pandas as pd
-
 
 class BidUtils:
     """입찰 데이터 파싱을 위한 유틸리티 클래스"""
 
+    @staticmethod
+    def is_missing(value: Any) -> bool:
+        """빈 셀 여부 (None, NaN, NaT, pd.NA)
+
+        pandas를 import하지 않는 pd.isna 대체 (스칼라 값만 지원)
+        """
+        if value is None:
+            return True
+        try:
+            # NaN, NaT는 자기 자신과 같지 않음
+            return bool(value != value)
+        except TypeError:
+            # pd.NA는 비교 결과도 NA라서 bool 변환 불가
+            return True
+
     @staticmethod
     def parse_datetime(date_str: str) -> datetime:
         """날짜 문자열을 datetime으로 변환
 
         형식: "22-03-11 10:00" 또는 "2024.1.18  10:00:00 AM"
         """
-        if pd.isna(date_str):
+        if BidUtils.is_missing(date_str):
             raise ValueError("Invalid date string: NaN value")
 
         date_str = str(date_str).strip()
@@ -60,7 +73,7 @@ class BidUtils:
 
         쉼표가 포함된 문자열도 처리
         """
-        if pd.isna(value):
+        if BidUtils.is_missing(value):
             return 0
 
         if isinstance(value, (int, float)):
@@ -84,7 +97,7 @@ class BidUtils:
         Returns:
             소수점 5자리로 반올림된 float
         """
-        if pd.isna(value):
+        if BidUtils.is_missing(value):
             return 0.0
 
         if isinstance(value, (int, float)):
@@ -98,14 +111,14 @@ class BidUtils:
     @staticmethod
     def parse_string(value: Any) -> str:
         """값을 문자열로 변환"""
-        if pd.isna(value):
+        if BidUtils.is_missing(value):
             return ""
         return str(value).strip()
 
     @staticmethod
     def parse_optional_float(value: Any) -> float | None:
         """선택적 float 값 파싱"""
-        if pd.isna(value) or value == "":
+        if BidUtils.is_missing(value) or value == "":
             return None
 
         try:
@@ -119,7 +132,7 @@ class BidUtils:
 
         '-' 같은 특수 문자는 None으로 처리
         """
-        if pd.isna(value) or value == "" or value == "-":
+        if BidUtils.is_missing(value) or value == "" or value == "-":
             return None
 
         try:
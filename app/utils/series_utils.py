@@ -0,0 +1,58 @@
+"""시계열 다운샘플링 유틸리티"""
+
+import numpy as np
+
+
+class SeriesUtils:
+    """차트용 시계열 처리를 위한 유틸리티 클래스"""
+
+    @staticmethod
+    def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+        """Largest-Triangle-Three-Buckets 다운샘플링
+
+        첫/마지막 점은 유지하고, 나머지는 threshold - 2개 버킷마다
+        (이전 선택점, 후보점, 다음 버킷 평균점) 삼각형 넓이가 가장 큰 점을 선택한다.
+        버킷 내부 계산은 numpy 벡터 연산으로 처리한다.
+
+        Args:
+            x: x 값 (오름차순 정렬)
+            y: y 값
+            threshold: 반환할 점 개수
+
+        Returns:
+            선택된 점의 인덱스 배열
+        """
+        length = len(x)
+        if threshold >= length or threshold < 3:
+            return np.arange(length)
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        # 첫/마지막 점을 제외한 구간을 threshold - 2개 버킷으로 분할
+        edges = np.linspace(1, length - 1, threshold - 1).astype(np.int64)
+        starts, ends = edges[:-1], edges[1:]
+
+        # 버킷별 평균점 (다음 버킷 평균으로 사용, 마지막은 끝점)
+        sizes = ends - starts
+        avg_x = np.add.reduceat(x[1:-1], starts - 1) / sizes
+        avg_y = np.add.reduceat(y[1:-1], starts - 1) / sizes
+        next_x = np.append(avg_x[1:], x[-1])
+        next_y = np.append(avg_y[1:], y[-1])
+
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = length - 1
+
+        previous = 0
+        for bucket, (start, end) in enumerate(zip(starts, ends)):
+            candidate_x = x[start:end]
+            candidate_y = y[start:end]
+            areas = np.abs(
+                (x[previous] - next_x[bucket]) * (candidate_y - y[previous])
+                - (x[previous] - candidate_x) * (next_y[bucket] - y[previous])
+            )
+            previous = start + int(np.argmax(areas))
+            selected[bucket + 1] = previous
+
+        return selected
@@ -0,0 +1,59 @@
+"""통계 계산 유틸리티"""
+
+from collections import Counter
+
+
+class StatsUtils:
+    """롤업 히스토그램 기반 통계 계산을 위한 유틸리티 클래스"""
+
+    # 롤업 히스토그램 버킷 해상도 (비율 0.001 단위)
+    BUCKET_SCALE = 1000
+
+    @classmethod
+    def to_bucket(cls, value: float) -> str:
+        """비율 값을 롤업 히스토그램 버킷 키로 변환
+
+        MongoDB 필드명에 '.'을 쓸 수 없으므로 정수 문자열을 키로 사용
+        """
+        return str(int(round(value * cls.BUCKET_SCALE)))
+
+    @classmethod
+    def from_bucket(cls, bucket: str | int) -> float:
+        """버킷 키를 비율 값으로 변환"""
+        return int(bucket) / cls.BUCKET_SCALE
+
+    @classmethod
+    def quantile(cls, histogram: Counter, q: float) -> float | None:
+        """버킷 히스토그램에서 분위수 계산
+
+        Args:
+            histogram: {버킷(int): 건수}
+            q: 분위수 (0.0 ~ 1.0)
+
+        Returns:
+            분위수 값 또는 None (데이터 없음)
+        """
+        buckets = sorted(
+            (bucket, count) for bucket, count in histogram.items() if count > 0
+        )
+        total = sum(count for _, count in buckets)
+        if total == 0:
+            return None
+
+        # numpy 기본(linear)과 같은 방식으로 인접한 두 순위 사이를 선형 보간
+        rank = q * (total - 1)
+        lower_rank = int(rank)
+        upper_rank = min(lower_rank + 1, total - 1)
+
+        lower_value = upper_value = None
+        cumulative = 0
+        for bucket, count in buckets:
+            cumulative += count
+            if lower_value is None and cumulative > lower_rank:
+                lower_value = cls.from_bucket(bucket)
+            if cumulative > upper_rank:
+                upper_value = cls.from_bucket(bucket)
+                break
+
+        fraction = rank - lower_rank
+        return round(lower_value + (upper_value - lower_value) * fraction, 5)
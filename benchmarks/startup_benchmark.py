@@ -0,0 +1,95 @@
+"""워커 시작 시간 / 메모리(RSS) 벤치마크
+
+새 프로세스에서 app.main을 import하는 시간과 import 후 RSS를 잰다.
+--lifespan을 주면 lifespan 시작(MongoDB 연결, 인덱스 생성 여부별)까지 잰다 (MONGO_DB_URL의 MongoDB 필요).
+
+실행: python -m benchmarks.startup_benchmark [--lifespan]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+REPEAT = 5
+
+# 새 프로세스에서 실행할 측정 코드 ({setup}: 측정 대상)
+PROBE = """
+import asyncio, json, resource, time
+
+started = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - started
+
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    with open("/proc/self/status") as status:
+        rss_kb = next(int(line.split()[1]) for line in status if line.startswith("VmRSS:"))
+except OSError:
+    pass
+print(json.dumps({{"seconds": elapsed, "rss_mb": rss_kb / 1024}}))
+"""
+
+IMPORT_APP = "import app.main"
+
+# 업로드를 한 번 처리한 워커 (파싱 경로의 pandas / numpy 로드)
+IMPORT_INGEST = """
+import app.main
+import pandas, numpy
+"""
+
+LIFESPAN = """
+from app.main import app, lifespan
+
+async def start():
+    async with lifespan(app):
+        pass
+
+asyncio.run(start())
+"""
+
+
+def measure(setup: str, env: dict[str, str] | None = None) -> tuple[float, float]:
+    """REPEAT회 실행 중 최소 시간(초)과 그때의 RSS(MB)"""
+    results = []
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(setup=setup)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, **(env or {})},
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append((result["seconds"], result["rss_mb"]))
+    return min(results)
+
+
+def main(lifespan: bool):
+    cases = [
+        ("import app.main", IMPORT_APP, None),
+        ("import app.main + pandas/numpy (업로드 처리 후)", IMPORT_INGEST, None),
+    ]
+    if lifespan:
+        cases += [
+            (
+                "lifespan 시작 (인덱스 생성 안 함)",
+                LIFESPAN,
+                {"MONGO_CREATE_INDEXES_ON_STARTUP": "false"},
+            ),
+            (
+                "lifespan 시작 (워커마다 인덱스 생성)",
+                LIFESPAN,
+                {"MONGO_CREATE_INDEXES_ON_STARTUP": "true"},
+            ),
+        ]
+
+    print("| 단계 | 시간 | RSS |")
+    print("| --- | ---: | ---: |")
+    for name, setup, env in cases:
+        seconds, rss_mb = measure(setup, env)
+        print(f"| {name} | {seconds:.3f} s | {rss_mb:.0f} MB |")
+
+
+if __name__ == "__main__":
+    main("--lifespan" in sys.argv[1:])
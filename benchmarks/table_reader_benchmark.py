@@ -0,0 +1,87 @@
+"""업로드 표 파일 리더 엔진별 읽기 시간 벤치마크
+
+실행: python -m benchmarks.table_reader_benchmark [행 개수 ...]
+"""
+
+import sys
+import time
+from io import BytesIO
+
+import pandas as pd
+
+from app.readers.table_reader import TableReader
+
+DEFAULT_ROW_COUNTS = (1_000, 10_000, 50_000)
+REPEAT = 3
+
+
+def make_table(row_count: int) -> pd.DataFrame:
+    """업로드 엑셀과 같은 컬럼 구성의 표 생성"""
+    return pd.DataFrame(
+        {
+            "번호": range(1, row_count + 1),
+            "타입": "공사",
+            "참가마감": 5,
+            "투찰마감": "25-01-20 10:00",
+            "입찰일": "25-01-21 14:00",
+            "발주기관": "경인테스트청",
+            "공고명": [f"테스트 공사 입찰 {i}" for i in range(row_count)],
+            "공고번호": [f"BENCH-{i:08d}" for i in range(row_count)],
+            "업종": "건설업",
+            "지역": "서울",
+            "추정가격": 100000000,
+            "기초금액": 95000000,
+            "1순위업체": "테스트건설",
+            "낙찰금액": 94000000,
+            "예정가격": 96000000,
+            "예정사정": 0.98,
+            "기초/낙찰": 0.989,
+            "예정/낙찰": 0.979,
+            "추정/낙찰": 0.94,
+        }
+    )
+
+
+def to_xlsx(df: pd.DataFrame) -> bytes:
+    buffer = BytesIO()
+    df.to_excel(buffer, index=False, engine="openpyxl")
+    return buffer.getvalue()
+
+
+def best_of(read, contents: bytes) -> float:
+    """REPEAT회 중 최소 소요 시간 (초)"""
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        read(contents)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(row_counts: tuple[int, ...]):
+    cases = (
+        ("xlsx", "openpyxl", to_xlsx, lambda c: TableReader.read_excel(c, "openpyxl")),
+        ("xlsx", "calamine", to_xlsx, lambda c: TableReader.read_excel(c, "calamine")),
+        (
+            "csv",
+            "pandas C",
+            lambda df: df.to_csv(index=False).encode(),
+            TableReader.read_csv,
+        ),
+    )
+
+    print("| 포맷 | 엔진 | 행 | 파일 크기 | 읽기 시간 |")
+    print("| --- | --- | ---: | ---: | ---: |")
+    for row_count in row_counts:
+        df = make_table(row_count)
+        for fmt, engine, write, read in cases:
+            contents = write(df)
+            elapsed = best_of(read, contents)
+            print(
+                f"| {fmt} | {engine} | {row_count:,} | "
+                f"{len(contents) / 1024 / 1024:.1f} MB | {elapsed:.3f} s |"
+            )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_ROW_COUNTS)
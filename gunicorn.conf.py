@@ -0,0 +1,23 @@
+"""gunicorn 설정 (Prometheus 멀티프로세스 지표 디렉터리 관리)
+
+워커들은 PROMETHEUS_MULTIPROC_DIR에 지표 파일을 쓰고, /metrics는 이 파일들을 합쳐 응답한다.
+"""
+
+import os
+import shutil
+
+from prometheus_client import multiprocess
+
+
+def on_starting(server):
+    """마스터 시작 시 이전 실행의 지표 파일 정리"""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live gauge(처리 중 요청 개수) 파일 정리"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
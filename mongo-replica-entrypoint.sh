@@ -0,0 +1,33 @@
+#!/bin/bash
+
+# 로컬 단일 호스트 레플리카 셋 (docker-compose-replica.yml에서 실행, 인증 없음 - 개발용)
+# 멤버 주소가 localhost:포트이므로 호스트에서 실행한 앱도 같은 주소로 모든 멤버에 접속한다.
+set -e
+
+PORTS=(27017 27018 27019)
+
+for port in "${PORTS[@]}"; do
+  mkdir -p "/data/replica/$port"
+  mongod --replSet rs0 --port "$port" --bind_ip_all \
+    --dbpath "/data/replica/$port" \
+    --fork --logpath "/data/replica/$port.log"
+done
+
+# 처음 실행할 때만 레플리카 셋 초기화 (27017이 프라이머리)
+mongosh --port 27017 --quiet --eval '
+try {
+  rs.status();
+} catch (e) {
+  rs.initiate({
+    _id: "rs0",
+    members: [
+      { _id: 0, host: "localhost:27017", priority: 2 },
+      { _id: 1, host: "localhost:27018", priority: 1 },
+      { _id: 2, host: "localhost:27019", priority: 1 },
+    ],
+  });
+}
+'
+
+# 멤버 로그를 출력하며 컨테이너 유지
+exec tail -F /data/replica/*.log
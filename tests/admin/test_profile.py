@@ -0,0 +1,83 @@
+import marshal
+import time
+
+import pytest
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from app.core.profiling import StackSampler
+from app.core.settings import settings
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+def busy_loop(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProfile:
+    def test_stack_sampler(self):
+        """스택 샘플링 결과는 collapsed stack 형식"""
+        sampler = StackSampler(0.001)
+        sampler.start()
+        busy_loop(0.1)
+        folded = sampler.stop().decode()
+
+        lines = folded.splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert any("busy_loop" in line for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_not_profiled_without_token(self, async_client, monkeypatch):
+        """관리자 토큰이 없거나 틀리면 프로파일링하지 않음"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", ADMIN_TOKEN)
+
+        response = await async_client.get("/health", headers={"X-Profile": "sample"})
+        assert "X-Profile-Id" not in response.headers
+
+        response = await async_client.get(
+            "/health", headers={"X-Profile": "sample", "X-Admin-Token": "wrong"}
+        )
+        assert "X-Profile-Id" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_cprofile_download(self, async_client, monkeypatch):
+        """cProfile 프로파일 저장 후 목록 조회 / 내려받기"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", ADMIN_TOKEN)
+        headers = {"X-Admin-Token": ADMIN_TOKEN}
+
+        response = await async_client.get(
+            "/bid", headers={**headers, "X-Profile": "cprofile"}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        profile_id = response.headers["X-Profile-Id"]
+
+        list_response = await async_client.get("/admin/profiles", headers=headers)
+        profiles = {profile["id"]: profile for profile in list_response.json()["data"]}
+        assert profiles[profile_id]["path"] == "/bid"
+        assert profiles[profile_id]["mode"] == "cprofile"
+        assert profiles[profile_id]["status"] == HTTP_200_OK
+
+        download = await async_client.get(
+            f"/admin/profiles/{profile_id}", headers=headers
+        )
+        assert download.status_code == HTTP_200_OK
+        assert f"{profile_id}.prof" in download.headers["content-disposition"]
+        # pstats 파일 형식 (함수별 호출 통계)
+        stats = marshal.loads(download.content)
+        assert any(name == "get_bids" for _, _, name in stats)
+
+    @pytest.mark.asyncio
+    async def test_profile_not_found(self, async_client, monkeypatch):
+        """없는 프로파일은 404"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", ADMIN_TOKEN)
+
+        response = await async_client.get(
+            "/admin/profiles/invalid", headers={"X-Admin-Token": ADMIN_TOKEN}
+        )
+
+        assert response.status_code == HTTP_404_NOT_FOUND
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+from pymongo.monitoring import CommandStartedEvent, CommandSucceededEvent
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+)
+
+from app.core.metrics import mongo_operation
+from app.core.settings import settings
+from app.core.slow_query import SlowQueryListener, query_shape
+from app.services.slow_query_service import SlowQueryService
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+def run_command(listener, operation, command, reply, duration_ms, request_id=1):
+    """컬렉션 메서드 안에서 명령이 실행된 것처럼 리스너 호출"""
+    token = mongo_operation.set(operation)
+    try:
+        listener.started(
+            CommandStartedEvent(
+                command=command,
+                database_name="base",
+                request_id=request_id,
+                connection_id=("localhost", 27017),
+                operation_id=request_id,
+            )
+        )
+        listener.succeeded(
+            CommandSucceededEvent(
+                duration=timedelta(milliseconds=duration_ms),
+                reply=reply,
+                command_name=next(iter(command)),
+                request_id=request_id,
+                connection_id=("localhost", 27017),
+                operation_id=request_id,
+            )
+        )
+    finally:
+        mongo_operation.reset(token)
+
+
+class TestSlowQuery:
+    def test_query_shape(self):
+        """값은 타입 이름으로 바꾸고 키와 연산자는 유지"""
+        shape = query_shape(
+            {"region": "서울", "number": {"$gte": 1, "$in": [1, 2, 3]}, "$or": []}
+        )
+
+        assert shape == {
+            "region": "str",
+            "number": {"$gte": "int", "$in": ["int"]},
+            "$or": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_admin_disabled_without_token_setting(
+        self, async_client, monkeypatch
+    ):
+        """ADMIN_TOKEN이 없으면 관리자 API 비활성화"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+
+        response = await async_client.get(
+            "/admin/slow-queries", headers={"X-Admin-Token": "anything"}
+        )
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_admin_wrong_token(self, async_client, monkeypatch):
+        """관리자 토큰이 틀리면 403"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", ADMIN_TOKEN)
+
+        response = await async_client.get(
+            "/admin/slow-queries", headers={"X-Admin-Token": "wrong"}
+        )
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    @pytest.mark.asyncio
+    async def test_record_slow_command(self, async_client, monkeypatch, unique_value):
+        """기준을 넘은 명령만 조회 형태와 함께 기록"""
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", ADMIN_TOKEN)
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 100)
+        monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0)
+        operation = unique_value("BidCollection.find_all_bids")
+        listener = SlowQueryListener()
+        SlowQueryListener.pending.clear()
+
+        command = {
+            "find": "bids",
+            "filter": {"region": "서울"},
+            "sort": {"bid_date": -1},
+            "skip": 20,
+            "limit": 10,
+            "$db": "base",
+        }
+        reply = {"cursor": {"firstBatch": [{}] * 10, "id": 0}, "ok": 1}
+        run_command(listener, operation, command, reply, duration_ms=250, request_id=1)
+        # 기준 미만 명령은 기록하지 않음
+        run_command(listener, operation, command, reply, duration_ms=5, request_id=2)
+        # 컬렉션 메서드 밖의 명령은 기록하지 않음
+        run_command(listener, "-", command, reply, duration_ms=250, request_id=3)
+
+        assert await SlowQueryService.flush() == 1
+
+        response = await async_client.get(
+            "/admin/slow-queries",
+            params={"operation": operation},
+            headers={"X-Admin-Token": ADMIN_TOKEN},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        records = response.json()["data"]
+        assert len(records) == 1
+        assert records[0]["command_name"] == "find"
+        assert records[0]["collection"] == "bids"
+        assert records[0]["duration_ms"] == pytest.approx(250)
+        assert records[0]["returned"] == 10
+        assert records[0]["shape"] == {
+            "filter": {"region": "str"},
+            "sort": {"bid_date": "int"},
+            "skip": 20,
+            "limit": 10,
+        }
+        # explain을 실행하지 않은 기록
+        assert records[0]["plan"] is None
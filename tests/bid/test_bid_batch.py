@@ -0,0 +1,165 @@
+import json
+import pytest
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+
+
+class TestBidBatch:
+    """입찰 일괄 처리 API 테스트"""
+
+    async def _create_bids(self, async_client, bid_payload, count: int):
+        """입찰 문서 생성 후 (ID, 공고번호) 리스트 반환"""
+        created = []
+        for _ in range(count):
+            data = bid_payload()
+            response = await async_client.post("/bid", json=data)
+            created.append((response.json()["data"]["id"], data["announcement_number"]))
+        return created
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup(self, async_client, bid_payload):
+        """ID/공고번호 일괄 조회 테스트"""
+        created = await self._create_bids(async_client, bid_payload, 3)
+        fake_id = "507f1f77bcf86cd799439011"
+
+        response = await async_client.post(
+            "/bid/batch",
+            json={
+                "ids": [created[0][0], fake_id, "invalid-id"],
+                "announcement_numbers": [
+                    created[1][1],
+                    created[2][1],
+                    "NONEXISTENT-999",
+                ],
+            },
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["detail"] == "입찰 일괄 조회 성공"
+        found_ids = {item["id"] for item in data["data"]["items"]}
+        assert found_ids == {bid_id for bid_id, _ in created}
+        assert data["data"]["missing_ids"] == [fake_id, "invalid-id"]
+        assert data["data"]["missing_announcement_numbers"] == ["NONEXISTENT-999"]
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_overlapping_keys(self, async_client, bid_payload):
+        """같은 문서를 ID와 공고번호로 동시에 조회 시 중복 제거 테스트"""
+        [(bid_id, announcement_number)] = await self._create_bids(
+            async_client, bid_payload, 1
+        )
+
+        response = await async_client.post(
+            "/bid/batch",
+            json={"ids": [bid_id], "announcement_numbers": [announcement_number]},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert len(response.json()["data"]["items"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_too_many_keys(self, async_client):
+        """최대 키 개수 초과 시 422 테스트"""
+        response = await async_client.post(
+            "/bid/batch",
+            json={"announcement_numbers": [f"TEST-{i}" for i in range(5001)]},
+        )
+
+        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_bulk_mutation(self, async_client, bid_payload):
+        """NDJSON 일괄 생성/수정/삭제 테스트"""
+        [(update_id, _), (delete_id, taken_number)] = await self._create_bids(
+            async_client, bid_payload, 2
+        )
+        new_data = bid_payload()
+        operations = [
+            {
+                "op": "create",
+                "data": new_data,
+            },
+            {
+                "op": "create",
+                "data": bid_payload(announcement_number=taken_number),
+            },
+            {
+                "op": "update",
+                "id": update_id,
+                "data": {"announcement_name": "일괄 수정된 공고명"},
+            },
+            {"op": "delete", "id": delete_id},
+            {"op": "delete", "id": "507f1f77bcf86cd799439011"},
+            {"op": "create", "data": {"announcement_number": "필수값 누락"}},
+        ]
+        body = "\n".join(json.dumps(op, ensure_ascii=False) for op in operations)
+        body += "\nnot json\n"
+
+        response = await async_client.post(
+            "/bid/bulk",
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        results = {line["line"]: line for line in lines if "line" in line}
+
+        assert results[1]["status"] == "ok"
+        assert "이미 존재하는 공고번호입니다" in results[2]["error"]
+        assert results[3]["status"] == "ok"
+        assert results[4]["status"] == "ok"
+        assert results[5]["error"] == "입찰 문서를 찾을 수 없습니다"
+        assert results[6]["status"] == "error"
+        assert results[7]["status"] == "error"
+        assert lines[-1]["summary"] == {"total": 7, "succeeded": 3, "failed": 4}
+
+        # 실제 반영 확인
+        created = await async_client.get(
+            f"/bid/announcement/{new_data['announcement_number']}"
+        )
+        assert created.json()["data"]["id"] == results[1]["id"]
+        updated = await async_client.get(f"/bid/id/{update_id}")
+        assert updated.json()["data"]["announcement_name"] == "일괄 수정된 공고명"
+        deleted = await async_client.get(f"/bid/id/{delete_id}")
+        assert deleted.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_bulk_mutation_same_document_in_order(
+        self, async_client, bid_payload
+    ):
+        """같은 문서에 대한 연속 작업이 순서대로 반영되는지 테스트"""
+        [(bid_id, _)] = await self._create_bids(async_client, bid_payload, 1)
+        operations = [
+            {"op": "update", "id": bid_id, "data": {"announcement_name": "첫 수정"}},
+            {"op": "update", "id": bid_id, "data": {"announcement_name": "두 번째"}},
+        ]
+        body = "\n".join(json.dumps(op, ensure_ascii=False) for op in operations)
+
+        response = await async_client.post("/bid/bulk", content=body.encode("utf-8"))
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[-1]["summary"]["succeeded"] == 2
+        updated = await async_client.get(f"/bid/id/{bid_id}")
+        assert updated.json()["data"]["announcement_name"] == "두 번째"
+
+    @pytest.mark.asyncio
+    async def test_bulk_mutation_recreate_after_delete(self, async_client, bid_payload):
+        """삭제한 문서의 공고번호로 다시 생성하는 작업은 삭제 후에 처리"""
+        [(bid_id, number)] = await self._create_bids(async_client, bid_payload, 1)
+        operations = [
+            {"op": "delete", "id": bid_id},
+            {"op": "create", "data": bid_payload(announcement_number=number)},
+        ]
+        body = "\n".join(json.dumps(op, ensure_ascii=False) for op in operations)
+
+        response = await async_client.post("/bid/bulk", content=body.encode("utf-8"))
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["status"] for line in lines[:-1]] == ["ok", "ok"]
+        recreated = await async_client.get(f"/bid/announcement/{number}")
+        assert recreated.json()["data"]["id"] == lines[1]["id"]
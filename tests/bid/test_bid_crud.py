@@ -1,4 +1,6 @@
+import asyncio
 import pytest
+import pytest_asyncio
 import time
 import pandas as pd
 from io import BytesIO
@@ -9,6 +11,10 @@ from starlette.status import (
     HTTP_400_BAD_REQUEST,
 )
 
+from app.collections.bid_collection import BidCollection
+from app.collections.bid_stats_collection import BidStatsCollection
+from app.db.mongo_db import MongoDB
+
 
 class TestBidCRUD:
     """입찰 CRUD API 테스트"""
@@ -17,6 +23,32 @@ class TestBidCRUD:
         """고유한 공고번호 생성"""
         return f"TEST-{int(time.time() * 1000000)}"
 
+    def _upload_row(
+        self, announcement_number, announcement_name="테스트 업로드 공사", region="서울"
+    ):
+        """업로드 파일의 한 행 (엑셀 컬럼명 기준)"""
+        return {
+            "번호": 1,
+            "타입": "공사",
+            "참가마감": 5,
+            "투찰마감": "25-01-20 10:00",
+            "입찰일": "25-01-21 14:00",
+            "발주기관": "테스트기관",
+            "공고명": announcement_name,
+            "공고번호": announcement_number,
+            "업종": "건설업",
+            "지역": region,
+            "추정가격": 100000000,
+            "기초금액": 95000000,
+            "1순위업체": "테스트건설",
+            "낙찰금액": 94000000,
+            "예정가격": 96000000,
+            "예정사정": 0.98,
+            "기초/낙찰": 0.989,
+            "예정/낙찰": 0.979,
+            "추정/낙찰": 0.94,
+        }
+
     # 테스트용 입찰 데이터
     @pytest.fixture
     def sample_bid_data(self):
@@ -133,6 +165,33 @@ class TestBidCRUD:
         assert data_page2["data"]["page"] == 2
         assert data_page2["data"]["size"] == 5
 
+    @pytest.mark.asyncio
+    async def test_get_bids_list_with_filters(self, async_client, sample_bid_data):
+        """입찰 목록 필터 조회 테스트"""
+        # 고유한 지역으로 테스트 데이터 생성
+        region = f"지역-{self._generate_unique_announcement_number()}"
+        sample_bid_data["region"] = region
+        for _ in range(2):
+            sample_bid_data["announcement_number"] = (
+                self._generate_unique_announcement_number()
+            )
+            await async_client.post("/bid", json=sample_bid_data)
+
+        response = await async_client.get(
+            "/bid", params={"region": region, "bid_date_from": "2025-01-01T00:00:00"}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["data"]["total"] == 2
+        assert all(item["region"] == region for item in data["data"]["items"])
+
+        # 범위 밖 입찰일 조건
+        response = await async_client.get(
+            "/bid", params={"region": region, "bid_date_to": "2024-12-31T23:59:59"}
+        )
+        assert response.json()["data"]["total"] == 0
+
     @pytest.mark.asyncio
     async def test_get_bid_by_id(self, async_client, sample_bid_data):
         """ID로 입찰 조회 API 테스트"""
@@ -249,6 +308,28 @@ class TestBidCRUD:
         data = response.json()
         assert data["detail"] == "입찰 문서를 찾을 수 없습니다"
 
+    @pytest.mark.asyncio
+    async def test_update_bid_duplicate_announcement_number(
+        self, async_client, bid_payload
+    ):
+        """다른 문서의 공고번호로 업데이트 시 400 테스트"""
+        first, second = bid_payload(), bid_payload()
+        await async_client.post("/bid", json=first)
+        create_response = await async_client.post("/bid", json=second)
+        created_id = create_response.json()["data"]["id"]
+
+        response = await async_client.put(
+            f"/bid/{created_id}",
+            json={"announcement_number": first["announcement_number"]},
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        get_response = await async_client.get(f"/bid/id/{created_id}")
+        assert (
+            get_response.json()["data"]["announcement_number"]
+            == second["announcement_number"]
+        )
+
     @pytest.mark.asyncio
     async def test_delete_bid(self, async_client, sample_bid_data):
         """입찰 삭제 API 테스트"""
@@ -507,6 +588,155 @@ class TestBidCRUD:
         assert updated_bid["first_place_company"] == "수정건설"
         assert updated_bid["winning_bid_amount"] == 93000000
 
+    @pytest.mark.asyncio
+    async def test_upload_bid_excel_unchanged(self, async_client, unique_value):
+        """엑셀 업로드 테스트 - 내용이 같은 행은 변경 없음으로 집계"""
+        unchanged_num, changed_num = unique_value("TEST"), unique_value("TEST")
+        rows = [
+            self._upload_row(number, announcement_name="원본 공고명")
+            for number in (unchanged_num, changed_num)
+        ]
+
+        async def upload(df):
+            excel_buffer = BytesIO()
+            df.to_excel(excel_buffer, index=False, engine="openpyxl")
+            excel_buffer.seek(0)
+            files = {"file": ("test.xlsx", excel_buffer, "application/vnd.ms-excel")}
+            response = await async_client.post("/bid/upload", files=files)
+            assert response.status_code == HTTP_200_OK
+            return response.json()["data"]
+
+        data1 = await upload(pd.DataFrame(rows))
+        assert data1["inserted_count"] == 2
+        assert data1["unchanged_count"] == 0
+
+        # 같은 파일에서 한 행만 수정해 재업로드
+        rows[1]["공고명"] = "수정된 공고명"
+        data2 = await upload(pd.DataFrame(rows))
+
+        assert data2["inserted_count"] == 0
+        assert data2["updated_count"] == 1
+        assert data2["updated_list"] == [changed_num]
+        assert data2["unchanged_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_bid_excel_same_file(self, async_client, unique_value):
+        """엑셀 업로드 테스트 - 같은 파일은 다시 처리하지 않고 저장된 결과 반환"""
+        df = pd.DataFrame(
+            [self._upload_row(unique_value("TEST"), announcement_name="원본 공고명")]
+        )
+        excel_buffer = BytesIO()
+        df.to_excel(excel_buffer, index=False, engine="openpyxl")
+        contents = excel_buffer.getvalue()
+
+        async def upload():
+            files = {"file": ("test.xlsx", contents, "application/vnd.ms-excel")}
+            response = await async_client.post("/bid/upload", files=files)
+            assert response.status_code == HTTP_200_OK
+            return response.json()["data"]
+
+        # 동시에 올린 같은 파일은 하나의 처리 결과를 공유
+        first, second = await asyncio.gather(upload(), upload())
+        assert first["inserted_count"] == 1
+        assert second == first
+
+        # 처리가 끝난 뒤 다시 올려도 저장된 결과 반환
+        assert await upload() == first
+
+    @pytest_asyncio.fixture
+    async def isolated_bid_collections(self, unique_value, monkeypatch):
+        """전체 교체가 다른 테스트의 데이터를 지우지 않도록 입찰 / 통계 컬렉션을 테스트 전용으로 변경"""
+        database = MongoDB.get_database()
+        bids = database[unique_value("bids_replace")]
+        stats = database[unique_value("bids_stats_replace")]
+        monkeypatch.setattr(BidCollection, "_collection", bids)
+        monkeypatch.setattr(BidStatsCollection, "_collection", stats)
+        await BidCollection.create_indexes()
+        await BidStatsCollection.create_indexes()
+
+        yield
+
+        await bids.drop()
+        await stats.drop()
+
+    @pytest.mark.asyncio
+    async def test_upload_bid_excel_replace(
+        self, async_client, bid_payload, unique_value, isolated_bid_collections
+    ):
+        """엑셀 업로드 테스트 - 전체 교체 모드"""
+        region = unique_value("지역")
+        old_data = bid_payload(region=region)
+        await async_client.post("/bid", json=old_data)
+
+        new_nums = [unique_value("TEST"), unique_value("TEST")]
+        df = pd.DataFrame(
+            [
+                self._upload_row(number, announcement_name="교체 공고명", region=region)
+                for number in new_nums
+            ]
+        )
+        excel_buffer = BytesIO()
+        df.to_excel(excel_buffer, index=False, engine="openpyxl")
+        excel_buffer.seek(0)
+        files = {"file": ("yearly.xlsx", excel_buffer, "application/vnd.ms-excel")}
+
+        response = await async_client.post(
+            "/bid/upload", params={"mode": "replace"}, files=files
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["data"]["inserted_count"] == 2
+
+        # 기존 문서는 사라지고 새 문서만 남음
+        list_response = await async_client.get("/bid", params={"size": 1000})
+        assert list_response.json()["data"]["total"] == 2
+        old_response = await async_client.get(
+            f"/bid/announcement/{old_data['announcement_number']}"
+        )
+        assert old_response.status_code == HTTP_404_NOT_FOUND
+
+        # 통계 롤업도 교체된 데이터 기준으로 재계산
+        stats_response = await async_client.get(
+            "/bid/stats", params={"region": region, "group_by": ["region"]}
+        )
+        assert stats_response.json()["data"]["groups"][0]["count"] == 2
+
+        # 교체 후에도 공고번호 unique index 유지
+        duplicate = await async_client.post(
+            "/bid", json=bid_payload(announcement_number=new_nums[0])
+        )
+        assert duplicate.status_code == HTTP_400_BAD_REQUEST
+
+        # 같은 파일로 다시 교체하면 저장된 결과를 재사용하지 않고 다시 교체
+        added = bid_payload(region=region)
+        await async_client.post("/bid", json=added)
+        excel_buffer.seek(0)
+        response = await async_client.post(
+            "/bid/upload", params={"mode": "replace"}, files=files
+        )
+        assert response.status_code == HTTP_200_OK
+        added_response = await async_client.get(
+            f"/bid/announcement/{added['announcement_number']}"
+        )
+        assert added_response.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_upload_bid_csv(self, async_client, unique_value):
+        """CSV 업로드 테스트 - 확장자가 아닌 내용으로 포맷 판별"""
+        unique_num = unique_value("TEST")
+        df = pd.DataFrame(
+            [self._upload_row(unique_num, announcement_name="CSV 공고명")]
+        )
+        csv_content = df.to_csv(index=False).encode("cp949")
+        files = {"file": ("export.dat", BytesIO(csv_content), "text/csv")}
+
+        response = await async_client.post("/bid/upload", files=files)
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["data"]["inserted_count"] == 1
+        get_response = await async_client.get(f"/bid/announcement/{unique_num}")
+        assert get_response.json()["data"]["announcement_name"] == "CSV 공고명"
+
     @pytest.mark.asyncio
     async def test_upload_bid_excel_invalid_file(self, async_client):
         """엑셀 업로드 테스트 - 잘못된 파일 형식"""
@@ -519,3 +749,14 @@ class TestBidCRUD:
         assert response.status_code == HTTP_400_BAD_REQUEST
         data = response.json()
         assert "엑셀 파일만 업로드 가능합니다" in data["detail"]
+
+    @pytest.mark.asyncio
+    async def test_upload_bid_corrupt_file(self, async_client):
+        """엑셀 업로드 테스트 - 포맷 판별은 통과했지만 손상된 파일은 400"""
+        corrupt_content = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 64
+        files = {"file": ("broken.xls", BytesIO(corrupt_content), "text/plain")}
+
+        response = await async_client.post("/bid/upload", files=files)
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert "파일 처리 중 오류 발생" in response.json()["detail"]
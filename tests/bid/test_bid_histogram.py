@@ -0,0 +1,101 @@
+import pytest
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+
+class TestBidHistogram:
+    """입찰 비율 분포 히스토그램 API 테스트"""
+
+    @pytest.fixture
+    async def region_with_bids(self, async_client, bid_payload, unique_value):
+        """분포 확인용 입찰 데이터 생성 fixture"""
+        region = unique_value("지역")
+        for ratio in (0.905, 0.95, 0.951, 0.99, 1.0):
+            await async_client.post(
+                "/bid", json=bid_payload(region=region, base_to_winning_ratio=ratio)
+            )
+        return region
+
+    @pytest.mark.asyncio
+    async def test_histogram_with_range(self, async_client, region_with_bids):
+        """범위와 구간 폭을 지정한 히스토그램 테스트"""
+        response = await async_client.get(
+            "/bid/histogram",
+            params={
+                "field": "base_to_winning_ratio",
+                "bin_width": 0.01,
+                "lower": 0.9,
+                "upper": 1.0,
+                "region": region_with_bids,
+            },
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["field"] == "base_to_winning_ratio"
+        assert data["total"] == 5
+        assert len(data["counts"]) == 10
+        # 0.905 -> 0번 구간, 0.95/0.951 -> 5번 구간, 0.99/1.0 -> 마지막 구간
+        assert data["counts"][0] == 1
+        assert data["counts"][5] == 2
+        assert data["counts"][9] == 2
+
+    @pytest.mark.asyncio
+    async def test_histogram_upper_not_multiple_of_width(
+        self, async_client, region_with_bids
+    ):
+        """구간 폭으로 나누어떨어지지 않는 상한을 넘는 값은 제외되는지 테스트"""
+        response = await async_client.get(
+            "/bid/histogram",
+            params={
+                "bin_width": 0.01,
+                "lower": 0.9,
+                "upper": 0.9505,
+                "region": region_with_bids,
+            },
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["upper"] == pytest.approx(0.9505)
+        assert len(data["counts"]) == 6
+        # 0.951은 요청 상한을 넘으므로 제외, 0.95는 마지막 구간에 포함
+        assert data["total"] == 2
+        assert data["counts"][0] == 1
+        assert data["counts"][5] == 1
+
+    @pytest.mark.asyncio
+    async def test_histogram_default_range(self, async_client, region_with_bids):
+        """범위를 생략하면 데이터 최소/최대값을 사용하는지 테스트"""
+        response = await async_client.get(
+            "/bid/histogram",
+            params={"bin_width": 0.05, "region": region_with_bids},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["lower"] == pytest.approx(0.905)
+        assert data["total"] == 5
+        assert sum(data["counts"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_histogram_empty(self, async_client, unique_value):
+        """데이터가 없는 필터 조건 테스트"""
+        response = await async_client.get(
+            "/bid/histogram",
+            params={"region": unique_value("없는지역")},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["total"] == 0
+        assert data["counts"] == []
+
+    @pytest.mark.asyncio
+    async def test_histogram_too_many_bins(self, async_client):
+        """구간 개수 제한 초과 시 400 테스트"""
+        response = await async_client.get(
+            "/bid/histogram",
+            params={"bin_width": 0.00001, "lower": 0.0, "upper": 1.0},
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
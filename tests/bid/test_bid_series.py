@@ -0,0 +1,54 @@
+import pytest
+from starlette.status import HTTP_200_OK
+
+
+class TestBidSeries:
+    """입찰 다운샘플링 시계열 API 테스트"""
+
+    def _bid_data(self, bid_payload, region: str, day: int, ratio: float):
+        """입찰일이 day일인 테스트용 입찰 데이터"""
+        return bid_payload(
+            region=region,
+            bid_deadline=f"2025-01-{day:02d}T10:00:00",
+            bid_date=f"2025-01-{day:02d}T14:00:00",
+            base_to_winning_ratio=ratio,
+        )
+
+    @pytest.mark.asyncio
+    async def test_series_downsampled(self, async_client, bid_payload, unique_value):
+        """점 개수 예산으로 다운샘플링된 시계열 테스트"""
+        region = unique_value("지역")
+        for day in range(1, 21):
+            ratio = 0.99 if day == 10 else 0.9 + day * 0.001
+            await async_client.post(
+                "/bid", json=self._bid_data(bid_payload, region, day, ratio)
+            )
+
+        response = await async_client.get(
+            "/bid/series", params={"points": 5, "region": region}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["field"] == "base_to_winning_ratio"
+        assert data["total"] == 20
+        assert len(data["points"]) == 5
+        # 첫/마지막 점은 유지되고 입찰일 순으로 정렬
+        assert data["points"][0]["bid_date"].startswith("2025-01-01")
+        assert data["points"][-1]["bid_date"].startswith("2025-01-20")
+        dates = [point["bid_date"] for point in data["points"]]
+        assert dates == sorted(dates)
+        # 스파이크 값 유지
+        assert 0.99 in [point["value"] for point in data["points"]]
+
+    @pytest.mark.asyncio
+    async def test_series_empty(self, async_client, unique_value):
+        """데이터가 없는 필터 조건 테스트"""
+        response = await async_client.get(
+            "/bid/series", params={"region": unique_value("없는지역")}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["total"] == 0
+        assert data["points"] == []
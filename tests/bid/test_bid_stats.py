@@ -0,0 +1,99 @@
+import pytest
+from starlette.status import HTTP_200_OK
+
+
+class TestBidStats:
+    """입찰 세그먼트 통계 API 테스트"""
+
+    async def _get_region_stats(self, async_client, region: str):
+        response = await async_client.get(
+            "/bid/stats", params={"region": region, "group_by": ["region", "month"]}
+        )
+        assert response.status_code == HTTP_200_OK
+        return response.json()["data"]
+
+    @pytest.mark.asyncio
+    async def test_stats_after_create(self, async_client, bid_payload, unique_value):
+        """입찰 생성 시 롤업 통계 반영 테스트"""
+        region = unique_value("지역")
+        for ratio in (0.95, 0.97, 0.99):
+            await async_client.post(
+                "/bid", json=bid_payload(region=region, base_to_winning_ratio=ratio)
+            )
+
+        data = await self._get_region_stats(async_client, region)
+
+        assert data["group_by"] == ["region", "month"]
+        assert len(data["groups"]) == 1
+        group = data["groups"][0]
+        assert group["group"] == {"region": region, "month": "2025-01"}
+        assert group["count"] == 3
+        stats = group["ratios"]["base_to_winning_ratio"]
+        assert stats["mean"] == pytest.approx(0.97)
+        assert stats["median"] == pytest.approx(0.97)
+        assert stats["p10"] == pytest.approx(0.954)
+        assert stats["p90"] == pytest.approx(0.986)
+
+    @pytest.mark.asyncio
+    async def test_stats_after_update_and_delete(
+        self, async_client, bid_payload, unique_value
+    ):
+        """입찰 수정/삭제 시 롤업 통계 증분 반영 테스트"""
+        region = unique_value("지역")
+        created_ids = []
+        for ratio in (0.95, 0.99):
+            response = await async_client.post(
+                "/bid", json=bid_payload(region=region, base_to_winning_ratio=ratio)
+            )
+            created_ids.append(response.json()["data"]["id"])
+
+        await async_client.put(
+            f"/bid/{created_ids[0]}", json={"base_to_winning_ratio": 0.97}
+        )
+        data = await self._get_region_stats(async_client, region)
+        assert data["groups"][0]["count"] == 2
+        assert data["groups"][0]["ratios"]["base_to_winning_ratio"][
+            "mean"
+        ] == pytest.approx(0.98)
+
+        await async_client.delete(f"/bid/{created_ids[1]}")
+        data = await self._get_region_stats(async_client, region)
+        assert data["groups"][0]["count"] == 1
+        assert data["groups"][0]["ratios"]["base_to_winning_ratio"][
+            "median"
+        ] == pytest.approx(0.97)
+
+    @pytest.mark.asyncio
+    async def test_stats_after_update_with_null_ratio(
+        self, async_client, bid_payload, unique_value
+    ):
+        """필수 비율 필드에 null을 보낸 수정은 무시되고 롤업이 유지되는지 테스트"""
+        region = unique_value("지역")
+        response = await async_client.post(
+            "/bid", json=bid_payload(region=region, base_to_winning_ratio=0.95)
+        )
+        created_id = response.json()["data"]["id"]
+
+        response = await async_client.put(
+            f"/bid/{created_id}",
+            json={"base_to_winning_ratio": None, "announcement_name": "수정"},
+        )
+        assert response.status_code == HTTP_200_OK
+
+        bid = (await async_client.get(f"/bid/id/{created_id}")).json()["data"]
+        assert bid["base_to_winning_ratio"] == pytest.approx(0.95)
+        assert bid["announcement_name"] == "수정"
+
+        data = await self._get_region_stats(async_client, region)
+        assert data["groups"][0]["count"] == 1
+        assert data["groups"][0]["ratios"]["base_to_winning_ratio"][
+            "mean"
+        ] == pytest.approx(0.95)
+
+    @pytest.mark.asyncio
+    async def test_stats_empty_segment(self, async_client, unique_value):
+        """데이터가 없는 세그먼트 조회 테스트"""
+        data = await self._get_region_stats(async_client, unique_value("없는지역"))
+
+        assert data["segment_count"] == 0
+        assert data["groups"] == []
@@ -0,0 +1,118 @@
+import zipfile
+import pytest
+import pandas as pd
+from io import BytesIO
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+
+class TestBidUploadBatch:
+    """여러 파일 / ZIP 업로드 API 테스트"""
+
+    def _row(self, announcement_number: str, announcement_name: str):
+        """업로드 엑셀 한 행"""
+        return {
+            "번호": 1,
+            "타입": "공사",
+            "참가마감": 5,
+            "투찰마감": "25-01-20 10:00",
+            "입찰일": "25-01-21 14:00",
+            "발주기관": "테스트기관",
+            "공고명": announcement_name,
+            "공고번호": announcement_number,
+            "업종": "건설업",
+            "지역": "서울",
+            "추정가격": 100000000,
+            "기초금액": 95000000,
+            "1순위업체": "테스트건설",
+            "낙찰금액": 94000000,
+            "예정가격": 96000000,
+            "예정사정": 0.98,
+            "기초/낙찰": 0.989,
+            "예정/낙찰": 0.979,
+            "추정/낙찰": 0.94,
+        }
+
+    def _to_xlsx(self, rows: list[dict]) -> bytes:
+        buffer = BytesIO()
+        pd.DataFrame(rows).to_excel(buffer, index=False, engine="openpyxl")
+        return buffer.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_upload_files_and_zip(self, async_client, unique_value):
+        """여러 파일과 ZIP 업로드 시 뒤 파일 우선 병합 테스트"""
+        shared, first_only, zipped = (unique_value("TEST") for _ in range(3))
+
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("q1/b.xlsx", self._to_xlsx([self._row(shared, "ZIP 공고명")]))
+            zf.writestr(
+                "q1/a.csv",
+                pd.DataFrame([self._row(zipped, "CSV 공고명")])
+                .to_csv(index=False)
+                .encode(),
+            )
+            zf.writestr("q1/readme.txt", b"not a table")
+
+        first = self._to_xlsx(
+            [self._row(shared, "첫 파일 공고명"), self._row(first_only, "첫 파일")]
+        )
+        files = [
+            ("files", ("first.xlsx", first, "application/vnd.ms-excel")),
+            ("files", ("quarter.zip", archive.getvalue(), "application/zip")),
+        ]
+
+        response = await async_client.post("/bid/upload/batch", files=files)
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert [f["filename"] for f in data["files"]] == [
+            "first.xlsx",
+            "quarter.zip/q1/a.csv",
+            "quarter.zip/q1/b.xlsx",
+            "quarter.zip/q1/readme.txt",
+        ]
+        assert [f["row_count"] for f in data["files"]] == [2, 1, 1, 0]
+        assert [f["merged_count"] for f in data["files"]] == [1, 1, 1, 0]
+        assert data["files"][3]["error"] is not None
+        assert data["total"]["inserted_count"] == 3
+
+        # 공고번호가 겹치면 뒤 파일(ZIP 내부 파일)의 행이 저장됨
+        get_response = await async_client.get(f"/bid/announcement/{shared}")
+        assert get_response.json()["data"]["announcement_name"] == "ZIP 공고명"
+
+    @pytest.mark.asyncio
+    async def test_upload_files_invalid(self, async_client):
+        """지원하지 않는 파일이 섞이면 400 테스트"""
+        files = [("files", ("test.txt", b"This is not an excel file", "text/plain"))]
+
+        response = await async_client.post("/bid/upload/batch", files=files)
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_upload_zip_corrupt_member(self, async_client, unique_value):
+        """압축을 풀 수 없는 ZIP 내부 파일은 파일별 오류로 기록하고 나머지는 저장"""
+        good, broken = unique_value("TEST"), unique_value("TEST")
+        broken_csv = pd.DataFrame([self._row(broken, "손상")]).to_csv(index=False)
+
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("good.xlsx", self._to_xlsx([self._row(good, "정상")]))
+            zf.writestr("broken.csv", broken_csv, compress_type=zipfile.ZIP_STORED)
+        # 저장된 내용 한 글자를 바꿔 CRC 불일치로 만듦
+        contents = archive.getvalue().replace(
+            broken.encode(), broken.encode()[:-1] + b"X", 1
+        )
+        files = [("files", ("data.zip", contents, "application/zip"))]
+
+        response = await async_client.post("/bid/upload/batch", files=files)
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert [f["filename"] for f in data["files"]] == [
+            "data.zip/broken.csv",
+            "data.zip/good.xlsx",
+        ]
+        assert "압축 해제 실패" in data["files"][0]["error"]
+        assert data["files"][1]["error"] is None
+        assert data["total"]["inserted_count"] == 1
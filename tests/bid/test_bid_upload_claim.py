@@ -0,0 +1,62 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.collections.bid_upload_collection import BidUploadCollection
+from app.core.settings import settings
+from app.responses.bid_response import BidUploadData
+from app.services.bid_service import BidService
+
+
+class TestBidUploadClaim:
+    """업로드 처리 기록 (처리 권한, 갱신 시각 연장) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stale_claim_taken_over(self, unique_value):
+        """만료된 처리 권한을 다른 처리자가 가져가면 이전 처리자는 완료 기록 불가"""
+        digest = unique_value("digest")
+        assert await BidUploadCollection.claim(
+            digest, datetime.now(timezone.utc), "first"
+        )
+
+        # 만료 전에는 가져갈 수 없음
+        stale_before = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert not await BidUploadCollection.claim(digest, stale_before, "second")
+
+        stale_before = datetime.now(timezone.utc) + timedelta(seconds=1)
+        assert await BidUploadCollection.claim(digest, stale_before, "second")
+
+        assert not await BidUploadCollection.touch(digest, "first")
+        await BidUploadCollection.mark_done(digest, "first", {"inserted_count": 1})
+        record = await BidUploadCollection.find_by_digest(digest)
+        assert record.status == "processing"
+        assert record.owner == "second"
+
+        await BidUploadCollection.mark_failed(digest, "second", "오류")
+        record = await BidUploadCollection.find_by_digest(digest)
+        assert record.status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_while_processing(self, unique_value, monkeypatch):
+        """처리하는 동안 처리 기록 갱신 시각을 연장"""
+        monkeypatch.setattr(settings, "UPLOAD_PROCESSING_TIMEOUT_SECONDS", 0.03)
+        digest = unique_value("digest")
+        updated = []
+
+        async def store_table(contents, mode):
+            for _ in range(3):
+                await asyncio.sleep(0.03)
+                updated.append(
+                    (await BidUploadCollection.find_by_digest(digest)).updated_at
+                )
+            return BidUploadData(
+                inserted_count=0, updated_count=0, updated_list=[], unchanged_count=0
+            )
+
+        monkeypatch.setattr(BidService, "_store_table", store_table)
+        await BidService._upload_once(digest, b"", "upsert")
+
+        assert updated[-1] > updated[0]
+        record = await BidUploadCollection.find_by_digest(digest)
+        assert record.status == "done"
@@ -0,0 +1,112 @@
+import pytest
+import pandas as pd
+from io import BytesIO
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+)
+
+from app.services.bid_upload_session_service import BidUploadSessionService
+
+
+class TestBidUploadSession:
+    """재개 가능한 분할 업로드 API 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def staging_dir(self, tmp_path, monkeypatch):
+        """스테이징 경로를 임시 디렉터리로 변경"""
+        monkeypatch.setattr(BidUploadSessionService, "root", tmp_path)
+        return tmp_path
+
+    def _excel_bytes(self, announcement_number: str) -> bytes:
+        df = pd.DataFrame(
+            [
+                {
+                    "번호": 1,
+                    "타입": "공사",
+                    "참가마감": 5,
+                    "투찰마감": "25-01-20 10:00",
+                    "입찰일": "25-01-21 14:00",
+                    "발주기관": "테스트기관",
+                    "공고명": "분할 업로드 공고명",
+                    "공고번호": announcement_number,
+                    "업종": "건설업",
+                    "지역": "서울",
+                    "추정가격": 100000000,
+                    "기초금액": 95000000,
+                    "1순위업체": "테스트건설",
+                    "낙찰금액": 94000000,
+                    "예정가격": 96000000,
+                    "예정사정": 0.98,
+                    "기초/낙찰": 0.989,
+                    "예정/낙찰": 0.979,
+                    "추정/낙찰": 0.94,
+                }
+            ]
+        )
+        buffer = BytesIO()
+        df.to_excel(buffer, index=False, engine="openpyxl")
+        return buffer.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_resumable_upload(self, async_client, unique_value):
+        """청크 전송, offset 재확인, 완료 후 저장 테스트"""
+        unique_num = unique_value("TEST")
+        contents = self._excel_bytes(unique_num)
+        half = len(contents) // 2
+
+        response = await async_client.post(
+            "/bid/upload/sessions", json={"filename": "big.xlsx", "size": len(contents)}
+        )
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["status_code"] == HTTP_201_CREATED
+        upload_id = response.json()["data"]["upload_id"]
+
+        response = await async_client.put(
+            f"/bid/upload/sessions/{upload_id}",
+            params={"offset": 0},
+            content=contents[:half],
+        )
+        assert response.json()["data"]["offset"] == half
+
+        # 끝나기 전에는 완료 불가
+        response = await async_client.post(f"/bid/upload/sessions/{upload_id}/complete")
+        assert response.status_code == HTTP_409_CONFLICT
+
+        # 이미 받은 위치부터 다시 보내면 409와 받은 크기 안내
+        response = await async_client.put(
+            f"/bid/upload/sessions/{upload_id}",
+            params={"offset": 0},
+            content=contents,
+        )
+        assert response.status_code == HTTP_409_CONFLICT
+        assert response.headers["Upload-Offset"] == str(half)
+
+        # 재개: 받은 offset 확인 후 나머지 전송
+        response = await async_client.get(f"/bid/upload/sessions/{upload_id}")
+        offset = response.json()["data"]["offset"]
+        response = await async_client.put(
+            f"/bid/upload/sessions/{upload_id}",
+            params={"offset": offset},
+            content=contents[offset:],
+        )
+        assert response.json()["data"]["offset"] == len(contents)
+
+        response = await async_client.post(f"/bid/upload/sessions/{upload_id}/complete")
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["data"]["inserted_count"] == 1
+
+        # 완료된 세션은 삭제
+        response = await async_client.get(f"/bid/upload/sessions/{upload_id}")
+        assert response.status_code == HTTP_404_NOT_FOUND
+        get_response = await async_client.get(f"/bid/announcement/{unique_num}")
+        assert get_response.json()["data"]["announcement_name"] == "분할 업로드 공고명"
+
+    @pytest.mark.asyncio
+    async def test_upload_session_not_found(self, async_client):
+        """없는 세션 / 잘못된 ID 404 테스트"""
+        for upload_id in ("0" * 32, "..%2F..%2Fetc"):
+            response = await async_client.get(f"/bid/upload/sessions/{upload_id}")
+            assert response.status_code == HTTP_404_NOT_FOUND
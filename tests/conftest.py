@@ -1,13 +1,13 @@
 import pytest
 import pytest_asyncio
 import asyncio
+import itertools
+import time
 from fastapi.testclient import TestClient
 import httpx
 from httpx import AsyncClient
-from motor.motor_asyncio import AsyncIOMotorClient
 
 from app.main import app
-from app.core.settings import settings
 
 
 # Event loop fixture - 각 테스트마다 새로운 이벤트 루프 생성
@@ -26,18 +26,37 @@ async def reset_mongodb_client():
     """Reset MongoDB client for each test to avoid event loop issues"""
     from app.db import mongo_db
     from app.collections import bid_collection
+    from app.collections import bid_stats_collection
+    from app.collections import bid_upload_collection
+    from app.collections import admission_lease_collection
+    from app.collections import slow_query_collection
+    from app.collections import profile_collection
 
-    # 새 클라이언트 생성
-    mongo_db.client = AsyncIOMotorClient(settings.MONGO_DB_URL)  # type: ignore
-    mongo_db.db = mongo_db.client["base"]
+    # 새 클라이언트 생성 (운영과 같은 설정 / 리스너)
+    mongo_db.MongoDB.connect()
+    test_db = mongo_db.MongoDB.get_database()
 
-    # Collection 재설정
-    bid_collection.BidCollection._collection = mongo_db.db["bids"]
+    # Collection 재설정 (테스트용 컬렉션)
+    bid_collection.BidCollection._collection = test_db["bids"]
+    bid_stats_collection.BidStatsCollection._collection = test_db["bids_stats"]
+    bid_upload_collection.BidUploadCollection._collection = test_db["bids_upload"]
+    admission_lease_collection.AdmissionLeaseCollection._collection = test_db[
+        "admission_lease"
+    ]
+    slow_query_collection.SlowQueryCollection._collection = test_db["slow_query"]
+    profile_collection.ProfileCollection._collection = test_db["profile"]
+
+    # 테스트 클라이언트는 lifespan을 실행하지 않으므로 인덱스를 직접 생성
+    await bid_collection.BidCollection.create_indexes()
+    await bid_stats_collection.BidStatsCollection.create_indexes()
+    await bid_upload_collection.BidUploadCollection.create_indexes()
+    await admission_lease_collection.AdmissionLeaseCollection.create_indexes()
+    await profile_collection.ProfileCollection.create_indexes()
 
     yield
 
     # 테스트 후 정리
-    mongo_db.client.close()
+    mongo_db.MongoDB.close()
 
 
 # 동기식 테스트 클라이언트
@@ -54,3 +73,51 @@ async def async_client():
     transport = httpx.ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+_unique_counter = itertools.count()
+
+
+def _generate_unique_value(prefix: str) -> str:
+    """고유한 테스트 값 생성 (같은 마이크로초 안에서도 겹치지 않도록 순번 포함)"""
+    return f"{prefix}-{int(time.time() * 1000000)}-{next(_unique_counter)}"
+
+
+@pytest.fixture
+def unique_value():
+    """고유한 테스트 값 생성 함수 fixture"""
+    return _generate_unique_value
+
+
+@pytest.fixture
+def bid_payload():
+    """입찰 생성 요청 데이터 factory fixture
+
+    호출할 때마다 고유한 공고번호를 가진 데이터를 만들고, 키워드 인자로 필드를 덮어쓴다.
+    """
+
+    def make(**overrides):
+        return {
+            "number": 1.0,
+            "type": "공사",
+            "participation_deadline": 5,
+            "bid_deadline": "2025-01-20T10:00:00",
+            "bid_date": "2025-01-21T14:00:00",
+            "ordering_agency": "경인테스트청",
+            "announcement_name": "테스트 공사 입찰",
+            "announcement_number": _generate_unique_value("TEST"),
+            "industry": "건설업",
+            "region": "서울",
+            "estimated_price": 100000000,
+            "base_amount": 95000000,
+            "first_place_company": "테스트건설",
+            "winning_bid_amount": 94000000,
+            "expected_price": 96000000,
+            "expected_adjustment": 0.98,
+            "base_to_winning_ratio": 0.989,
+            "expected_to_winning_ratio": 0.979,
+            "estimated_to_winning_ratio": 0.94,
+            **overrides,
+        }
+
+    return make
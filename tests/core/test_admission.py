@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.status import (
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from app.collections.admission_lease_collection import AdmissionLeaseCollection
+from app.core.admission import AdmissionLimiter, upload_admission
+
+
+def make_limiter(name, **overrides):
+    options = {
+        "local_limit": 1,
+        "global_limit": 0,
+        "max_wait_seconds": 0.3,
+        "max_queue": 4,
+        **overrides,
+    }
+    return AdmissionLimiter(name, **options)
+
+
+class TestAdmission:
+    @pytest.mark.asyncio
+    async def test_wait_then_admit(self, unique_value):
+        """자리가 나면 기다리던 요청 실행"""
+        limiter = make_limiter(unique_value("pool"), max_wait_seconds=2)
+        order = []
+
+        async def job(name, hold):
+            async with limiter.slot():
+                order.append(name)
+                await asyncio.sleep(hold)
+
+        await asyncio.gather(job("first", 0.1), job("second", 0))
+
+        assert order == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_reject_after_wait(self, unique_value):
+        """기다려도 자리가 나지 않으면 503 + Retry-After"""
+        limiter = make_limiter(unique_value("pool"))
+
+        async with limiter.slot():
+            with pytest.raises(HTTPException) as exc_info:
+                async with limiter.slot():
+                    pass
+
+        assert exc_info.value.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+        # 반납 후에는 다시 실행 가능
+        async with limiter.slot():
+            pass
+
+    @pytest.mark.asyncio
+    async def test_reject_when_queue_full(self, unique_value):
+        """대기열이 가득 차면 기다리지 않고 429"""
+        limiter = make_limiter(unique_value("pool"), max_queue=1, max_wait_seconds=2)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(HTTPException) as exc_info:
+            async with limiter.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+        assert exc_info.value.status_code == HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in exc_info.value.headers
+
+    @pytest.mark.asyncio
+    async def test_global_limit_across_workers(self, unique_value):
+        """워커 사이 전체 제한 (같은 풀 이름의 다른 워커)"""
+        name = unique_value("pool")
+        worker_a = make_limiter(name, global_limit=1)
+        worker_b = make_limiter(name, global_limit=1)
+
+        async with worker_a.slot():
+            with pytest.raises(HTTPException) as exc_info:
+                async with worker_b.slot():
+                    pass
+        assert exc_info.value.status_code == HTTP_503_SERVICE_UNAVAILABLE
+
+        # 반납한 슬롯은 다른 워커가 사용
+        async with worker_b.slot():
+            pass
+
+    @pytest.mark.asyncio
+    async def test_release_failure_keeps_local_slot(self, unique_value, monkeypatch):
+        """전체 슬롯 반납에 실패해도 워커 자리는 반납"""
+        limiter = make_limiter(unique_value("pool"), global_limit=2)
+
+        async def failing_release(lease_id, holder):
+            raise ConnectionError("반납 실패")
+
+        monkeypatch.setattr(AdmissionLeaseCollection, "release", failing_release)
+        async with limiter.slot():
+            pass
+        monkeypatch.undo()
+
+        # 반납하지 못한 전체 슬롯은 임대 기간이 지날 때까지 남고, 워커 자리는 다시 사용 가능
+        async with limiter.slot():
+            assert limiter.running == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_busy(self, async_client, monkeypatch):
+        """업로드 자리가 없으면 업로드 API는 503 + Retry-After"""
+        monkeypatch.setattr(upload_admission, "max_wait_seconds", 0.1)
+
+        async with upload_admission.slot():
+            response = await async_client.post(
+                "/bid/upload",
+                files={"file": ("test.xlsx", b"not excel", "application/vnd.ms-excel")},
+            )
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "1"
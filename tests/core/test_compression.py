@@ -0,0 +1,116 @@
+import zlib
+
+import pytest
+from starlette.status import HTTP_200_OK
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.settings import settings
+
+
+async def run_streaming(middleware_app, accept_encoding: str) -> list[dict]:
+    """미들웨어를 거친 응답 메시지 수집"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    await middleware_app(scope, receive, send)
+    return messages
+
+
+async def ndjson_stream(scope, receive, send):
+    """조각 세 개를 보내는 NDJSON 스트리밍 앱"""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/x-ndjson")],
+        }
+    )
+    for index in range(3):
+        await send(
+            {
+                "type": "http.response.body",
+                "body": f'{{"line": {index}}}\n'.encode(),
+                "more_body": True,
+            }
+        )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class TestCompression:
+    def test_negotiate_encoding(self):
+        """q 값이 큰 방식 선택, 같으면 서버 우선순위"""
+        assert negotiate_encoding("gzip, deflate, br, zstd") == "zstd"
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+        assert negotiate_encoding("br;q=0, gzip") == "gzip"
+        assert negotiate_encoding("*") == "zstd"
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+    async def test_large_response_compressed(self, async_client, encoding):
+        """큰 JSON 응답은 요청한 방식으로 압축"""
+        plain = await async_client.get(
+            "/openapi.json", headers={"Accept-Encoding": "identity"}
+        )
+        response = await async_client.get(
+            "/openapi.json", headers={"Accept-Encoding": encoding}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert "content-encoding" not in plain.headers
+        assert response.headers["content-encoding"] == encoding
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert "content-length" not in response.headers
+        assert response.json() == plain.json()
+
+    @pytest.mark.asyncio
+    async def test_small_response_not_compressed(self, async_client):
+        """COMPRESSION_MIN_SIZE보다 작은 응답은 그대로 보냄"""
+        response = await async_client.get(
+            "/health", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert "content-encoding" not in response.headers
+        assert "accept-encoding" in response.headers["vary"].lower()
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, async_client, monkeypatch):
+        """COMPRESSION_ENCODINGS가 비어 있으면 압축하지 않음"""
+        monkeypatch.setattr(settings, "COMPRESSION_ENCODINGS", "")
+        response = await async_client.get(
+            "/openapi.json", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_streaming_flushes_each_chunk(self):
+        """스트리밍 응답은 본문을 모으지 않고 조각마다 압축해 보냄"""
+        messages = await run_streaming(CompressionMiddleware(ndjson_stream), "gzip")
+
+        start, *bodies = messages
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert len(bodies) == 4
+
+        # 앞 조각만으로 해당 줄까지 풀 수 있어야 함 (sync flush)
+        decompressor = zlib.decompressobj(31)
+        assert decompressor.decompress(bodies[0]["body"]) == b'{"line": 0}\n'
+        assert decompressor.decompress(bodies[1]["body"]) == b'{"line": 1}\n'
+        rest = b"".join(body["body"] for body in bodies[2:])
+        assert decompressor.decompress(rest) == b'{"line": 2}\n'
+        assert decompressor.eof
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopMonitor
+from app.core.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+
+def block_loop(seconds: float):
+    """이벤트 루프를 멈추는 동기 작업"""
+    time.sleep(seconds)
+
+
+class TestLoopMonitor:
+    @pytest.mark.asyncio
+    async def test_lag_and_block_detection(self, caplog):
+        """루프를 멈춘 코드의 스택 로그와 지연 지표 기록"""
+        monitor = LoopMonitor(interval_seconds=0.01, block_threshold_seconds=0.05)
+        lag_before = EVENT_LOOP_LAG._sum.get()
+        blocks_before = EVENT_LOOP_BLOCKS._value.get()
+
+        monitor.start()
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+            block_loop(0.3)
+            await asyncio.sleep(0.2)
+        await monitor.stop()
+
+        assert EVENT_LOOP_LAG._sum.get() - lag_before >= 0.2
+        assert EVENT_LOOP_BLOCKS._value.get() == blocks_before + 1
+        assert "block_loop" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_no_block_log_when_idle(self, caplog):
+        """루프가 멈추지 않으면 로그 없음"""
+        monitor = LoopMonitor(interval_seconds=0.01, block_threshold_seconds=0.05)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+            monitor.start()
+            await asyncio.sleep(0.2)
+            await monitor.stop()
+
+        assert "멈춤" not in caplog.text
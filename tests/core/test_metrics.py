@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+import pytest
+from pymongo.monitoring import (
+    CommandSucceededEvent,
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+)
+from starlette.status import HTTP_200_OK
+
+from app.core.metrics import (
+    MONGO_COMMAND_DURATION,
+    MongoCommandMetrics,
+    MongoPoolMetrics,
+    instrument_collection,
+)
+
+
+def sample(text: str, name: str, **labels) -> float:
+    """Prometheus 텍스트에서 샘플 값 찾기 (없으면 0)"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    prefix = f"{name}{{{label_text}}} " if labels else f"{name} "
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    return 0.0
+
+
+class TestMetrics:
+    @pytest.mark.asyncio
+    async def test_http_metrics(self, async_client):
+        """라우트 템플릿별 요청 지표"""
+        before = (await async_client.get("/metrics")).text
+        await async_client.get("/health")
+        await async_client.get("/bid/id/000000000000000000000000")
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+
+        health = {"method": "GET", "route": "/health", "status": "200"}
+        assert (
+            sample(text, "http_request_duration_seconds_count", **health)
+            == sample(before, "http_request_duration_seconds_count", **health) + 1
+        )
+
+        # 실제 경로가 아닌 라우트 템플릿으로 집계
+        assert 'route="/bid/id/{bid_id}"' in text
+        assert "/bid/id/000000000000000000000000" not in text
+        assert "http_requests_in_progress" in text
+        assert "http_response_size_bytes_bucket" in text
+
+    @pytest.mark.asyncio
+    async def test_mongo_command_operation_label(self):
+        """컬렉션 메서드 이름을 MongoDB 명령 지표 라벨로 사용"""
+        listener = MongoCommandMetrics()
+
+        @instrument_collection
+        class SampleCollection:
+            @classmethod
+            async def find_sample(cls):
+                listener.succeeded(
+                    CommandSucceededEvent(
+                        duration=timedelta(milliseconds=2),
+                        reply={"ok": 1},
+                        command_name="find",
+                        request_id=1,
+                        connection_id=("localhost", 27017),
+                        operation_id=1,
+                    )
+                )
+
+        histogram = MONGO_COMMAND_DURATION.labels(
+            "find", "SampleCollection.find_sample"
+        )
+        before = histogram._sum.get()
+        await SampleCollection.find_sample()
+
+        assert histogram._sum.get() == pytest.approx(before + 0.002)
+
+    def test_mongo_pool_checked_out(self, monkeypatch):
+        """서버 풀별 사용 중인 커넥션 개수 집계"""
+        monkeypatch.setattr(MongoPoolMetrics, "checked_out", {})
+        listener = MongoPoolMetrics()
+        primary, secondary = ("db1", 27017), ("db2", 27017)
+
+        listener.pool_created(PoolCreatedEvent(primary, {}))
+        listener.pool_created(PoolCreatedEvent(secondary, {}))
+        for connection_id in range(3):
+            listener.connection_checked_out(
+                ConnectionCheckedOutEvent(primary, connection_id, 0.001)
+            )
+        listener.connection_checked_out(ConnectionCheckedOutEvent(secondary, 0, 0.001))
+        listener.connection_checked_in(ConnectionCheckedInEvent(primary, 0))
+        assert MongoPoolMetrics.max_checked_out() == 2
+
+        listener.pool_closed(PoolClosedEvent(primary))
+        assert MongoPoolMetrics.max_checked_out() == 1
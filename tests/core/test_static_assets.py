@@ -0,0 +1,109 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from starlette.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
+
+from app.core import static_assets
+from app.core.static_assets import IMMUTABLE_CACHE_CONTROL, StaticAssets
+
+
+class TestStaticAssets:
+    @pytest.mark.asyncio
+    async def test_index_etag(self, async_client):
+        """index.html은 미리 압축한 본문과 ETag, 같은 ETag로 다시 요청하면 304"""
+        response = await async_client.get("/", headers={"Accept-Encoding": "br"})
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["cache-control"] == "no-cache"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert re.search(r'src="/static/app\.[0-9a-f]{12}\.js"', response.text)
+
+        etag = response.headers["etag"]
+        cached = await async_client.get(
+            "/", headers={"Accept-Encoding": "br", "If-None-Match": etag}
+        )
+        assert cached.status_code == HTTP_304_NOT_MODIFIED
+        assert cached.content == b""
+
+        # 압축 방식이 다르면 다른 ETag
+        other = await async_client.get(
+            "/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        assert other.status_code == HTTP_200_OK
+        assert other.headers["content-encoding"] == "gzip"
+
+    @pytest.mark.asyncio
+    async def test_hashed_asset_immutable(self, async_client):
+        """해시 파일명은 immutable 캐시, 원본 이름은 404"""
+        index = await async_client.get("/")
+        script = re.search(r'src="(/static/app\.[0-9a-f]{12}\.js)"', index.text)[1]
+
+        response = await async_client.get(script, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.content == (static_assets.STATIC_DIR / "app.js").read_bytes()
+
+        missing = await async_client.get("/static/app.js")
+        assert missing.status_code == HTTP_404_NOT_FOUND
+
+    def test_rebuild_on_source_change(self, tmp_path, monkeypatch):
+        """원본이 바뀌면 새 해시 파일명으로 다시 빌드"""
+        source = tmp_path / "static"
+        source.mkdir()
+        (source / "index.html").write_text(
+            '<link href="/static/style.css"><script src="/static/app.js"></script>'
+        )
+        (source / "style.css").write_text("body { color: black; }")
+        (source / "app.js").write_text("console.log(1);")
+        monkeypatch.setattr(static_assets, "STATIC_DIR", source)
+        monkeypatch.setattr(static_assets, "DIST_DIR", source / "dist")
+        monkeypatch.setattr(StaticAssets, "_manifest", None)
+
+        first = StaticAssets.load()
+        index = (source / "dist" / "index.html").read_text()
+        names = sorted(name for name in first["files"] if name != "index.html")
+        assert [re.sub(r"\.[0-9a-f]{12}\.", ".", name) for name in names] == [
+            "app.js",
+            "style.css",
+        ]
+        assert all(f"/static/{name}" in index for name in names)
+
+        (source / "app.js").write_text("console.log(2);")
+        monkeypatch.setattr(StaticAssets, "_manifest", None)
+        second = StaticAssets.load()
+
+        assert second["source"] != first["source"]
+        # 바뀐 파일만 해시 파일명이 바뀜
+        changed = set(second["files"]) ^ set(first["files"])
+        assert {name.split(".")[0] for name in changed} == {"app"}
+
+    def test_concurrent_load_builds_once(self, tmp_path, monkeypatch):
+        """여러 워커가 동시에 처음 요청해도 한 번만 빌드"""
+        source = tmp_path / "static"
+        source.mkdir()
+        (source / "index.html").write_text('<script src="/static/app.js"></script>')
+        (source / "app.js").write_text("console.log(1);")
+        monkeypatch.setattr(static_assets, "STATIC_DIR", source)
+        monkeypatch.setattr(static_assets, "DIST_DIR", source / "dist")
+
+        builds = []
+        build = StaticAssets.build
+
+        def counting_build():
+            builds.append(1)
+            return build()
+
+        monkeypatch.setattr(StaticAssets, "build", counting_build)
+
+        # 워커마다 manifest 캐시가 비어 있는 상태에서 동시에 로드
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(StaticAssets._read_or_build) for _ in range(8)]
+            manifests = [future.result() for future in futures]
+
+        assert len(builds) == 1
+        assert all(manifest == manifests[0] for manifest in manifests)
+        assert (source / "dist" / "manifest.json").exists()
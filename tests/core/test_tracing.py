@@ -0,0 +1,93 @@
+import json
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from starlette.status import HTTP_200_OK
+
+from app.core.settings import settings
+from app.core.tracing import TraceExporter, finished_spans
+
+UPLOAD_COLUMNS = {
+    "번호": 1,
+    "타입": "공사",
+    "참가마감": 5,
+    "투찰마감": "25-01-20 10:00",
+    "입찰일": "25-01-21 14:00",
+    "발주기관": "테스트기관",
+    "공고명": "추적 공고명",
+    "업종": "건설업",
+    "지역": "서울",
+    "추정가격": 100000000,
+    "기초금액": 95000000,
+    "1순위업체": "테스트건설",
+    "낙찰금액": 94000000,
+    "예정가격": 96000000,
+    "예정사정": 0.98,
+    "기초/낙찰": 0.989,
+    "예정/낙찰": 0.979,
+    "추정/낙찰": 0.94,
+}
+
+
+class TestTracing:
+    @pytest.mark.asyncio
+    async def test_trace_id_headers(self, async_client):
+        """span을 내보내지 않아도 응답에 trace id 전파"""
+        response = await async_client.get("/health")
+
+        trace_id = response.headers["X-Trace-Id"]
+        assert len(trace_id) == 32
+        assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+
+    @pytest.mark.asyncio
+    async def test_continue_incoming_trace(self, async_client):
+        """요청 traceparent의 trace를 이어감"""
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+        response = await async_client.get(
+            "/health", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+        )
+
+        assert response.headers["X-Trace-Id"] == trace_id
+
+    @pytest.mark.asyncio
+    async def test_upload_spans_exported_to_json(
+        self, async_client, monkeypatch, tmp_path, unique_value
+    ):
+        """업로드 요청의 라우터 → 서비스 → 컬렉션 span을 JSON Lines로 내보내기"""
+        path = tmp_path / "spans.jsonl"
+        monkeypatch.setattr(settings, "TRACE_EXPORTER", "json")
+        monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 1.0)
+        monkeypatch.setattr(settings, "TRACE_JSON_PATH", str(path))
+        finished_spans.clear()
+
+        df = pd.DataFrame(
+            [
+                {**UPLOAD_COLUMNS, "공고번호": unique_value("TEST")},
+                {**UPLOAD_COLUMNS, "공고번호": unique_value("TEST")},
+            ]
+        )
+        files = {
+            "file": ("bids.csv", BytesIO(df.to_csv(index=False).encode()), "text/csv")
+        }
+
+        response = await async_client.post("/bid/upload", files=files)
+        assert response.status_code == HTTP_200_OK
+        trace_id = response.headers["X-Trace-Id"]
+
+        assert await TraceExporter.flush() > 0
+        spans = [json.loads(line) for line in path.read_text().splitlines()]
+        spans = {item["name"]: item for item in spans if item["trace_id"] == trace_id}
+
+        root = spans["POST /bid/upload"]
+        assert root["parent_id"] is None
+        assert root["attributes"]["http.status_code"] == HTTP_200_OK
+
+        # 파싱은 파싱 워커 프로세스에서 실행되므로 요청 쪽 span 하나로 기록
+        parse = spans["BidService.parse_file"]
+        assert parse["attributes"]["documents"] == 2
+
+        write = spans["BidService.write_chunk"]
+        assert write["attributes"]["batch_size"] == 2
+        assert spans["BidCollection.bulk_insert_bids"]["parent_id"] == write["span_id"]
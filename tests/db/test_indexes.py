@@ -0,0 +1,42 @@
+import pytest
+import pytest_asyncio
+
+from app.collections.bid_collection import BidCollection
+from app.db.mongo_db import MongoDB
+
+
+@pytest_asyncio.fixture
+async def legacy_collection(unique_value):
+    """이전 버전처럼 non-unique 공고번호 인덱스만 있는 컬렉션"""
+    collection = MongoDB.get_database()[unique_value("bids_legacy")]
+    await collection.create_index("announcement_number")
+    yield collection
+    await collection.drop()
+
+
+class TestBidIndexes:
+    @pytest.mark.asyncio
+    async def test_replace_with_unique_index(self, legacy_collection):
+        """중복이 없으면 non-unique 인덱스를 unique 인덱스로 교체"""
+        await legacy_collection.insert_many(
+            [{"announcement_number": "A"}, {"announcement_number": "B"}]
+        )
+
+        await BidCollection._replace_with_unique_index(legacy_collection)
+
+        indexes = await legacy_collection.index_information()
+        assert indexes["announcement_number_1"].get("unique") is True
+
+    @pytest.mark.asyncio
+    async def test_replace_with_duplicates_keeps_index(self, legacy_collection):
+        """중복 공고번호가 있으면 기존 인덱스를 지우지 않고 중단"""
+        await legacy_collection.insert_many(
+            [{"announcement_number": "A"}, {"announcement_number": "A"}]
+        )
+
+        with pytest.raises(RuntimeError, match="A"):
+            await BidCollection._replace_with_unique_index(legacy_collection)
+
+        indexes = await legacy_collection.index_information()
+        assert "announcement_number_1" in indexes
+        assert not indexes["announcement_number_1"].get("unique")
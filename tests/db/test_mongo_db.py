@@ -0,0 +1,53 @@
+import pytest
+from pymongo.read_preferences import Primary
+
+from app.core.settings import settings
+from app.db.mongo_db import DATABASE_NAME, MongoCollection, MongoDB, analytics_reads
+
+
+class SampleCollection:
+    _collection = MongoCollection("sample")
+
+
+class TestMongoDB:
+    @pytest.mark.asyncio
+    async def test_collection_follows_client(self):
+        """컬렉션 descriptor는 현재 클라이언트의 컬렉션을 돌려줌"""
+        collection = SampleCollection._collection
+        assert collection.name == "sample"
+        assert collection.database.name == DATABASE_NAME
+        assert SampleCollection._collection is collection
+
+        MongoDB.close()
+        assert MongoDB.client is None
+
+        # 닫은 뒤 접근하면 새 클라이언트를 만듦
+        collection = SampleCollection._collection
+        assert MongoDB.client is not None
+        await collection.insert_one({"value": 1})
+        assert await collection.count_documents({}) == 1
+
+    @pytest.mark.asyncio
+    async def test_analytics_reads(self, monkeypatch):
+        """분석용 조회는 설정한 read preference / read concern / 최대 지연 시간 적용"""
+        monkeypatch.setattr(settings, "MONGO_ANALYTICS_READ_PREFERENCE", "secondary")
+        monkeypatch.setattr(settings, "MONGO_ANALYTICS_READ_CONCERN", "majority")
+        monkeypatch.setattr(settings, "MONGO_ANALYTICS_MAX_STALENESS_SECONDS", 120)
+
+        collection = analytics_reads(SampleCollection._collection)
+        assert collection.name == "sample"
+        assert collection.read_preference.mongos_mode == "secondary"
+        assert collection.read_preference.max_staleness == 120
+        assert collection.read_concern.level == "majority"
+
+        # 원래 컬렉션은 프라이머리 그대로
+        assert SampleCollection._collection.read_preference == Primary()
+
+    @pytest.mark.asyncio
+    async def test_analytics_reads_primary(self, monkeypatch):
+        """primary 설정이면 최대 지연 시간 없이 프라이머리에서 읽음"""
+        monkeypatch.setattr(settings, "MONGO_ANALYTICS_READ_PREFERENCE", "primary")
+        monkeypatch.setattr(settings, "MONGO_ANALYTICS_MAX_STALENESS_SECONDS", 120)
+
+        collection = analytics_reads(SampleCollection._collection)
+        assert collection.read_preference == Primary()
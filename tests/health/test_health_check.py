@@ -1,5 +1,11 @@
 import pytest
-from starlette.status import HTTP_200_OK
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from app.core.admission import aggregation_admission, upload_admission
+from app.core.health import HealthMonitor
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import MongoPoolMetrics
+from app.core.settings import settings
 
 
 class TestHealthCheck:
@@ -47,3 +53,93 @@ class TestHealthCheck:
     #     data = response.json()
     #     assert data["status_code"] == HTTP_200_OK
     #     assert data["data"]["status"] == "healthy"
+
+
+class TestHealthProbe:
+    @pytest.fixture(autouse=True)
+    def reset_state(self, monkeypatch):
+        """저장된 ping 결과 / 워커 상태 초기화"""
+        monkeypatch.setattr(HealthMonitor, "_ping_ms", None)
+        monkeypatch.setattr(HealthMonitor, "_ping_error", None)
+        monkeypatch.setattr(HealthMonitor, "_ping_at", None)
+        monkeypatch.setattr(MongoPoolMetrics, "checked_out", {})
+        monkeypatch.setattr(loop_monitor, "last_lag_seconds", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_live(self, async_client):
+        """liveness는 외부 의존성과 관계없이 성공"""
+        response = await async_client.get("/health/live")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["data"]["status"] == "alive"
+
+    @pytest.mark.asyncio
+    async def test_ready(self, async_client):
+        """저장된 ping 결과가 정상이면 ready"""
+        await HealthMonitor.ping()
+
+        response = await async_client.get("/health/ready")
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()["data"]
+        assert data["ready"] is True
+        assert data["reasons"] == []
+        assert data["mongo"]["ping_ms"] is not None
+        assert data["mongo"]["pool_size"] == settings.MONGO_MAX_POOL_SIZE
+        assert data["jobs"]["upload"]["limit"] == upload_admission.local_limit
+
+    @pytest.mark.asyncio
+    async def test_not_ready_without_ping(self, async_client):
+        """ping 결과가 없거나 실패했으면 503"""
+        response = await async_client.get("/health/ready")
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["data"]["reasons"] == ["MongoDB ping 결과 없음"]
+
+    @pytest.mark.asyncio
+    async def test_not_ready_when_saturated(self, async_client, monkeypatch):
+        """풀 사용률 / 루프 지연 / 무거운 작업 대기가 기준을 넘으면 503"""
+        await HealthMonitor.ping()
+        monkeypatch.setattr(
+            MongoPoolMetrics,
+            "checked_out",
+            {("localhost", 27017): settings.MONGO_MAX_POOL_SIZE},
+        )
+        monkeypatch.setattr(loop_monitor, "last_lag_seconds", 1.0)
+        monkeypatch.setattr(upload_admission, "_running", upload_admission.local_limit)
+        monkeypatch.setattr(upload_admission, "_waiting", 2)
+
+        response = await async_client.get("/health/ready")
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        body = response.json()
+        assert body["status_code"] == HTTP_503_SERVICE_UNAVAILABLE
+        data = body["data"]
+        assert data["ready"] is False
+        assert data["mongo"]["pool_utilization"] == 1.0
+        assert data["jobs"]["upload"] == {
+            "running": upload_admission.local_limit,
+            "waiting": 2,
+            "limit": upload_admission.local_limit,
+        }
+        assert len(data["reasons"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_not_ready_when_upload_busy(self, async_client, monkeypatch):
+        """업로드 자리가 모두 차면 대기 요청이 없어도 503, 집계 풀은 대기 요청이 있어야 503"""
+        await HealthMonitor.ping()
+        monkeypatch.setattr(
+            aggregation_admission, "_running", aggregation_admission.local_limit
+        )
+
+        response = await async_client.get("/health/ready")
+        assert response.status_code == HTTP_200_OK
+
+        monkeypatch.setattr(upload_admission, "_running", upload_admission.local_limit)
+
+        response = await async_client.get("/health/ready")
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["data"]["reasons"] == [
+            f"upload 작업 자리 없음 ({upload_admission.local_limit}/"
+            f"{upload_admission.local_limit})"
+        ]
@@ -0,0 +1,167 @@
+import json
+import pytest
+from starlette.status import HTTP_200_OK
+
+from app.clients.openapi_archive import OpenAPIArchive
+from app.clients.openapi_client import OpenAPIClient
+from app.core.settings import settings
+
+
+class TestOpenAPIArchive:
+    """오픈API 아카이브 / 재생 모드 테스트"""
+
+    @pytest.fixture
+    def sample_params(self):
+        """테스트용 오픈API 요청 파라미터 fixture"""
+        return {
+            "serviceKey": settings.OPENAPI_API_KEY,
+            "pageNo": "1",
+            "numOfRows": "1",
+            "type": "json",
+            "bsnsDivCd": "3",
+            "opengBgnDt": "202501010000",
+            "opengEndDt": "202501052359",
+        }
+
+    @pytest.fixture
+    def sample_page(self):
+        """테스트용 오픈API 원본 응답 fixture"""
+        page = {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "정상"},
+                "body": {
+                    "items": [
+                        {
+                            "bidNtceNo": "R25BK00000001",
+                            "bidNtceOrd": "000",
+                            "bidNtceNm": "테스트 공사",
+                            "bsnsDivNm": "공사",
+                            "cntrctCnclsSttusNm": "낙찰",
+                            "cntrctCnclsMthdNm": "제한경쟁",
+                            "bidwinrDcsnMthdNm": "적격심사",
+                            "ntceInsttNm": "경인테스트청",
+                            "ntceInsttCd": "1234567",
+                            "dmndInsttNm": "경인테스트청",
+                            "dmndInsttCd": "1234567",
+                        }
+                    ],
+                    "numOfRows": 1,
+                    "pageNo": 1,
+                    "totalCount": 1,
+                },
+            }
+        }
+        return json.dumps(page, ensure_ascii=False).encode("utf-8")
+
+    @pytest.fixture
+    def replay_client(self, tmp_path, monkeypatch):
+        """임시 디렉토리 아카이브를 사용하는 재생 모드 fixture"""
+        archive = OpenAPIArchive(tmp_path)
+        monkeypatch.setattr(OpenAPIClient, "mode", "REPLAY")
+        monkeypatch.setattr(OpenAPIClient, "archive", archive)
+        return archive
+
+    def test_archive_roundtrip(self, tmp_path, sample_params, sample_page):
+        """저장한 원본 응답을 그대로 다시 읽는지 테스트"""
+        archive = OpenAPIArchive(tmp_path)
+
+        path = archive.save(sample_params, sample_page)
+
+        assert path.exists()
+        assert path.name.endswith(".json.zst")
+        assert archive.load(sample_params) == sample_page
+
+    def test_archive_key_ignores_service_key(self, tmp_path, sample_params):
+        """인증키가 달라도 같은 페이지로 취급하는지 테스트"""
+        archive = OpenAPIArchive(tmp_path)
+        other_params = {**sample_params, "serviceKey": "other-key"}
+
+        assert archive.make_key(sample_params) == archive.make_key(other_params)
+        assert archive.make_key(sample_params) != archive.make_key(
+            {**sample_params, "pageNo": "2"}
+        )
+
+    def test_archive_load_missing(self, tmp_path, sample_params):
+        """아카이브에 없는 페이지 조회 시 None 테스트"""
+        archive = OpenAPIArchive(tmp_path)
+
+        assert archive.load(sample_params) is None
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_reads_archive(
+        self, replay_client, sample_params, sample_page
+    ):
+        """재생 모드에서 네트워크 없이 아카이브를 읽는지 테스트"""
+        replay_client.save(sample_params, sample_page)
+
+        result = await OpenAPIClient.get_data(
+            pageNo="1",
+            numOfRows="1",
+            opengBgnDt="202501010000",
+            opengEndDt="202501052359",
+        )
+
+        assert result is not None
+        assert result.response.body.totalCount == 1
+        assert result.response.body.items[0].bidNtceNo == "R25BK00000001"
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_missing_page(self, replay_client):
+        """재생 모드에서 아카이브에 없는 페이지는 None 테스트"""
+        result = await OpenAPIClient.get_data(
+            pageNo="99",
+            numOfRows="1",
+            opengBgnDt="202501010000",
+            opengEndDt="202501052359",
+        )
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_corrupt_page(self, replay_client, sample_params):
+        """재생 모드에서 깨진 아카이브 파일은 None 테스트"""
+        path = replay_client.path_for(sample_params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"not zstd")
+
+        result = await OpenAPIClient.get_data(
+            pageNo="1",
+            numOfRows="1",
+            opengBgnDt="202501010000",
+            opengEndDt="202501052359",
+        )
+
+        assert result is None
+
+    def test_invalid_client_mode(self, monkeypatch):
+        """알 수 없는 클라이언트 모드는 설정 검증에서 실패하는지 테스트"""
+        from pydantic import ValidationError
+
+        from app.core.settings import Settings
+
+        monkeypatch.setenv("OPENAPI_CLIENT_MODE", "REPALY")
+
+        with pytest.raises(ValidationError):
+            Settings()
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_endpoint(
+        self, async_client, replay_client, sample_params, sample_page
+    ):
+        """재생 모드에서 오픈API 결과 엔드포인트 테스트"""
+        replay_client.save(sample_params, sample_page)
+
+        response = await async_client.get(
+            "/openapi/result",
+            params={
+                "pageNo": "1",
+                "numOfRows": "1",
+                "opengBgnDt": "202501010000",
+                "opengEndDt": "202501052359",
+            },
+        )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["detail"] == "오픈API 요청 성공"
+        assert data["data"]["response"]["body"]["totalCount"] == 1
@@ -0,0 +1,79 @@
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from app.readers.table_reader import TableReader
+
+
+class TestTableReader:
+    """업로드 표 파일 포맷 판별 / 읽기 테스트"""
+
+    @pytest.fixture
+    def table(self):
+        """테스트용 표 데이터"""
+        return pd.DataFrame(
+            [
+                {"공고번호": "TEST-001", "낙찰금액": 94000000, "기초/낙찰": 0.989},
+                {"공고번호": "TEST-002", "낙찰금액": None, "기초/낙찰": 0.95},
+            ]
+        )
+
+    def _to_xlsx(self, df: pd.DataFrame) -> bytes:
+        buffer = BytesIO()
+        df.to_excel(buffer, index=False, engine="openpyxl")
+        return buffer.getvalue()
+
+    def _to_zip(self, members: dict[str, bytes]) -> bytes:
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for name, data in members.items():
+                archive.writestr(name, data)
+        return buffer.getvalue()
+
+    def test_sniff_formats(self, table):
+        """파일 내용으로 포맷 판별 테스트"""
+        assert TableReader.sniff(self._to_xlsx(table)) == "xlsx"
+        assert (
+            TableReader.sniff(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 8) == "xls"
+        )
+        assert TableReader.sniff(self._to_zip({"xl/workbook.bin": b""})) == "xlsb"
+        assert (
+            TableReader.sniff(
+                self._to_zip(
+                    {"mimetype": b"application/vnd.oasis.opendocument.spreadsheet"}
+                )
+            )
+            == "ods"
+        )
+        assert TableReader.sniff(table.to_csv(index=False).encode("utf-8")) == "csv"
+        assert TableReader.sniff(table.to_csv(index=False).encode("cp949")) == "csv"
+
+    def test_sniff_unsupported(self):
+        """지원하지 않는 파일은 None 테스트"""
+        assert TableReader.sniff(b"This is not an excel file") is None
+        assert TableReader.sniff(self._to_zip({"readme.txt": b"hello"})) is None
+        assert TableReader.sniff(b"PK\x03\x04broken") is None
+
+    @pytest.mark.parametrize("engine", ["calamine", "openpyxl"])
+    def test_read_excel_as_strings(self, table, engine):
+        """엑셀 엔진별로 모든 셀을 문자열로 읽는지 테스트"""
+        df = TableReader.read_excel(self._to_xlsx(table), engine=engine)
+
+        assert df["공고번호"].tolist() == ["TEST-001", "TEST-002"]
+        assert df["낙찰금액"].iloc[0] == "94000000"
+        assert pd.isna(df["낙찰금액"].iloc[1])
+        assert df["기초/낙찰"].iloc[0] == "0.989"
+
+    def test_read_csv_cp949(self, table):
+        """cp949 CSV 읽기 테스트"""
+        df = TableReader.read(table.to_csv(index=False).encode("cp949"))
+
+        assert df["공고번호"].tolist() == ["TEST-001", "TEST-002"]
+        assert df["기초/낙찰"].iloc[1] == "0.95"
+
+    def test_read_unsupported(self):
+        """지원하지 않는 파일 읽기 시 ValueError 테스트"""
+        with pytest.raises(ValueError):
+            TableReader.read(b"This is not an excel file")
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from app.utils.bid_utils import BidUtils
+
+
+class TestBidUtils:
+    """입찰 데이터 파싱 유틸리티 테스트"""
+
+    def test_is_missing(self):
+        """pd.isna와 같은 빈 셀 판별"""
+        for value in (None, float("nan"), np.nan, pd.NA, pd.NaT):
+            assert BidUtils.is_missing(value) is True
+        for value in ("", "-", "0", 0, 0.0, "nan"):
+            assert BidUtils.is_missing(value) is False
+
+    def test_parse_with_missing_cell(self):
+        """DataFrame 빈 셀(NaN)은 None 또는 오류로 처리"""
+        df = pd.read_csv(StringIO("a,b\n,1\n"), dtype=str)
+        empty = df.iloc[0]["a"]
+
+        assert BidUtils.is_missing(empty)
+        assert BidUtils.parse_optional_float(empty) is None
+
+    def test_app_import_without_pandas(self):
+        """워커 시작(app.main import) 시 pandas / numpy를 불러오지 않음"""
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.main; "
+                "print(sorted({'pandas', 'numpy'} & set(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.strip() == "[]"
@@ -0,0 +1,37 @@
+import numpy as np
+
+from app.utils.series_utils import SeriesUtils
+
+
+class TestSeriesUtils:
+    """LTTB 다운샘플링 유틸리티 테스트"""
+
+    def test_lttb_point_budget(self):
+        """지정한 점 개수와 첫/마지막 점 유지 테스트"""
+        x = np.arange(10000, dtype=np.float64)
+        y = np.sin(x / 500)
+
+        indices = SeriesUtils.lttb(x, y, 100)
+
+        assert len(indices) == 100
+        assert indices[0] == 0
+        assert indices[-1] == 9999
+        assert np.all(np.diff(indices) > 0)
+
+    def test_lttb_keeps_spike(self):
+        """모양을 결정하는 극값(스파이크)을 유지하는지 테스트"""
+        x = np.arange(5000, dtype=np.float64)
+        y = np.zeros(5000)
+        y[2500] = 10.0
+
+        indices = SeriesUtils.lttb(x, y, 50)
+
+        assert 2500 in indices
+
+    def test_lttb_small_input(self):
+        """점 개수가 예산 이하이면 그대로 반환 테스트"""
+        x = np.arange(5, dtype=np.float64)
+        y = np.arange(5, dtype=np.float64)
+
+        assert SeriesUtils.lttb(x, y, 10).tolist() == [0, 1, 2, 3, 4]
+        assert SeriesUtils.lttb(x, y, 5).tolist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,40 @@
+from collections import Counter
+
+from app.utils.stats_utils import StatsUtils
+
+
+class TestStatsUtils:
+    """롤업 히스토그램 통계 유틸리티 테스트"""
+
+    def test_bucket_roundtrip(self):
+        """비율 값과 버킷 키 변환 테스트"""
+        assert StatsUtils.to_bucket(0.98912) == "989"
+        assert StatsUtils.from_bucket("989") == 0.989
+        assert StatsUtils.to_bucket(87.7456) == "87746"
+
+    def test_quantile(self):
+        """버킷 히스토그램 분위수 계산 테스트"""
+        histogram = Counter({StatsUtils.BUCKET_SCALE * i // 10: 1 for i in range(11)})
+
+        assert StatsUtils.quantile(histogram, 0.5) == 0.5
+        assert StatsUtils.quantile(histogram, 0.1) == 0.1
+        assert StatsUtils.quantile(histogram, 0.9) == 0.9
+
+    def test_quantile_interpolates(self):
+        """인접 순위 사이 선형 보간 테스트"""
+        histogram = Counter({950: 1, 970: 1, 990: 1})
+
+        assert StatsUtils.quantile(histogram, 0.9) == 0.986
+        assert StatsUtils.quantile(histogram, 0.1) == 0.954
+
+    def test_quantile_ignores_empty_buckets(self):
+        """삭제로 0이 된 버킷은 무시하는지 테스트"""
+        histogram = Counter({900: 0, 950: 2, 990: 1})
+
+        assert StatsUtils.quantile(histogram, 0.0) == 0.95
+        assert StatsUtils.quantile(histogram, 1.0) == 0.99
+
+    def test_quantile_empty(self):
+        """데이터가 없으면 None 테스트"""
+        assert StatsUtils.quantile(Counter(), 0.5) is None
+        assert StatsUtils.quantile(Counter({900: 0}), 0.5) is None